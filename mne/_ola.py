@@ -309,7 +309,7 @@ class _COLA:
         # Create our window boundaries
         window_name = window if isinstance(window, str) else "custom"
         self._window = get_window(
-            window, self._n_samples, fftbins=(self._n_samples - 1) % 2
+            window, self._n_samples, fftbins=bool((self._n_samples - 1) % 2)
         )
         self._window /= _check_cola(
             self._window, self._n_samples, self._step, window_name, tol=tol
@@ -14,6 +14,7 @@ __all__ = [
     "generate_2d_layout",
     "get_builtin_ch_adjacencies",
     "get_builtin_montages",
+    "interpolate_bads_per_epoch",
     "make_1020_channel_selections",
     "make_dig_montage",
     "make_eeg_layout",
@@ -44,6 +45,7 @@ from .channels import (
     find_ch_adjacency,
     fix_mag_coil_types,
     get_builtin_ch_adjacencies,
+    interpolate_bads_per_epoch,
     make_1020_channel_selections,
     read_ch_adjacency,
     read_vectorview_selection,
@@ -285,6 +285,59 @@ def unify_bad_channels(insts):
     return insts
 
 
+@verbose
+def interpolate_bads_per_epoch(epochs, bads, *, origin="auto", verbose=None):
+    """Interpolate EEG channels that are bad in some epochs only.
+
+    Unlike :meth:`mne.Epochs.interpolate_bads`, which interpolates the same
+    channels in all epochs, each epoch can have its own set of bad channels,
+    as produced for example by epoch-wise artifact detection.
+
+    Parameters
+    ----------
+    epochs : instance of Epochs
+        The epochs. Must be preloaded. They are modified in-place.
+    bads : list of list of str
+        For each epoch, the names of the EEG channels to interpolate (can be
+        empty). Channels in ``epochs.info['bads']`` are neither used nor
+        interpolated.
+    origin : array-like, shape (3,) | str
+        Origin of the sphere in the head coordinate frame and in meters.
+        Can be ``'auto'`` (default), which means a head-digitization-based
+        origin fit.
+    %(verbose)s
+
+    Returns
+    -------
+    epochs : instance of Epochs
+        The epochs with the bad channels interpolated.
+
+    See Also
+    --------
+    mne.Epochs.interpolate_bads
+
+    Notes
+    -----
+    Channels are interpolated with spherical splines (as with
+    ``method=dict(eeg="spline")`` in :meth:`mne.Epochs.interpolate_bads`).
+    Epochs with the same bad channels are interpolated together. The spline
+    system of all good EEG channels is inverted once and downdated for each
+    set of bad channels, and the resulting interpolation matrices are cached,
+    so that epochs with many different sets of bad channels are cheap to
+    clean.
+
+    .. versionadded:: 1.11
+    """
+    from ..epochs import BaseEpochs
+    from .interpolation import _interpolate_bads_eeg_epochs
+
+    _validate_type(epochs, BaseEpochs, "epochs")
+    _check_preload(epochs, "interpolate_bads_per_epoch")
+    origin = _check_origin(origin, epochs.info)
+    _interpolate_bads_eeg_epochs(epochs, bads, origin)
+    return epochs
+
+
 class ReferenceMixin(MontageMixin):
     """Mixin class for Raw, Evoked, Epochs."""
 
@@ -610,6 +663,8 @@ class UpdateChannelsMixin:
         if isinstance(self, BaseRaw):
             if self._projector is not None:
                 _check_preload(self, f"{msg} after calling .apply_proj()")
+            if self._ica_op is not None:
+                _check_preload(self, f"{msg} after calling ICA.apply()")
         else:
             _check_preload(self, msg)
 
@@ -2,8 +2,10 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+from functools import lru_cache
+
 import numpy as np
-from numpy.polynomial.legendre import legval
+from numpy.polynomial.legendre import legder, legval
 from scipy.interpolate import RectBivariateSpline
 from scipy.linalg import pinv
 from scipy.spatial.distance import pdist, squareform
@@ -11,7 +13,47 @@ from scipy.spatial.distance import pdist, squareform
 from .._fiff.meas_info import _simplify_info
 from .._fiff.pick import pick_channels, pick_info, pick_types
 from ..surface import _normalize_vectors
-from ..utils import _validate_type, logger, verbose, warn
+from ..utils import _custom_lru_cache, _pl, _validate_type, logger, verbose, warn
+
+# Number of intervals of the Legendre series lookup tables, uniform in angle
+_N_LEGEN_INTERP = 20000
+
+
+@lru_cache(maxsize=8)
+def _get_legen_sum_table(factors):
+    """Tabulate a Legendre series and its angular derivative on [0, pi]."""
+    theta = np.linspace(0, np.pi, _N_LEGEN_INTERP + 1)
+    x = np.cos(theta)
+    values = legval(x, factors)
+    # derivative with respect to the (normalized) table index
+    derivs = legval(x, legder(factors))
+    derivs *= -np.sin(theta) * (np.pi / _N_LEGEN_INTERP)
+    return values, derivs
+
+
+def _legval_table(cosang, factors):
+    """Evaluate a Legendre series using a cubic Hermite lookup table.
+
+    Unlike ``legval(cosang, factors)``, whose cost is proportional to the
+    number of terms for every cosine, the series is only evaluated once to
+    build the table, and each cosine then needs a constant number of
+    operations. The table is uniform in angle, which resolves the
+    oscillations of the high order polynomials near +/-1, so that the
+    error is close to machine precision.
+    """
+    values, derivs = _get_legen_sum_table(tuple(factors))
+    u = np.arccos(np.clip(cosang, -1.0, 1.0))
+    u *= _N_LEGEN_INTERP / np.pi
+    idx = np.minimum(u.astype(np.intp), _N_LEGEN_INTERP - 1)
+    t = u - idx
+    t2 = t * t
+    t3 = t2 * t
+    h01 = 3 * t2 - 2 * t3
+    out = (1 - h01) * values[idx]
+    out += h01 * values[idx + 1]
+    out += (t3 - 2 * t2 + t) * derivs[idx]
+    out += (t3 - t2) * derivs[idx + 1]
+    return out
 
 
 def _calc_h(cosang, stiffness=4, n_legendre_terms=50):
@@ -31,7 +73,7 @@ def _calc_h(cosang, stiffness=4, n_legendre_terms=50):
         (2 * n + 1) / (n ** (stiffness - 1) * (n + 1) ** (stiffness - 1) * 4 * np.pi)
         for n in range(1, n_legendre_terms + 1)
     ]
-    return legval(cosang, [0] + factors)
+    return _legval_table(cosang, [0] + factors)
 
 
 def _calc_g(cosang, stiffness=4, n_legendre_terms=50):
@@ -56,7 +98,7 @@ def _calc_g(cosang, stiffness=4, n_legendre_terms=50):
         (2 * n + 1) / (n**stiffness * (n + 1) ** stiffness * 4 * np.pi)
         for n in range(1, n_legendre_terms + 1)
     ]
-    return legval(cosang, [0] + factors)
+    return _legval_table(cosang, [0] + factors)
 
 
 def _make_interpolation_matrix(pos_from, pos_to, alpha=1e-5):
@@ -118,6 +160,56 @@ def _make_interpolation_matrix(pos_from, pos_to, alpha=1e-5):
     return interpolation
 
 
+# Keyed by the content of the normalized sensor positions, so that all sets of
+# bad channels (and repeated calls) with the same montage share one inverse
+@_custom_lru_cache(4)
+def _get_spline_system(pos, alpha):
+    """Invert the regularized spherical spline system of all sensors."""
+    n_pos = len(pos)
+    C = np.ones((n_pos + 1, n_pos + 1))
+    C[:-1, :-1] = _calc_g(pos @ pos.T)
+    C[-1, -1] = 0.0
+    C.flat[: n_pos * (n_pos + 2) : n_pos + 2] += alpha
+    return C, pinv(C)
+
+
+@_custom_lru_cache(128)
+def _get_spline_matrix(pos, bads, alpha):
+    """Compute the interpolation matrix for a subset of bad sensors.
+
+    This is equivalent to ``_make_interpolation_matrix(pos[goods], pos[bads])``,
+    but instead of inverting the system of the good sensors, the inverse of
+    the system of all sensors is downdated by the bad ones (Schur complement).
+    """
+    C, C_inv = _get_spline_system(pos, alpha)
+    n_pos = len(pos)
+    goods = np.setdiff1d(np.arange(n_pos), bads)
+    keep = np.append(goods, n_pos)
+    C_inv_kb = C_inv[np.ix_(keep, bads)]
+    C_inv = C_inv[np.ix_(keep, keep)] - C_inv_kb @ np.linalg.solve(
+        C_inv[np.ix_(bads, bads)], C_inv_kb.T
+    )
+    # [G_to_from, 1] @ C_inv[:, :-1], with one step of iterative refinement
+    # because the downdate loses a few digits
+    rhs = C[np.ix_(keep, bads)]
+    interpolation = C_inv @ rhs
+    interpolation += C_inv @ (rhs - C[np.ix_(keep, keep)] @ interpolation)
+    interpolation = interpolation[:-1].T
+    assert interpolation.shape == (len(bads), len(goods))
+    return interpolation
+
+
+def _check_spherical_fit(pos):
+    """Warn if positions relative to the origin are far from a sphere."""
+    distance = np.linalg.norm(pos, axis=-1)
+    distance = np.mean(distance / np.mean(distance))
+    if np.abs(1.0 - distance) > 0.1:
+        warn(
+            "Your spherical fit is poor, interpolation results are "
+            "likely to be inaccurate."
+        )
+
+
 def _do_interp_dots(inst, interpolation, goods_idx, bads_idx):
     """Dot product of channel mapping matrix to channel data."""
     from ..epochs import BaseEpochs
@@ -154,13 +246,7 @@ def _interpolate_bads_eeg(inst, origin, exclude=None, ecog=False, verbose=None):
     goods_idx_pos = goods_idx[picks]
 
     # test spherical fit
-    distance = np.linalg.norm(pos - origin, axis=-1)
-    distance = np.mean(distance / np.mean(distance))
-    if np.abs(1.0 - distance) > 0.1:
-        warn(
-            "Your spherical fit is poor, interpolation results are "
-            "likely to be inaccurate."
-        )
+    _check_spherical_fit(pos - origin)
 
     pos_good = pos[goods_idx_pos] - origin
     pos_bad = pos[bads_idx_pos] - origin
@@ -171,6 +257,46 @@ def _interpolate_bads_eeg(inst, origin, exclude=None, ecog=False, verbose=None):
     _do_interp_dots(inst, interpolation, goods_idx, bads_idx)
 
 
+@verbose
+def _interpolate_bads_eeg_epochs(epochs, bads, origin, verbose=None):
+    picks = pick_types(epochs.info, meg=False, eeg=True, exclude="bads")
+    pick_idx = {epochs.ch_names[pick]: ii for ii, pick in enumerate(picks)}
+    _validate_type(bads, (list, tuple), "bads")
+    if len(bads) != len(epochs):
+        raise ValueError(
+            f"bads must have one entry per epoch ({len(epochs)}), got {len(bads)}"
+        )
+    groups = dict()
+    for ei, epoch_bads in enumerate(bads):
+        _validate_type(epoch_bads, (list, tuple), f"bads[{ei}]")
+        missing = sorted(set(epoch_bads).difference(pick_idx))
+        if missing:
+            raise ValueError(
+                f"bads[{ei}] must only contain good EEG channels, got {missing}"
+            )
+        key = tuple(sorted(pick_idx[ch_name] for ch_name in set(epoch_bads)))
+        groups.setdefault(key, list()).append(ei)
+    groups.pop((), None)
+    if len(groups) == 0:
+        return
+
+    pos = epochs._get_channel_positions(picks) - origin
+    _check_spherical_fit(pos)
+    _normalize_vectors(pos)
+    n_epochs = sum(len(sel) for sel in groups.values())
+    logger.info(
+        f"Interpolating {len(groups)} set{_pl(groups)} of bad channels in "
+        f"{n_epochs} epoch{_pl(n_epochs)}"
+    )
+    for key, sel in groups.items():
+        interpolation = _get_spline_matrix(pos, np.array(key), 1e-5)
+        bads_idx = picks[list(key)]
+        goods_idx = np.setdiff1d(picks, bads_idx)
+        epochs._data[np.ix_(sel, bads_idx)] = np.matmul(
+            interpolation, epochs._data[np.ix_(sel, goods_idx)]
+        )
+
+
 @verbose
 def _interpolate_bads_ecog(inst, origin, exclude=None, verbose=None):
     _interpolate_bads_eeg(inst, origin, exclude=exclude, ecog=True, verbose=verbose)
@@ -7,13 +7,30 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+from numpy.polynomial.legendre import legval
 from numpy.testing import assert_allclose, assert_array_equal
 
-from mne import Epochs, pick_channels, pick_types, read_events
+from mne import (
+    Epochs,
+    EpochsArray,
+    create_info,
+    pick_channels,
+    pick_types,
+    read_events,
+)
 from mne._fiff.constants import FIFF
 from mne._fiff.proj import _has_eeg_average_ref_proj
-from mne.channels import make_dig_montage, make_standard_montage
-from mne.channels.interpolation import _make_interpolation_matrix
+from mne.channels import (
+    interpolate_bads_per_epoch,
+    make_dig_montage,
+    make_standard_montage,
+)
+from mne.channels.interpolation import (
+    _calc_g,
+    _calc_h,
+    _get_spline_matrix,
+    _make_interpolation_matrix,
+)
 from mne.datasets import testing
 from mne.io import RawArray, read_raw_ctf, read_raw_fif, read_raw_nirx
 from mne.preprocessing.nirs import (
@@ -521,3 +538,61 @@ def test_interpolate_to_eeg(montage_name, method, data_type):
     inst.info["bads"] = bads
     inst_interp = inst.copy().interpolate_to(montage, method=method)
     assert inst_interp.info["bads"] == bads
+
+
+def test_interpolate_bads_per_epoch():
+    """Test interpolating different bad channels in each epoch."""
+    montage = make_standard_montage("standard_1020")
+    info = create_info(montage.ch_names[:40] + ["STI"], 100.0, ["eeg"] * 40 + ["stim"])
+    info.set_montage(montage)
+    info["bads"] = [info["ch_names"][5]]
+    rng = np.random.RandomState(0)
+    epochs = EpochsArray(rng.randn(6, 41, 20), info)
+    ch_names = info["ch_names"]
+    bads = [[], ch_names[:2], ch_names[10:13], ch_names[:2], [ch_names[20]], []]
+    origin = (0.0, 0.0, 0.04)
+    epochs_interp = interpolate_bads_per_epoch(epochs.copy(), bads, origin=origin)
+    for ei, epoch_bads in enumerate(bads):
+        want = epochs[ei]
+        want.info["bads"] += epoch_bads
+        want.interpolate_bads(
+            reset_bads=False,
+            method=dict(eeg="spline"),
+            origin=origin,
+            exclude=[ch_names[5]],
+        )
+        assert_allclose(
+            epochs_interp.get_data()[ei], want.get_data()[0], rtol=1e-7, atol=1e-10
+        )
+    assert epochs_interp.info["bads"] == [ch_names[5]]
+    # the downdated matrix matches the direct computation
+    pos = np.array([montage.get_positions()["ch_pos"][ch] for ch in ch_names[:10]])
+    pos -= np.mean(pos, axis=0)
+    want = _make_interpolation_matrix(pos[[0, 1, 4, 5, 6, 7, 8, 9]], pos[[2, 3]])
+    pos /= np.linalg.norm(pos, axis=1, keepdims=True)
+    got = _get_spline_matrix(pos, np.array([2, 3]), 1e-5)
+    assert_allclose(got, want, rtol=1e-7, atol=1e-10)
+    with pytest.raises(ValueError, match="one entry per epoch"):
+        interpolate_bads_per_epoch(epochs, bads[:2], origin=origin)
+    with pytest.raises(ValueError, match="only contain good EEG"):
+        interpolate_bads_per_epoch(epochs, [[ch_names[5]]] + bads[1:], origin=origin)
+    with pytest.raises(RuntimeError, match="be loaded"):
+        interpolate_bads_per_epoch(
+            Epochs(RawArray(np.zeros((41, 100)), info), [[0, 0, 1]]), [], origin=origin
+        )
+
+
+@pytest.mark.parametrize(
+    "stiffness, n_legendre_terms, rtol", [(4, 50, 1e-13), (3, 7, 1e-13), (2, 200, 1e-9)]
+)
+def test_calc_g_h_table(stiffness, n_legendre_terms, rtol):
+    """Test the Legendre lookup tables of the spherical spline functions."""
+    rng = np.random.RandomState(0)
+    cosang = np.cos(rng.uniform(0, np.pi, (20, 30)))
+    cosang[0, :2] = [-1.0, 1.0]
+    ns = np.arange(1.0, n_legendre_terms + 1)
+    for func, exp in ((_calc_g, stiffness), (_calc_h, stiffness - 1)):
+        factors = (2 * ns + 1) / (ns**exp * (ns + 1) ** exp * 4 * np.pi)
+        want = legval(cosang, np.r_[0, factors])
+        got = func(cosang, stiffness=stiffness, n_legendre_terms=n_legendre_terms)
+        assert_allclose(got, want, rtol=rtol, atol=rtol * np.abs(want).max())
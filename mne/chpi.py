@@ -24,8 +24,9 @@ import itertools
 from functools import partial
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.linalg import orth
-from scipy.optimize import fmin_cobyla
+from scipy.optimize import least_squares
 from scipy.spatial.distance import cdist
 
 from ._fiff.constants import FIFF
@@ -43,11 +44,17 @@ from .cov import compute_whitener, make_ad_hoc_cov
 from .dipole import _make_guesses
 from .event import find_events
 from .fixes import jit
-from .forward import _concatenate_coils, _create_meg_coils, _magnetic_dipole_field_vec
+from .forward import (
+    _concatenate_coils,
+    _create_meg_coils,
+    _magnetic_dipole_field_jac,
+    _magnetic_dipole_field_vec,
+)
 from .io import BaseRaw
 from .io.ctf.trans import _make_ctf_coord_trans_set
 from .io.kit.constants import KIT
 from .io.kit.kit import RawKIT as _RawKIT
+from .parallel import parallel_func
 from .preprocessing.maxwell import (
     _get_mf_picks_fix_mags,
     _prep_mf_coils,
@@ -73,6 +80,7 @@ from .utils import (
     _pl,
     _validate_type,
     _verbose_safe_false,
+    fill_doc,
     logger,
     use_log_level,
     verbose,
@@ -84,6 +92,16 @@ from .utils import (
 #   high-passing of data during fits
 #   parsing cHPI coil information from acq pars, then to PSD if necessary
 
+# Approximate size of the windowed data to fit cHPI amplitudes for at once
+_CHPI_BATCH_BYTES = 50e6
+
+# Fraction of the whitened data power left unexplained by the warm start of a
+# coil fit (typically the previous fit) above which the 1 cm guess grid is also
+# searched. A residual of 5% corresponds to the coil having moved roughly
+# 5 mm, which is within the convergence range of the least-squares fit (several
+# cm) and below the grid spacing, so a grid point would not be a better start.
+_CHPI_WARM_START_RESIDUAL = 0.05
+
 
 # ############################################################################
 # Reading from text or FIF file
@@ -554,19 +572,43 @@ def _fit_magnetic_dipole(B_orig, x0, too_close, whitener, coils, guesses):
         whitener=whitener,
         too_close=too_close,
     )
+    # Only fall back to the grid when the warm start (typically the previous
+    # fit) no longer explains the data
     if guesses is not None:
         res0 = objective(x0)
-        res = _magnetic_dipole_delta_multi(guesses["whitened_fwd_svd"], B, B2)
-        assert res.shape == (guesses["rr"].shape[0],)
-        idx = np.argmin(res)
-        if res[idx] < res0:
-            x0 = guesses["rr"][idx]
-    x = fmin_cobyla(objective, x0, (), rhobeg=1e-3, rhoend=1e-5, disp=False)
+        if res0 > _CHPI_WARM_START_RESIDUAL * B2:
+            res = _magnetic_dipole_delta_multi(guesses["whitened_fwd_svd"], B, B2)
+            assert res.shape == (guesses["rr"].shape[0],)
+            idx = np.argmin(res)
+            if res[idx] < res0:
+                x0 = guesses["rr"][idx]
+    x = _fit_magnetic_dipole_lsq(B, x0, too_close, whitener, coils)
     gof, moment = objective(x, return_moment=True)
     gof = 1.0 - gof / B2
     return x, gof, moment
 
 
+def _fit_magnetic_dipole_lsq(B, x0, too_close, whitener, coils):
+    """Fit the position and moment jointly using the analytic Jacobian."""
+
+    def fun(x):
+        fwd = _magnetic_dipole_field_vec(x[np.newaxis, :3], coils, too_close)
+        return np.dot(whitener, np.dot(x[3:], fwd)) - B
+
+    def jac(x):
+        fwd, grad = _magnetic_dipole_field_jac(x[:3], x[3:], coils)
+        return np.dot(whitener, np.concatenate([grad, fwd]).T)
+
+    # Start from the best moment for the initial location
+    fwd = np.dot(
+        whitener, _magnetic_dipole_field_vec(x0[np.newaxis], coils, too_close).T
+    )
+    moment = np.linalg.lstsq(fwd, B, rcond=None)[0]
+    x = np.concatenate([x0, moment])
+    x = least_squares(fun, x, jac=jac, method="lm", x_scale="jac", xtol=1e-10).x
+    return x[:3]
+
+
 @jit()
 def _chpi_objective(x, coil_dev_rrs, coil_head_rrs):
     """Compute objective function."""
@@ -778,13 +820,17 @@ def _fit_chpi_amplitudes(raw, time_sl, hpi, snr=False):
     with use_log_level(False):
         # loads good channels
         this_data = raw[hpi["meg_picks"], time_sl][0]
-
-    # which HPI coils to use
-    if hpi["hpi_pick"] is not None:
-        with use_log_level(False):
-            # loads hpi_stim channel
+        # loads hpi_stim channel
+        chpi_data = None
+        if hpi["hpi_pick"] is not None:
             chpi_data = raw[hpi["hpi_pick"], time_sl][0]
+    return _fit_chpi_amplitudes_data(this_data, chpi_data, hpi, snr=snr)
 
+
+def _fit_chpi_amplitudes_data(this_data, chpi_data, hpi, snr=False):
+    """Fit cHPI amplitudes to a window of MEG and cHPI status channel data."""
+    # which HPI coils to use
+    if chpi_data is not None:
         ons = (np.round(chpi_data).astype(np.int64) & hpi["on"][:, np.newaxis]).astype(
             bool
         )
@@ -809,6 +855,58 @@ def _fit_chpi_amplitudes(raw, time_sl, hpi, snr=False):
     )
 
 
+def _fit_chpi_amplitudes_batch(raw, midpts, hpi):
+    """Fit amplitudes for many windows at once.
+
+    Returns
+    -------
+    sin_fits : ndarray, shape (n_windows, n_freqs, n_channels)
+        The sin amplitudes, all nan for windows that should be skipped.
+    """
+    n_window = hpi["n_window"]
+    n_freqs = len(hpi["freqs"])
+    starts = np.asarray(midpts) - n_window // 2
+    stops = starts + n_window
+    sin_fits = np.full((len(starts), n_freqs, len(hpi["meg_picks"])), np.nan)
+    # truncated (first or last) windows need their own model
+    full = (starts >= 0) & (stops <= len(raw.times))
+    for mi in np.where(~full)[0]:
+        time_sl = slice(max(starts[mi], 0), min(stops[mi], len(raw.times)))
+        sin_fit = _fit_chpi_amplitudes(raw, time_sl, hpi)
+        if sin_fit is not None:
+            sin_fits[mi] = sin_fit
+    (use,) = np.where(full)
+    if len(use) == 0:
+        return sin_fits
+    start, stop = starts[use[0]], stops[use[-1]]
+    offsets = starts[use] - start
+    with use_log_level(False):
+        data = raw[hpi["meg_picks"], start:stop][0]
+    if hpi["hpi_pick"] is not None:
+        with use_log_level(False):
+            chpi_data = raw[hpi["hpi_pick"], start:stop][0]
+        off = ~(np.round(chpi_data).astype(np.int64) & hpi["on"][:, np.newaxis]).astype(
+            bool
+        )
+        n_off = np.concatenate(
+            [np.zeros((len(off), 1), np.int64), np.cumsum(off, axis=-1)], axis=-1
+        )
+        n_off = n_off[:, offsets + n_window] - n_off[:, offsets]
+        n_on = (n_off == 0).sum(axis=0)
+        use, offsets = use[n_on >= 3], offsets[n_on >= 3]
+    # project once for all of the (typically overlapping) windows
+    data = hpi["proj_op"] @ data
+    # (n_windows, n_channels, n_window) @ (n_window, 2 * n_freqs)
+    X = sliding_window_view(data, n_window, axis=-1)[:, offsets].transpose(1, 0, 2)
+    X = X @ hpi["inv_model_reord"].T
+    # use SVD across all sensors to estimate the sinusoid phases
+    X = X.reshape(len(use), len(data), n_freqs, 2).transpose(0, 2, 3, 1)
+    _, s, vt = np.linalg.svd(X, full_matrices=False)
+    # the first component holds the predominant phase direction
+    sin_fits[use] = vt[..., 0, :] * s[..., :1]
+    return sin_fits
+
+
 @jit()
 def _fast_fit(this_data, proj, n_freqs, model, inv_model_reord):
     # first or last window
@@ -952,7 +1050,6 @@ def compute_head_pos(
     _check_chpi_param(chpi_locs, "chpi_locs")
     _validate_type(info, Info, "info")
     hpi_dig_head_rrs = _get_hpi_initial_fit(info, adjust=adjust_dig, verbose="error")
-    n_coils = len(hpi_dig_head_rrs)
     coil_dev_rrs = apply_trans(invert_transform(info["dev_head_t"]), hpi_dig_head_rrs)
     dev_head_t = info["dev_head_t"]["trans"]
     pos_0 = dev_head_t[:3, 3]
@@ -962,6 +1059,14 @@ def compute_head_pos(
         quat=np.concatenate([rot_to_quat(dev_head_t[:3, :3]), dev_head_t[:3, 3]]),
     )
     del coil_dev_rrs
+    return _compute_head_pos(
+        chpi_locs, hpi_dig_head_rrs, last, pos_0, dist_limit, gof_limit
+    )
+
+
+def _compute_head_pos(chpi_locs, hpi_dig_head_rrs, last, pos_0, dist_limit, gof_limit):
+    """Fit head positions, updating the state of the last fit in place."""
+    n_coils = len(hpi_dig_head_rrs)
     quats = []
     for fit_time, this_coil_dev_rrs, g_coils in zip(
         *(chpi_locs[key] for key in ("times", "rrs", "gofs"))
@@ -1235,6 +1340,15 @@ def _compute_chpi_amp_or_snr(
     else:
         sin_fits["slopes"] = np.empty((n_times, n_freqs, n_chans))
     message = f"cHPI {'SNRs' if snr else 'amplitudes'}"
+    if not snr:
+        # fit the amplitudes for a batch of windows at a time
+        n_batch = max(int(_CHPI_BATCH_BYTES // (8 * n_chans * hpi["n_window"])), 1)
+        pb = ProgressBar(len(fit_idxs), mesg=message)
+        for mi in range(0, len(fit_idxs), n_batch):
+            sl = slice(mi, mi + n_batch)
+            sin_fits["slopes"][sl] = _fit_chpi_amplitudes_batch(raw, fit_idxs[sl], hpi)
+            pb.update_with_increment_value(len(fit_idxs[sl]))
+        return sin_fits
     for mi, midpt in enumerate(ProgressBar(fit_idxs, mesg=message)):
         #
         # 0. determine samples to fit.
@@ -1243,28 +1357,25 @@ def _compute_chpi_amp_or_snr(
         time_sl = slice(max(time_sl, 0), min(time_sl + hpi["n_window"], len(raw.times)))
 
         #
-        # 1. Fit amplitudes for each channel from each of the N sinusoids
+        # 1. Fit SNRs for each channel type from each of the N sinusoids
         #
         amps_or_snrs = _fit_chpi_amplitudes(raw, time_sl, hpi, snr)
-        if snr:
-            if amps_or_snrs is None:
-                amps_or_snrs = np.full((n_freqs, grad_offset + 3), np.nan)
-            # unpack the SNR estimates. mag & grad are returned in one array
-            # (because of Numba) so take care with which column is which.
-            # note that mean residual is a scalar (same for all HPI freqs) but
-            # is returned as a (tiled) vector (again, because Numba) so that's
-            # why below we take amps_or_snrs[0, 2] instead of [:, 2]
-            ch_types = raw.get_channel_types()
-            if "mag" in ch_types:
-                sin_fits["mag_snr"][mi] = amps_or_snrs[:, 0]  # SNR
-                sin_fits["mag_power"][mi] = amps_or_snrs[:, 1]  # mean power
-                sin_fits["mag_resid"][mi] = amps_or_snrs[0, 2]  # mean resid
-            if "grad" in ch_types:
-                sin_fits["grad_snr"][mi] = amps_or_snrs[:, grad_offset]
-                sin_fits["grad_power"][mi] = amps_or_snrs[:, grad_offset + 1]
-                sin_fits["grad_resid"][mi] = amps_or_snrs[0, grad_offset + 2]
-        else:
-            sin_fits["slopes"][mi] = amps_or_snrs
+        if amps_or_snrs is None:
+            amps_or_snrs = np.full((n_freqs, grad_offset + 3), np.nan)
+        # unpack the SNR estimates. mag & grad are returned in one array
+        # (because of Numba) so take care with which column is which.
+        # note that mean residual is a scalar (same for all HPI freqs) but
+        # is returned as a (tiled) vector (again, because Numba) so that's
+        # why below we take amps_or_snrs[0, 2] instead of [:, 2]
+        ch_types = raw.get_channel_types()
+        if "mag" in ch_types:
+            sin_fits["mag_snr"][mi] = amps_or_snrs[:, 0]  # SNR
+            sin_fits["mag_power"][mi] = amps_or_snrs[:, 1]  # mean power
+            sin_fits["mag_resid"][mi] = amps_or_snrs[0, 2]  # mean resid
+        if "grad" in ch_types:
+            sin_fits["grad_snr"][mi] = amps_or_snrs[:, grad_offset]
+            sin_fits["grad_power"][mi] = amps_or_snrs[:, grad_offset + 1]
+            sin_fits["grad_resid"][mi] = amps_or_snrs[0, grad_offset + 2]
     return sin_fits
 
 
@@ -1276,6 +1387,7 @@ def compute_chpi_locs(
     too_close="raise",
     adjust_dig=False,
     *,
+    n_jobs=None,
     verbose=None,
 ):
     """Compute locations of each cHPI coils over time.
@@ -1291,6 +1403,10 @@ def compute_chpi_locs(
         How to handle HPI positions too close to the sensors,
         can be ``'raise'`` (default), ``'warning'``, or ``'info'``.
     %(adjust_dig_chpi)s
+    %(n_jobs)s
+        The time points to fit are split into contiguous chunks, one per job.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -1313,7 +1429,8 @@ def compute_chpi_locs(
     1. Get HPI coil locations (as digitized in ``info['dig']``) in head coords.
     2. If the amplitudes are 98%% correlated with last position
        (and Δt < t_step_max), skip fitting.
-    3. Fit magnetic dipoles using the amplitudes for each coil frequency.
+    3. Fit magnetic dipoles using the amplitudes for each coil frequency,
+       starting from the previous fit (or the digitized locations).
 
     The number of fitted points ``n_pos`` will depend on the velocity of head
     movements as well as ``t_step_max`` (and ``t_step_min`` from
@@ -1328,7 +1445,76 @@ def compute_chpi_locs(
     _validate_type(info["dev_head_t"], Transform, "info['dev_head_t']")
     sin_fits = chpi_amplitudes  # use the old name below
     del chpi_amplitudes
-    proj = sin_fits["proj"]
+    meg_coils, whitener, guesses = _setup_hpi_loc_fitting(
+        info, sin_fits["proj"], too_close
+    )
+
+    # Decide which windows need to be fit, which only depends on the data
+    fit_idx = list()
+    last_sin_fit = None
+    last_fit_time = sin_fits["times"][0] - 1
+    for ti, (fit_time, sin_fit) in enumerate(
+        zip(sin_fits["times"], sin_fits["slopes"])
+    ):
+        # skip this window if bad
+        if not np.isfinite(sin_fit).all():
+            continue
+
+        # check if data has sufficiently changed
+        if last_sin_fit is not None:  # first iteration
+            corrs = np.array(
+                [np.corrcoef(s, lst)[0, 1] for s, lst in zip(sin_fit, last_sin_fit)]
+            )
+            corrs *= corrs
+            # check to see if we need to continue
+            if (
+                fit_time - last_fit_time <= t_step_max - 1e-7
+                and (corrs > 0.98).sum() >= 3
+            ):
+                # don't need to refit data
+                continue
+        last_sin_fit = sin_fit
+        last_fit_time = fit_time
+        fit_idx.append(ti)
+
+    #
+    # 2. Fit magnetic dipole for each coil to obtain coil positions
+    #    in device coordinates, each fit being warm-started from the last one
+    #
+    hpi_dig_dev_rrs = apply_trans(
+        invert_transform(info["dev_head_t"])["trans"],
+        _get_hpi_initial_fit(info, adjust=adjust_dig),
+    )
+    n_hpi = len(hpi_dig_dev_rrs)
+    parallel, p_fun, n_jobs = parallel_func(
+        _fit_chpi_locs_chunk, n_jobs, max_jobs=max(len(fit_idx), 1)
+    )
+    slopes = sin_fits["slopes"][fit_idx]
+    if n_jobs == 1:
+        slopes = ProgressBar(slopes, mesg="cHPI locations ")
+        out = [p_fun(slopes, hpi_dig_dev_rrs, too_close, whitener, meg_coils, guesses)]
+    else:
+        out = parallel(
+            p_fun(chunk, hpi_dig_dev_rrs, too_close, whitener, meg_coils, guesses)
+            for chunk in np.array_split(slopes, n_jobs)
+        )
+    chpi_locs = dict(times=sin_fits["times"][fit_idx])
+    for key, val in zip(("rrs", "gofs", "moments"), zip(*out)):
+        chpi_locs[key] = sum(val, [])
+    n_times = len(chpi_locs["times"])
+    shapes = dict(
+        times=(n_times,),
+        rrs=(n_times, n_hpi, 3),
+        gofs=(n_times, n_hpi),
+        moments=(n_times, n_hpi, 3),
+    )
+    for key, val in chpi_locs.items():
+        chpi_locs[key] = np.array(val, float).reshape(shapes[key])
+    return chpi_locs
+
+
+def _setup_hpi_loc_fitting(info, proj, too_close):
+    """Set up the coils, whitener and location guesses for dipole fitting."""
     meg_picks = pick_channels(info["ch_names"], proj["data"]["col_names"], ordered=True)
     info = pick_info(info, meg_picks)  # makes a copy
     with info._unlock():
@@ -1355,69 +1541,22 @@ def compute_chpi_locs(
     fwd.shape = (guesses.shape[0], 3, -1)
     fwd = np.linalg.svd(fwd, full_matrices=False)[2]
     guesses = dict(rr=guesses, whitened_fwd_svd=fwd)
-    del fwd, R
+    return meg_coils, whitener, guesses
 
-    iter_ = list(zip(sin_fits["times"], sin_fits["slopes"]))
-    chpi_locs = dict(times=[], rrs=[], gofs=[], moments=[])
-    # setup last iteration structure
-    hpi_dig_dev_rrs = apply_trans(
-        invert_transform(info["dev_head_t"])["trans"],
-        _get_hpi_initial_fit(info, adjust=adjust_dig),
-    )
-    last = dict(
-        sin_fit=None,
-        coil_fit_time=sin_fits["times"][0] - 1,
-        coil_dev_rrs=hpi_dig_dev_rrs,
-    )
-    n_hpi = len(hpi_dig_dev_rrs)
-    del hpi_dig_dev_rrs
-    for fit_time, sin_fit in ProgressBar(iter_, mesg="cHPI locations "):
-        # skip this window if bad
-        if not np.isfinite(sin_fit).all():
-            continue
 
-        # check if data has sufficiently changed
-        if last["sin_fit"] is not None:  # first iteration
-            corrs = np.array(
-                [np.corrcoef(s, lst)[0, 1] for s, lst in zip(sin_fit, last["sin_fit"])]
-            )
-            corrs *= corrs
-            # check to see if we need to continue
-            if (
-                fit_time - last["coil_fit_time"] <= t_step_max - 1e-7
-                and (corrs > 0.98).sum() >= 3
-            ):
-                # don't need to refit data
-                continue
-
-        # update 'last' sin_fit *before* inplace sign mult
-        last["sin_fit"] = sin_fit.copy()
-
-        #
-        # 2. Fit magnetic dipole for each coil to obtain coil positions
-        #    in device coordinates
-        #
+def _fit_chpi_locs_chunk(slopes, coil_dev_rrs, too_close, whitener, coils, guesses):
+    """Fit the coil locations for consecutive windows."""
+    rrs, gofs, moments = list(), list(), list()
+    for sin_fit in slopes:
         coil_fits = [
-            _fit_magnetic_dipole(f, x0, too_close, whitener, meg_coils, guesses)
-            for f, x0 in zip(sin_fit, last["coil_dev_rrs"])
+            _fit_magnetic_dipole(f, x0, too_close, whitener, coils, guesses)
+            for f, x0 in zip(sin_fit, coil_dev_rrs)
         ]
-        rrs, gofs, moments = zip(*coil_fits)
-        chpi_locs["times"].append(fit_time)
-        chpi_locs["rrs"].append(rrs)
-        chpi_locs["gofs"].append(gofs)
-        chpi_locs["moments"].append(moments)
-        last["coil_fit_time"] = fit_time
-        last["coil_dev_rrs"] = rrs
-    n_times = len(chpi_locs["times"])
-    shapes = dict(
-        times=(n_times,),
-        rrs=(n_times, n_hpi, 3),
-        gofs=(n_times, n_hpi),
-        moments=(n_times, n_hpi, 3),
-    )
-    for key, val in chpi_locs.items():
-        chpi_locs[key] = np.array(val, float).reshape(shapes[key])
-    return chpi_locs
+        coil_dev_rrs, this_gofs, this_moments = zip(*coil_fits)
+        rrs.append(coil_dev_rrs)
+        gofs.append(this_gofs)
+        moments.append(this_moments)
+    return rrs, gofs, moments
 
 
 def _chpi_locs_to_times_dig(chpi_locs):
@@ -1439,6 +1578,181 @@ def _chpi_locs_to_times_dig(chpi_locs):
     return chpi_locs["times"], dig
 
 
+@fill_doc
+class ChpiTracker:
+    """Track cHPI coil locations and head position in streamed data.
+
+    Parameters
+    ----------
+    %(info_not_none)s
+    t_step : float
+        Time step (in seconds) between the starts of successive windows.
+    %(t_window_chpi_t)s
+    %(ext_order_chpi)s
+    too_close : str
+        How to handle HPI positions too close to the sensors,
+        can be ``'raise'`` (default), ``'warning'``, or ``'info'``.
+    dist_limit : float
+        Minimum distance (m) to accept for coil position fitting.
+    gof_limit : float
+        Minimum goodness of fit to accept for each coil.
+    %(adjust_dig_chpi)s
+    first_samp : int
+        The sample number of the first sample that will be fed, used to
+        compute the times of the fits.
+    %(verbose)s
+
+    See Also
+    --------
+    compute_chpi_amplitudes
+    compute_chpi_locs
+    compute_head_pos
+
+    Notes
+    -----
+    This class fits the same models as :func:`compute_chpi_amplitudes`,
+    :func:`compute_chpi_locs` and :func:`compute_head_pos`, but on buffers of
+    data that arrive one after the other, e.g. during acquisition or when
+    replaying a recording. Only the samples needed for the next window are
+    kept, and each window is fit as soon as its last sample is fed, so the
+    latency is bounded by ``t_window`` plus the time needed for the fit.
+    Coil locations are fit starting from those of the previous window, and
+    windows with fewer than three active coils are skipped.
+
+    .. versionadded:: 1.11
+    """
+
+    @verbose
+    def __init__(
+        self,
+        info,
+        t_step=0.1,
+        t_window="auto",
+        ext_order=1,
+        too_close="raise",
+        dist_limit=0.005,
+        gof_limit=0.98,
+        adjust_dig=False,
+        first_samp=0,
+        *,
+        verbose=None,
+    ):
+        _validate_type(info, Info, "info")
+        _validate_type(info["dev_head_t"], Transform, "info['dev_head_t']")
+        _validate_type(t_step, "numeric", "t_step")
+        _validate_type(first_samp, "int-like", "first_samp")
+        _check_option("too_close", too_close, ["raise", "warning", "info"])
+        if t_step <= 0:
+            raise ValueError(f"t_step ({t_step}) must be > 0")
+        self._hpi = _setup_hpi_amplitude_fitting(info, t_window, ext_order=ext_order)
+        self._coils, self._whitener, self._guesses = _setup_hpi_loc_fitting(
+            info, self._hpi["proj"], too_close
+        )
+        self._too_close = too_close
+        self._dist_limit = dist_limit
+        self._gof_limit = gof_limit
+        self._sfreq = info["sfreq"]
+        self._n_step = max(int(round(t_step * self._sfreq)), 1)
+        self._n_channels = len(info["ch_names"])
+        self._picks = self._hpi["meg_picks"]
+        if self._hpi["hpi_pick"] is not None:
+            self._picks = np.concatenate([self._picks, [self._hpi["hpi_pick"]]])
+        self._hpi_dig_head_rrs = _get_hpi_initial_fit(
+            info, adjust=adjust_dig, verbose="error"
+        )
+        self._coil_dev_rrs = apply_trans(
+            invert_transform(info["dev_head_t"]), self._hpi_dig_head_rrs
+        )
+        dev_head_t = info["dev_head_t"]["trans"]
+        self._pos_0 = dev_head_t[:3, 3]
+        self._last = dict(
+            quat_fit_time=first_samp / self._sfreq - 0.1,
+            coil_dev_rrs=self._coil_dev_rrs,
+            quat=np.concatenate([rot_to_quat(dev_head_t[:3, :3]), dev_head_t[:3, 3]]),
+        )
+        self._data = np.zeros((len(self._picks), 0))
+        self._data_start = int(first_samp)  # sample number of self._data[:, 0]
+        self._next_start = int(first_samp)  # sample number of the next window
+
+    @property
+    def dev_head_t(self):
+        """The most recent device-to-head transform.
+
+        :type: instance of Transform
+        """
+        return Transform("meg", "head", _quat_to_affine(self._last["quat"]))
+
+    @verbose
+    def feed(self, data, *, verbose=None):
+        """Feed a buffer of data and fit the windows it completes.
+
+        Parameters
+        ----------
+        data : ndarray, shape (n_channels, n_times)
+            The next samples of all channels in ``info``.
+        %(verbose)s
+
+        Returns
+        -------
+        %(chpi_locs)s
+            One entry per window completed by this buffer.
+        quats : ndarray, shape (n_pos, 10)
+            MaxFilter-formatted head position parameters for the windows
+            where the head position could be determined, see
+            :func:`compute_head_pos`.
+        """
+        _validate_type(data, np.ndarray, "data")
+        if data.ndim != 2 or data.shape[0] != self._n_channels:
+            raise ValueError(
+                f"data must have shape ({self._n_channels}, n_times), got {data.shape}"
+            )
+        self._data = np.concatenate([self._data, data[self._picks]], axis=1)
+        n_window = self._hpi["n_window"]
+        n_meg = len(self._hpi["meg_picks"])
+        times, sin_fits = list(), list()
+        data_stop = self._data_start + self._data.shape[1]
+        while self._next_start + n_window <= data_stop:
+            start = self._next_start - self._data_start
+            this_data = np.ascontiguousarray(self._data[:, start : start + n_window])
+            chpi_data = None if len(this_data) == n_meg else this_data[n_meg:]
+            sin_fit = _fit_chpi_amplitudes_data(this_data[:n_meg], chpi_data, self._hpi)
+            if sin_fit is not None:
+                times.append(self._next_start / self._sfreq)
+                sin_fits.append(sin_fit)
+            self._next_start += self._n_step
+        # only keep what is needed for the next window
+        n_drop = min(self._next_start - self._data_start, self._data.shape[1])
+        self._data = self._data[:, n_drop:]
+        self._data_start += n_drop
+
+        rrs, gofs, moments = _fit_chpi_locs_chunk(
+            sin_fits,
+            self._coil_dev_rrs,
+            self._too_close,
+            self._whitener,
+            self._coils,
+            self._guesses,
+        )
+        if len(rrs):
+            self._coil_dev_rrs = rrs[-1]
+        n_hpi = len(self._hpi_dig_head_rrs)
+        chpi_locs = dict(
+            times=np.array(times, float),
+            rrs=np.array(rrs, float).reshape(-1, n_hpi, 3),
+            gofs=np.array(gofs, float).reshape(-1, n_hpi),
+            moments=np.array(moments, float).reshape(-1, n_hpi, 3),
+        )
+        quats = _compute_head_pos(
+            chpi_locs,
+            self._hpi_dig_head_rrs,
+            self._last,
+            self._pos_0,
+            self._dist_limit,
+            self._gof_limit,
+        )
+        return chpi_locs, quats
+
+
 @verbose
 def filter_chpi(
     raw,
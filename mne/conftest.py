@@ -23,11 +23,13 @@ from pytest import StashKey
 
 import mne
 from mne import Epochs, pick_types, read_events
+from mne import event as _event
 from mne.channels import read_layout
 from mne.coreg import create_default_subject
 from mne.datasets import testing
 from mne.fixes import _compare_version, has_numba
 from mne.io import read_raw_ctf, read_raw_fif, read_raw_nirx, read_raw_snirf
+from mne.preprocessing import _peak_finder, infomax_
 from mne.stats import cluster_level
 from mne.utils import (
     Bunch,
@@ -1051,6 +1053,13 @@ def numba_conditional(monkeypatch, request):
             cluster_level, "_where_first", cluster_level._where_first_fallback
         )
         monkeypatch.setattr(numerics, "_arange_div", numerics._arange_div_fallback)
+        monkeypatch.setattr(
+            infomax_, "_infomax_kurtosis", infomax_._infomax_kurtosis_fallback
+        )
+        monkeypatch.setattr(
+            _peak_finder, "_peak_finder_loop", _peak_finder._peak_finder_loop_fallback
+        )
+        monkeypatch.setattr(_event, "_find_step_idx", _event._find_step_idx_fallback)
     if request.param == "Numba" and not has_numba:
         pytest.skip("Numba not installed")
     yield request.param
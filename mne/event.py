@@ -15,6 +15,7 @@ from ._fiff.pick import pick_channels
 from ._fiff.tag import read_tag
 from ._fiff.tree import dir_tree_find
 from ._fiff.write import end_block, start_and_end_file, start_block, write_int
+from .fixes import has_numba, jit
 from .utils import (
     _check_fname,
     _check_integer_or_list,
@@ -375,14 +376,40 @@ def write_events(filename, events, *, overwrite=False, verbose=None):
                 f.write(f"{e[0]:6d} {e[1]:6d} {e[2]:3d}\n")
 
 
-def _find_stim_steps(data, first_samp, pad_start=None, pad_stop=None, merge=0):
+def _find_step_idx_fallback(data):
     changed = np.diff(data, axis=1) != 0
-    idx = np.where(np.all(changed, axis=0))[0]
+    return np.where(np.all(changed, axis=0))[0] + 1
+
+
+if has_numba:
+
+    @jit()
+    def _find_step_idx(data):
+        # single pass without the temporary arrays of the NumPy version
+        n_channels, n_times = data.shape
+        idx = np.empty(1024, np.int64)
+        n_steps = 0
+        for ti in range(1, n_times):
+            for ci in range(n_channels):
+                if data[ci, ti] == data[ci, ti - 1]:
+                    break
+            else:
+                if n_steps == idx.size:
+                    idx = np.concatenate((idx, np.empty(idx.size, np.int64)))
+                idx[n_steps] = ti
+                n_steps += 1
+        return idx[:n_steps].copy()
+
+else:  # pragma: no cover
+    _find_step_idx = _find_step_idx_fallback
+
+
+def _find_stim_steps(data, first_samp, pad_start=None, pad_stop=None, merge=0):
+    idx = _find_step_idx(data)
     if len(idx) == 0:
         return np.empty((0, 3), dtype="int32")
 
-    pre_step = data[0, idx]
-    idx += 1
+    pre_step = data[0, idx - 1]
     post_step = data[0, idx]
     idx += first_samp
     steps = np.c_[idx, pre_step, post_step]
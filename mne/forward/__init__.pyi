@@ -8,6 +8,7 @@ __all__ = [
     "_do_forward_solution",
     "_fill_measurement_info",
     "_lead_dots",
+    "_magnetic_dipole_field_jac",
     "_magnetic_dipole_field_vec",
     "_make_surface_mapping",
     "_map_meg_or_eeg_channels",
@@ -42,6 +43,7 @@ from . import _lead_dots
 from ._compute_forward import (
     _compute_forwards,
     _concatenate_coils,
+    _magnetic_dipole_field_jac,
     _magnetic_dipole_field_vec,
 )
 from ._field_interpolation import (
@@ -704,6 +704,35 @@ def _compute_mdfv(rrs, rmags, cosmags, ws, bins, too_close):
     return fwd, min_dist
 
 
+def _magnetic_dipole_field_jac(rr, moment, coils):
+    """Compute the field of a magnetic dipole and its positional derivatives.
+
+    Returns the gain (3, n_coils) as in :func:`_magnetic_dipole_field_vec`
+    along with the derivative of the field of the dipole with the given
+    moment with respect to its position (3, n_coils).
+    """
+    rmags, cosmags, ws, bins = _triage_coils(coils)
+    diff = rmags - rr
+    dist2 = np.sum(diff * diff, axis=1)[:, np.newaxis]
+    t = np.sum(diff * cosmags, axis=1)[:, np.newaxis]
+    md = np.dot(diff, moment)[:, np.newaxis]
+    mc = np.dot(cosmags, moment)[:, np.newaxis]
+    w5 = ws[:, np.newaxis] / (dist2 * dist2 * np.sqrt(dist2))
+    gain = w5 * (3 * diff * t - dist2 * cosmags)
+    # d/d(rr) = -d/d(diff) of w * (3 (m.d) (d.c) - |d|^2 (m.c)) / |d|^5
+    grad = -w5 * (
+        3 * (moment * t + cosmags * md)
+        - 2 * diff * mc
+        - 5 * (3 * md * t - dist2 * mc) / dist2 * diff
+    )
+    n_coils = bins[-1] + 1
+    out = np.array(
+        [np.bincount(bins, x, n_coils) for x in np.concatenate([gain, grad], 1).T]
+    )
+    out *= _MAG_FACTOR
+    return out[:3], out[3:]
+
+
 # #############################################################################
 # MAIN TRIAGING FUNCTION
 
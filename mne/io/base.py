@@ -70,7 +70,7 @@ from ..filter import (
 from ..html_templates import _get_html_template
 from ..parallel import parallel_func
 from ..time_frequency.spectrum import Spectrum, SpectrumMixin, _validate_method
-from ..time_frequency.tfr import RawTFR
+from ..time_frequency.tfr import RawTFR, _stream_raw_tfr
 from ..utils import (
     SizeMixin,
     TimeMixin,
@@ -254,6 +254,8 @@ class BaseRaw(
         if self._read_comp_grade is not None and len(info["comps"]):
             logger.info("Current compensation grade : %d", self._read_comp_grade)
         self._comp = None
+        # (mult, offset) of an ICA cleaning applied while reading, see ICA.apply
+        self._ica_op = None
         if filenames is None:
             filenames = [None] * len(first_samps)
         self.filenames = list(filenames)
@@ -337,6 +339,8 @@ class BaseRaw(
                     "Cannot change compensation on data where projectors have been "
                     "applied."
                 )
+            if self._ica_op is not None:
+                _check_preload(self, "Changing compensation after calling ICA.apply()")
             # Figure out what operator to use (varies depending on preload)
             from_comp = current_comp if self.preload else self._read_comp_grade
             comp = make_compensator(self.info, from_comp, grade)
@@ -437,6 +441,10 @@ class BaseRaw(
         else:
             mult = projector
         del projector, comp
+        if self._ica_op is not None:
+            ica_mult, ica_offset = self._ica_op
+            mult = ica_mult if mult is None else ica_mult @ mult
+            ica_offset = ica_offset[idx, np.newaxis]
 
         if mult is None:
             cals = cals[idx, np.newaxis]
@@ -484,6 +492,8 @@ class BaseRaw(
                 mult,
             )
             offset += n_read
+        if self._ica_op is not None:
+            data += ica_offset
         return data
 
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
@@ -601,7 +611,7 @@ class BaseRaw(
         self._data = self._read_segment(data_buffer=data_buffer)
         assert len(self._data) == self.info["nchan"]
         self.preload = True
-        self._comp = None  # no longer needed
+        self._comp = self._ica_op = None  # no longer needed
         self.close()
 
     @property
@@ -2102,6 +2112,12 @@ class BaseRaw(
                 preload = False
 
         if preload is False:
+            for r in raws:
+                if not _ica_op_equal(self._ica_op, r._ica_op):
+                    raise ValueError(
+                        "Raw instances with different ICA cleaning applied while "
+                        "reading cannot be concatenated without preloading"
+                    )
             if self.preload:
                 self._data = None
             self.preload = False
@@ -2319,6 +2335,16 @@ class BaseRaw(
         -----
         .. versionadded:: 1.2
 
+        When the data are not preloaded and ``method='welch'`` is used with
+        ``average='mean'``, the data are read from disk in blocks of whole Welch
+        segments that are averaged on the fly, so the memory needed does not
+        grow with the duration of the recording. Other values of ``average``
+        (including ``'median'``) need the spectra of all segments at once, so
+        the data are loaded as for preloaded data.
+
+        .. versionchanged:: 1.11
+           Added streaming computation for data that are not preloaded.
+
         References
         ----------
         .. footbibliography::
@@ -2357,6 +2383,8 @@ class BaseRaw(
         reject_by_annotation=True,
         decim=1,
         n_jobs=None,
+        out_fname=None,
+        overwrite=False,
         verbose=None,
         **method_kw,
     ):
@@ -2373,6 +2401,17 @@ class BaseRaw(
         %(reject_by_annotation_tfr)s
         %(decim_tfr)s
         %(n_jobs)s
+        out_fname : path-like | None
+            If not ``None``, the TFR is computed in chunks and the (decimated) power
+            is written directly to this file (which should end with ``-tfr.h5`` or
+            ``-tfr.hdf5``) instead of being held in memory; see Notes. Requires
+            ``output="power"`` and ``method="morlet"`` or ``method="multitaper"``.
+
+            .. versionadded:: 1.11
+        %(overwrite)s
+            Only used when ``out_fname`` is not ``None``.
+
+            .. versionadded:: 1.11
         %(verbose)s
         %(method_kw_tfr)s
 
@@ -2383,6 +2422,15 @@ class BaseRaw(
 
         Notes
         -----
+        When ``out_fname`` is given, the data are read in chunks (e.g., from a
+        recording that was not preloaded), each chunk padded on both sides by the
+        length of the longest wavelet so that the result does not depend on the
+        chunk boundaries. The returned object is memory-mapped from ``out_fname``,
+        as with ``mne.time_frequency.read_tfrs(out_fname, preload=False)``. With
+        ``reject_by_annotation=True``, each good data span is transformed
+        separately (as if it were a recording of its own), and samples within
+        ``bad`` annotations are represented with ``np.nan``.
+
         .. versionadded:: 1.7
 
         References
@@ -2390,6 +2438,24 @@ class BaseRaw(
         .. footbibliography::
         """
         _check_option("output", output, ("power", "phase", "complex"))
+        if out_fname is not None:
+            return _stream_raw_tfr(
+                self,
+                method,
+                freqs,
+                out_fname,
+                tmin=tmin,
+                tmax=tmax,
+                picks=picks,
+                proj=proj,
+                reject_by_annotation=reject_by_annotation,
+                decim=decim,
+                overwrite=overwrite,
+                n_jobs=n_jobs,
+                verbose=verbose,
+                output=output,
+                **method_kw,
+            )
         method_kw["output"] = output
         return RawTFR(
             self,
@@ -3137,6 +3203,12 @@ def _check_raw_compatibility(raw):
         raw[0].orig_format = "unknown"
 
 
+def _ica_op_equal(op_1, op_2):
+    if op_1 is None or op_2 is None:
+        return op_1 is op_2
+    return all(np.array_equal(a, b) for a, b in zip(op_1, op_2))
+
+
 @verbose
 def concatenate_raws(
     raws, preload=None, events_list=None, *, on_mismatch="raise", verbose=None
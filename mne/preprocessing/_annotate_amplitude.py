@@ -12,7 +12,13 @@ from ..annotations import (
 )
 from ..fixes import jit
 from ..io import BaseRaw
-from ..utils import _mask_to_onsets_offsets, _validate_type, logger, verbose
+from ..utils import (
+    _check_chunk_duration,
+    _mask_to_onsets_offsets,
+    _validate_type,
+    logger,
+    verbose,
+)
 
 
 @verbose
@@ -24,6 +30,7 @@ def annotate_amplitude(
     min_duration=0.005,
     picks=None,
     *,
+    chunk_duration=None,
     verbose=None,
 ):
     """Annotate raw data based on peak-to-peak amplitude.
@@ -68,6 +75,14 @@ def annotate_amplitude(
         For some systems, adjacent time samples with exactly the same value are
         not totally uncommon. Defaults to ``0.005`` (5 ms).
     %(picks_good_data)s
+    chunk_duration : float | None
+        If float, the data of all picked channels are read and processed in
+        consecutive chunks of this duration (in seconds) instead of one
+        channel type at a time over the whole recording, which keeps the
+        memory usage bounded for long recordings that are not preloaded.
+        The results are identical. Defaults to None.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -100,7 +115,8 @@ def annotate_amplitude(
 
     This function may perform faster if data is loaded in memory, as it
     loads data one channel type at a time (across all time points), which is
-    typically not an efficient way to read raw data from disk.
+    typically not an efficient way to read raw data from disk. For long
+    recordings that are not preloaded, use ``chunk_duration`` instead.
 
     .. versionadded:: 1.0
     """
@@ -117,6 +133,7 @@ def annotate_amplitude(
         min_duration, raw.times.size * 1 / raw.info["sfreq"]
     )
     min_duration_samples = int(np.round(min_duration * raw.info["sfreq"]))
+    n_chunk = _check_chunk_duration(chunk_duration, raw.info["sfreq"])
     bads = list()
 
     # grouping picks by channel types to avoid operating on each channel
@@ -130,6 +147,20 @@ def annotate_amplitude(
 
     # skip BAD_acq_skip sections
     onsets, ends = _annotations_starts_stops(raw, "bad_acq_skip", invert=True)
+    if n_chunk is not None:
+        any_flat, any_peak, bads = _find_ptp_chunked(
+            raw,
+            picks,
+            flat,
+            peak,
+            bad_percent,
+            onsets,
+            ends,
+            n_chunk,
+            min_duration_samples,
+        )
+        return _annotations_and_bads(raw, any_flat, any_peak, bads)
+
     index = np.concatenate(
         [np.arange(raw.times.size)[onset:end] for onset, end in zip(onsets, ends)]
     )
@@ -182,6 +213,11 @@ def annotate_amplitude(
             idx = index[np.where(peak_[peak_ch_to_annotate, :])[1]]
             any_peak[idx] = True
 
+    return _annotations_and_bads(raw, any_flat, any_peak, bads)
+
+
+def _annotations_and_bads(raw, any_flat, any_peak, bads):
+    """Create the annotations and the list of bad channel names."""
     # annotation for flat
     annotation_flat = _create_annotations(any_flat, "flat", raw)
     # annotation for peak
@@ -194,6 +230,119 @@ def annotate_amplitude(
     return annotations, bads
 
 
+def _find_ptp_chunked(
+    raw, picks, flat, peak, bad_percent, onsets, ends, n_chunk, min_duration_samples
+):
+    """Find segments below or above PTP threshold reading the data in chunks.
+
+    The good data (outside of BAD_acq_skip) is treated as one concatenated
+    signal as in annotate_amplitude, i.e. sample indices below are indices in
+    the discrete difference of this virtual signal. Only the sufficiently long
+    segments of each channel are kept, which are then used once the fraction
+    of bad time of each channel is known.
+    """
+    picks_all = np.concatenate(list(picks.values()))
+    kinds = dict()
+    if flat is not None:
+        kinds["flat"] = (np.less_equal, flat)
+    if peak is not None:
+        kinds["peak"] = (np.greater_equal, peak)
+    thresholds = {
+        kind: np.concatenate(
+            [np.full(len(picks_), ptp[ch_type]) for ch_type, picks_ in picks.items()]
+        )[:, np.newaxis]
+        for kind, (_, ptp) in kinds.items()
+    }
+    open_starts = {kind: np.full(len(picks_all), -1) for kind in kinds}
+    segments = {kind: [list() for _ in picks_all] for kind in kinds}
+
+    logger.info("Finding segments below or above PTP threshold in chunks.")
+    last = None
+    n_diff = 0
+    for onset, end in zip(onsets, ends):
+        for start in range(onset, end, n_chunk):
+            data = raw[picks_all, start : min(start + n_chunk, end)][0]
+            if last is not None:
+                data = np.concatenate([last, data], axis=1)
+            last = data[:, -1:]
+            diff = np.abs(np.diff(data, axis=1))
+            if diff.shape[1] == 0:
+                continue
+            for kind, (op, _) in kinds.items():
+                _update_segments(
+                    op(diff, thresholds[kind]),
+                    n_diff,
+                    open_starts[kind],
+                    segments[kind],
+                    min_duration_samples,
+                )
+            n_diff += diff.shape[1]
+
+    # size matching the diff a[i+1] - a[i]
+    any_ = {kind: np.zeros(len(raw.times) - 1, bool) for kind in ("flat", "peak")}
+    masks, means = dict(), dict()
+    for kind in kinds:
+        # close the segments still open at the end of the data
+        for k, seg_start in enumerate(open_starts[kind]):
+            if seg_start >= 0 and n_diff - seg_start >= min_duration_samples:
+                segments[kind][k].append(np.array([[seg_start], [n_diff]]))
+        segments[kind] = [
+            np.concatenate(segs, axis=1) if len(segs) else np.zeros((2, 0), int)
+            for segs in segments[kind]
+        ]
+        count = np.array([np.diff(segs, axis=0).sum() for segs in segments[kind]])
+        count[np.nonzero(count)] += 1  # offset by 1 due to diff
+        means[kind] = count / raw.times.size * 100
+        masks[kind] = np.zeros(n_diff, bool)
+
+    # same order as annotate_amplitude for the returned bads
+    bads = list()
+    offset = 0
+    for picks_ in picks.values():
+        sl = slice(offset, offset + len(picks_))
+        offset += len(picks_)
+        for kind in kinds:
+            mean = means[kind][sl]
+            bads.extend(picks_[np.where(mean >= bad_percent)[0]])
+            for k in np.where((0 < mean) & (mean < bad_percent))[0]:
+                for seg_start, seg_stop in segments[kind][sl.start + k].T:
+                    masks[kind][seg_start:seg_stop] = True
+
+    # convert from the concatenated good data to raw.times[:] - 1
+    for kind, mask in masks.items():
+        pos = 0
+        for onset, end in zip(onsets, ends):
+            n_seg = min(end - onset, n_diff - pos)
+            any_[kind][onset : onset + n_seg] |= mask[pos : pos + n_seg]
+            pos += end - onset
+    return any_["flat"], any_["peak"], bads
+
+
+def _update_segments(arr, offset, open_starts, segments, min_duration_samples):
+    """Accumulate the segments longer than the minimum duration of a chunk.
+
+    Segments reaching the end of the chunk are kept open in ``open_starts``
+    until the chunk in which they end.
+    """
+    n_times = arr.shape[1]
+    for k, ch in enumerate(arr):
+        starts, stops = _mask_to_onsets_offsets(ch)
+        starts, stops = starts + offset, stops + offset
+        if open_starts[k] >= 0:
+            if len(starts) and starts[0] == offset:
+                starts[0] = open_starts[k]
+            else:
+                starts = np.concatenate([[open_starts[k]], starts])
+                stops = np.concatenate([[offset], stops])
+            open_starts[k] = -1
+        if len(stops) and stops[-1] == offset + n_times:
+            open_starts[k] = starts[-1]
+            starts, stops = starts[:-1], stops[:-1]
+        keep = stops - starts >= min_duration_samples
+        if keep.any():
+            segments[k].append(np.array([starts[keep], stops[keep]]))
+
+
 def _check_ptp(ptp, name, info, picks):
     """Check the PTP threhsold argument, and converts it to dict if needed."""
     _validate_type(ptp, ("numeric", dict, None))
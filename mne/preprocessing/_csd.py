@@ -18,10 +18,19 @@ from .._fiff.constants import FIFF
 from .._fiff.pick import pick_types
 from ..bem import fit_sphere_to_headshape
 from ..channels.interpolation import _calc_g, _calc_h
-from ..epochs import BaseEpochs, make_fixed_length_epochs
+from ..epochs import BaseEpochs, Epochs, make_fixed_length_epochs
+from ..event import make_fixed_length_events
 from ..evoked import Evoked
+from ..filter import create_filter
 from ..io import BaseRaw
-from ..utils import _check_preload, _ensure_int, _validate_type, logger, verbose
+from ..utils import (
+    _check_chunk_duration,
+    _check_preload,
+    _ensure_int,
+    _validate_type,
+    logger,
+    verbose,
+)
 
 
 def _prepare_G(G, lambda2):
@@ -204,6 +213,8 @@ def compute_bridged_electrodes(
     h_freq=30,
     epoch_duration=2,
     bw_method=None,
+    *,
+    chunk_duration=None,
     verbose=None,
 ):
     r"""Compute bridged EEG electrodes using the intrinsic Hjorth algorithm.
@@ -243,6 +254,14 @@ def compute_bridged_electrodes(
         :class:`mne.io.BaseRaw`. The default is 2 seconds.
     bw_method : None
         ``bw_method`` to pass to :class:`scipy.stats.gaussian_kde`.
+    chunk_duration : float | None
+        If float and ``inst`` is a :class:`~mne.io.Raw` instance that is not
+        preloaded, the data are read and filtered in consecutive chunks of
+        this duration (in seconds) plus the padding required by the filter,
+        so that the whole recording never needs to be in memory. Defaults to
+        None.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -255,39 +274,47 @@ def compute_bridged_electrodes(
 
     Notes
     -----
+    The electrical distances of all pairs are computed at once from the
+    covariance matrix :math:`C` of each epoch as
+    :math:`C_{ii} + C_{jj} - 2 C_{ij}` (in single precision).
+
     .. versionadded:: 1.1
 
     References
     ----------
     .. footbibliography::
     """
-    _check_preload(inst, "Computing bridged electrodes")
-    inst = inst.copy()  # don't modify original
+    n_chunk = _check_chunk_duration(chunk_duration, inst.info["sfreq"])
+    chunked = n_chunk is not None and isinstance(inst, BaseRaw) and not inst.preload
+    if not chunked:
+        _check_preload(inst, "Computing bridged electrodes")
     picks = pick_types(inst.info, eeg=True)
     if len(picks) == 0:
         raise RuntimeError("No EEG channels found, cannot compute electrode bridging")
-    # first, filter
-    inst.filter(l_freq=l_freq, h_freq=h_freq, picks=picks, verbose=False)
-
-    if isinstance(inst, BaseRaw):
-        inst = make_fixed_length_epochs(
-            inst, duration=epoch_duration, preload=True, verbose=False
+    ch_names = inst.ch_names
+    if chunked:
+        blocks = _iter_bridged_epochs_chunked(
+            inst, picks, l_freq, h_freq, epoch_duration, n_chunk
         )
-
-    # standardize shape
-    data = inst.get_data(picks=picks)
-    if isinstance(inst, Evoked):
-        data = data[np.newaxis, ...]  # expand evoked
-
-    # next, compute electrical distance matrix, upper triangular
-    n_epochs = data.shape[0]
-    ed_matrix = np.zeros((n_epochs, picks.size, picks.size)) * np.nan
-    for i in range(picks.size):
-        for j in range(i + 1, picks.size):
-            ed_matrix[:, i, j] = np.var(data[:, i] - data[:, j], axis=1)
-
-    # scale, fill in other half, diagonal
-    ed_matrix *= 1e12  # scale to muV**2
+    else:
+        inst = inst.copy()  # don't modify original
+        # first, filter
+        inst.filter(l_freq=l_freq, h_freq=h_freq, picks=picks, verbose=False)
+
+        if isinstance(inst, BaseRaw):
+            inst = make_fixed_length_epochs(
+                inst, duration=epoch_duration, preload=True, verbose=False
+            )
+
+        # standardize shape
+        data = inst.get_data(picks=picks)
+        if isinstance(inst, Evoked):
+            data = data[np.newaxis, ...]  # expand evoked
+        blocks = (data,)
+
+    # next, compute electrical distance matrix (in muV**2), upper triangular
+    ed_matrix = np.concatenate([_electrical_distance(block) for block in blocks])
+    n_epochs = ed_matrix.shape[0]
 
     # initialize bridged indices
     bridged_idx = list()
@@ -309,15 +336,68 @@ def compute_bridged_electrodes(
 
     # find electrodes that are below the cutoff local minimum on
     # `epochs_threshold` proportion of epochs
-    for i in range(picks.size):
-        for j in range(i + 1, picks.size):
-            bridged_count = np.sum(ed_matrix[:, i, j] < local_minimum)
-            if bridged_count / n_epochs > epoch_threshold:
-                logger.info(
-                    "Bridge detected between "
-                    f"{inst.ch_names[picks[i]]} and "
-                    f"{inst.ch_names[picks[j]]}"
-                )
-                bridged_idx.append((picks[i], picks[j]))
+    bridged_count = np.sum(ed_matrix < local_minimum, axis=0)
+    for i, j in zip(*np.nonzero(bridged_count / n_epochs > epoch_threshold)):
+        logger.info(
+            f"Bridge detected between {ch_names[picks[i]]} and {ch_names[picks[j]]}"
+        )
+        bridged_idx.append((picks[i], picks[j]))
 
     return bridged_idx, ed_matrix
+
+
+# number of values processed at once when computing electrical distances
+_ED_BLOCK_SIZE = 10_000_000
+
+
+def _electrical_distance(data):
+    """Compute the variance of the pairwise channel differences of each epoch.
+
+    var(a - b) = var(a) + var(b) - 2 cov(a, b) is obtained from the covariance
+    matrix of each epoch, computed in float32 on blocks of epochs.
+    """
+    n_epochs, n_channels, n_times = data.shape
+    ed_matrix = np.full((n_epochs, n_channels, n_channels), np.nan)
+    ii, jj = np.triu_indices(n_channels, 1)
+    n_block = max(_ED_BLOCK_SIZE // (n_channels * max(n_channels, n_times)), 1)
+    for start in range(0, n_epochs, n_block):
+        block = data[start : start + n_block]
+        block = block - block.mean(axis=-1, keepdims=True)
+        block = (block * 1e6).astype(np.float32)  # scale to muV
+        cov = block @ block.transpose(0, 2, 1)
+        cov /= n_times
+        var = np.diagonal(cov, axis1=1, axis2=2)
+        ed = var[:, ii] + var[:, jj] - 2 * cov[:, ii, jj]
+        ed_matrix[start : start + n_block, ii, jj] = np.maximum(ed, 0)
+    return ed_matrix
+
+
+def _iter_bridged_epochs_chunked(raw, picks, l_freq, h_freq, epoch_duration, n_chunk):
+    """Yield the filtered fixed-length epochs of a raw instance chunk by chunk."""
+    sfreq = raw.info["sfreq"]
+    # samples affected by the edges of each filtered chunk
+    n_pad = len(create_filter(None, sfreq, l_freq, h_freq, verbose=False))
+    events = make_fixed_length_events(raw, duration=epoch_duration)
+    rel = events[:, 0] - raw.first_samp
+    n_epoch = int(np.round(epoch_duration * sfreq))
+    splits = np.flatnonzero(np.diff(rel // n_chunk)) + 1
+    logger.info(f"Reading and filtering the data in {len(splits) + 1} chunks")
+    for block in np.split(events, splits):
+        read_start = max(block[0, 0] - raw.first_samp - n_pad, 0)
+        read_stop = min(block[-1, 0] - raw.first_samp + n_epoch + n_pad, raw.n_times)
+        raw_chunk = raw.copy().crop(
+            read_start / sfreq, (read_stop - 1) / sfreq, include_tmax=True
+        )
+        raw_chunk.load_data(verbose=False)
+        raw_chunk.filter(l_freq=l_freq, h_freq=h_freq, picks=picks, verbose=False)
+        epochs = Epochs(
+            raw_chunk,
+            block,
+            event_id=[1],
+            tmin=0,
+            tmax=epoch_duration - 1.0 / sfreq,
+            baseline=None,
+            preload=True,
+            verbose=False,
+        )
+        yield epochs.get_data(picks=picks)
@@ -7,8 +7,17 @@
 import numpy as np
 
 from .._fiff.pick import _picks_to_idx
+from ..annotations import Annotations, _adjust_onset_meas_date
 from ..io.base import BaseRaw
-from ..utils import _soft_import, _validate_type, logger, verbose
+from ..utils import (
+    _check_option,
+    _mask_to_onsets_offsets,
+    _pl,
+    _soft_import,
+    _validate_type,
+    logger,
+    verbose,
+)
 
 
 @verbose
@@ -20,6 +29,9 @@ def find_bad_channels_lof(
     metric="euclidean",
     threshold=1.5,
     return_scores=False,
+    features="data",
+    window_duration=1.0,
+    return_annotations=False,
     verbose=None,
 ):
     """Find bad channels using Local Outlier Factor (LOF) algorithm.
@@ -42,6 +54,29 @@ def find_bad_channels_lof(
     return_scores : bool
         If ``True``, return a dictionary with LOF scores for each
         evaluated channel. Default is ``False``.
+    features : ``'data'`` | ``'summary'``
+        The per-channel features the LOF operates on. ``'data'`` (default)
+        uses the full time series of each channel. ``'summary'`` reads the
+        data in consecutive windows of ``window_duration`` and computes, in
+        each window, the log-variance, the mean absolute correlation with
+        the other channels, and the fraction of power in the upper half of
+        the spectrum of each channel. These features are robustly
+        standardized across channels and their median across windows is
+        used, which scales to long recordings that are not preloaded.
+
+        .. versionadded:: 1.11
+    window_duration : float
+        Duration of the windows (in seconds) used when
+        ``features='summary'``. Default is ``1.0``.
+
+        .. versionadded:: 1.11
+    return_annotations : bool
+        If ``True`` (requires ``features='summary'``), the LOF is also
+        computed in each window and the channels that are outliers in a
+        window are annotated as ``'BAD_lof'`` for the duration of that
+        window (consecutive windows are merged). Default is ``False``.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -51,6 +86,9 @@ def find_bad_channels_lof(
     scores : ndarray, shape (n_picks,)
         Only returned when ``return_scores`` is ``True``. It contains the
         LOF outlier score for each channel in ``picks``.
+    annotations : instance of Annotations
+        Only returned when ``return_annotations`` is ``True``. The
+        channel-specific ``'BAD_lof'`` annotations of each channel.
 
     See Also
     --------
@@ -82,9 +120,27 @@ def find_bad_channels_lof(
         raise ValueError(
             f"Need exactly one channel type in picks, got {sorted(picked_ch_types)}"
         )
+    _check_option("features", features, ("data", "summary"))
+    _validate_type(return_annotations, bool, "return_annotations")
+    if return_annotations and features != "summary":
+        raise ValueError(
+            "return_annotations=True requires features='summary', got "
+            f"features={repr(features)}."
+        )
     ch_names = [raw.ch_names[pick] for pick in picks]
-    data = raw.get_data(picks=picks)
     clf = LocalOutlierFactor(n_neighbors=n_neighbors, metric=metric)
+    if features == "data":
+        data = raw.get_data(picks=picks)
+    else:
+        _validate_type(window_duration, "numeric", "window_duration")
+        n_window = int(np.round(window_duration * raw.info["sfreq"]))
+        if n_window < 2:
+            raise ValueError(
+                "window_duration must span at least 2 samples, got "
+                f"{window_duration} s ({n_window} samples)."
+            )
+        window_features = _lof_window_features(raw, picks, n_window)
+        data = _robust_standardize(np.median(window_features, axis=0))
     clf.fit_predict(data)
     scores_lof = clf.negative_outlier_factor_
     bad_channel_indices = [
@@ -92,7 +148,83 @@ def find_bad_channels_lof(
     ]
     bads = [ch_names[idx] for idx in bad_channel_indices]
     logger.info(f"LOF: Detected bad channel(s): {bads}")
+    out = (bads,)
     if return_scores:
-        return bads, scores_lof
-    else:
-        return bads
+        out += (scores_lof,)
+    if return_annotations:
+        out += (
+            _lof_annotations(raw, window_features, ch_names, n_window, clf, threshold),
+        )
+    return out[0] if len(out) == 1 else out
+
+
+# number of values (channels x samples) read at once for the summary features
+_LOF_BLOCK_SIZE = 10_000_000
+
+
+def _lof_window_features(raw, picks, n_window):
+    """Compute the summary features of each channel in each window."""
+    n_windows = raw.n_times // n_window
+    if n_windows == 0:
+        raise ValueError(
+            f"window_duration ({n_window} samples) is longer than the data "
+            f"({raw.n_times} samples)."
+        )
+    n_per_block = max(_LOF_BLOCK_SIZE // (len(picks) * n_window), 1)
+    taper = np.hanning(n_window)
+    tiny = np.finfo(np.float64).tiny
+    window_features = np.empty((n_windows, len(picks), 3))
+    logger.info(f"Computing LOF summary features in {n_windows} window{_pl(n_windows)}")
+    for first in range(0, n_windows, n_per_block):
+        last = min(first + n_per_block, n_windows)
+        data = raw.get_data(picks, start=first * n_window, stop=last * n_window)
+        data = data.reshape(len(picks), last - first, n_window).transpose(1, 0, 2)
+        data -= data.mean(axis=-1, keepdims=True)
+        # log-variance
+        var = np.mean(data * data, axis=-1)
+        window_features[first:last, :, 0] = np.log10(np.maximum(var, tiny))
+        # mean absolute correlation with the other channels
+        norm = np.sqrt(var * n_window)
+        normed = data / np.where(norm > 0, norm, 1.0)[..., np.newaxis]
+        corr = np.abs(normed @ normed.transpose(0, 2, 1))
+        window_features[first:last, :, 1] = (corr.sum(axis=-1) - 1) / max(
+            len(picks) - 1, 1
+        )
+        # fraction of power in the upper half of the spectrum
+        power = np.abs(np.fft.rfft(data * taper, axis=-1)) ** 2
+        total = power.sum(axis=-1)
+        high = power[..., power.shape[-1] // 2 :].sum(axis=-1)
+        window_features[first:last, :, 2] = high / np.where(total > 0, total, 1.0)
+    return window_features
+
+
+def _robust_standardize(features):
+    """Standardize features across channels (axis -2) using the median/MAD."""
+    median = np.median(features, axis=-2, keepdims=True)
+    mad = 1.4826 * np.median(np.abs(features - median), axis=-2, keepdims=True)
+    return (features - median) / np.where(mad > 0, mad, 1.0)
+
+
+def _lof_annotations(raw, window_features, ch_names, n_window, clf, threshold):
+    """Annotate the channels that are outliers in each window."""
+    window_features = _robust_standardize(window_features)
+    bad_windows = np.zeros((len(ch_names), len(window_features)), bool)
+    for wi, features in enumerate(window_features):
+        clf.fit_predict(features)
+        bad_windows[:, wi] = np.abs(clf.negative_outlier_factor_) >= threshold
+    onsets, durations, ch_names_annot = list(), list(), list()
+    for ch_name, mask in zip(ch_names, bad_windows):
+        starts, stops = _mask_to_onsets_offsets(mask)
+        onsets.extend(np.asarray(starts) * n_window / raw.info["sfreq"])
+        durations.extend((np.asarray(stops) - starts) * n_window / raw.info["sfreq"])
+        ch_names_annot.extend([(ch_name,)] * len(starts))
+    annotations = Annotations(
+        onsets,
+        durations,
+        ["BAD_lof"] * len(onsets),
+        orig_time=raw.info["meas_date"],
+        ch_names=ch_names_annot,
+    )
+    _adjust_onset_meas_date(annotations, raw)
+    order = np.argsort(annotations.onset, kind="stable")
+    return annotations[order]
@@ -4,6 +4,7 @@
 
 import numpy as np
 
+from ..fixes import has_numba, jit
 from ..utils import _pl, logger, verbose
 
 
@@ -81,11 +82,6 @@ def peak_finder(x0, thresh=None, extrema=1, verbose=None):
     min_mag = np.min(x)
 
     if length > 2:  # Function with peaks and valleys
-        # Set initial parameters for loop
-        temp_mag = min_mag
-        found_peak = False
-        left_min = min_mag
-
         # Deal with first point a little differently since tacked it on
         # Calculate the sign of the derivative since we took the first point
         # on it does not necessarily alternate like the rest.
@@ -95,66 +91,17 @@ def peak_finder(x0, thresh=None, extrema=1, verbose=None):
             if signDx[0] == signDx[1]:  # Want alternating signs
                 x = np.concatenate((x[:1], x[2:]))
                 ind = np.concatenate((ind[:1], ind[2:]))
-                length -= 1
 
         else:  # First point is smaller than the second
             ii = 0
             if signDx[0] == signDx[1]:  # Want alternating signs
                 x = x[1:]
                 ind = ind[1:]
-                length -= 1
-
-        # Preallocate max number of maxima
-        maxPeaks = int(np.ceil(length / 2.0))
-        peak_loc = np.zeros(maxPeaks, dtype=np.int64)
-        peak_mag = np.zeros(maxPeaks)
-        c_ind = 0
-        # Loop through extrema which should be peaks and then valleys
-        while ii < (length - 1):
-            ii += 1  # This is a peak
-            # Reset peak finding if we had a peak and the next peak is bigger
-            # than the last or the left min was small enough to reset.
-            if found_peak and (
-                (x[ii] > peak_mag[-1]) or (left_min < peak_mag[-1] - thresh)
-            ):
-                temp_mag = min_mag
-                found_peak = False
-
-            # Make sure we don't iterate past the length of our vector
-            if ii == length - 1:
-                break  # We assign the last point differently out of the loop
-
-            # Found new peak that was lager than temp mag and threshold larger
-            # than the minimum to its left.
-            if (x[ii] > temp_mag) and (x[ii] > left_min + thresh):
-                temp_loc = ii
-                temp_mag = x[ii]
-
-            ii += 1  # Move onto the valley
-            # Come down at least thresh from peak
-            if not found_peak and (temp_mag > (thresh + x[ii])):
-                found_peak = True  # We have found a peak
-                left_min = x[ii]
-                peak_loc[c_ind] = temp_loc  # Add peak to index
-                peak_mag[c_ind] = temp_mag
-                c_ind += 1
-            elif x[ii] < left_min:  # New left minima
-                left_min = x[ii]
-
-        # Check end point
-        if (x[-1] > temp_mag) and (x[-1] > (left_min + thresh)):
-            peak_loc[c_ind] = length - 1
-            peak_mag[c_ind] = x[-1]
-            c_ind += 1
-        elif not found_peak and temp_mag > min_mag:
-            # Check if we still need to add the last point
-            peak_loc[c_ind] = temp_loc
-            peak_mag[c_ind] = temp_mag
-            c_ind += 1
 
-        # Create output
-        peak_inds = ind[peak_loc[:c_ind]]
-        peak_mags = peak_mag[:c_ind]
+        peak_loc, peak_mags = _peak_finder_loop(
+            x.astype(np.float64), ii, float(thresh), float(min_mag)
+        )
+        peak_inds = ind[peak_loc]
     else:  # This is a monotone function where an endpoint is the only peak
         x_ind = np.argmax(x)
         peak_mags = x[x_ind]
@@ -182,3 +129,66 @@ def peak_finder(x0, thresh=None, extrema=1, verbose=None):
         logger.info(f"Found {len(peak_inds)} significant peak{_pl(peak_inds)}")
 
     return peak_inds, peak_mags
+
+
+def _peak_finder_loop_fallback(x, ii, thresh, min_mag):
+    """Loop through extrema which should be peaks and then valleys."""
+    length = x.size
+    # Preallocate max number of maxima
+    max_peaks = int(np.ceil(length / 2.0))
+    peak_loc = np.zeros(max_peaks, dtype=np.int64)
+    peak_mag = np.zeros(max_peaks)
+    c_ind = 0
+    # Set initial parameters for loop
+    temp_mag = min_mag
+    temp_loc = 0
+    found_peak = False
+    left_min = min_mag
+    while ii < (length - 1):
+        ii += 1  # This is a peak
+        # Reset peak finding if we had a peak and the next peak is bigger
+        # than the last or the left min was small enough to reset.
+        if found_peak and (
+            (x[ii] > peak_mag[-1]) or (left_min < peak_mag[-1] - thresh)
+        ):
+            temp_mag = min_mag
+            found_peak = False
+
+        # Make sure we don't iterate past the length of our vector
+        if ii == length - 1:
+            break  # We assign the last point differently out of the loop
+
+        # Found new peak that was lager than temp mag and threshold larger
+        # than the minimum to its left.
+        if (x[ii] > temp_mag) and (x[ii] > left_min + thresh):
+            temp_loc = ii
+            temp_mag = x[ii]
+
+        ii += 1  # Move onto the valley
+        # Come down at least thresh from peak
+        if not found_peak and (temp_mag > (thresh + x[ii])):
+            found_peak = True  # We have found a peak
+            left_min = x[ii]
+            peak_loc[c_ind] = temp_loc  # Add peak to index
+            peak_mag[c_ind] = temp_mag
+            c_ind += 1
+        elif x[ii] < left_min:  # New left minima
+            left_min = x[ii]
+
+    # Check end point
+    if (x[-1] > temp_mag) and (x[-1] > (left_min + thresh)):
+        peak_loc[c_ind] = length - 1
+        peak_mag[c_ind] = x[-1]
+        c_ind += 1
+    elif not found_peak and temp_mag > min_mag:
+        # Check if we still need to add the last point
+        peak_loc[c_ind] = temp_loc
+        peak_mag[c_ind] = temp_mag
+        c_ind += 1
+    return peak_loc[:c_ind], peak_mag[:c_ind]
+
+
+if has_numba:
+    _peak_finder_loop = jit()(_peak_finder_loop_fallback)
+else:  # pragma: no cover
+    _peak_finder_loop = _peak_finder_loop_fallback
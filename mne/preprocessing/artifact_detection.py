@@ -14,7 +14,7 @@ from ..annotations import (
     _annotations_starts_stops,
     annotations_from_events,
 )
-from ..filter import filter_data
+from ..filter import _my_hilbert, create_filter, filter_data, next_fast_len
 from ..io.base import BaseRaw
 from ..transforms import (
     Transform,
@@ -25,6 +25,7 @@ from ..transforms import (
     quat_to_rot,
 )
 from ..utils import (
+    _check_chunk_duration,
     _check_option,
     _mask_to_onsets_offsets,
     _pl,
@@ -43,6 +44,8 @@ def annotate_muscle_zscore(
     min_length_good=0.1,
     filter_freq=(110, 140),
     n_jobs=None,
+    *,
+    chunk_duration=None,
     verbose=None,
 ):
     """Create annotations for segments that likely contain muscle artifacts.
@@ -76,6 +79,17 @@ def annotate_muscle_zscore(
         The lower and upper frequencies of the band-pass filter.
         Default is ``(110, 140)``.
     %(n_jobs)s
+    chunk_duration : float | None
+        If float, the data are read, filtered and Hilbert transformed in
+        consecutive chunks of this duration (in seconds), so that ``raw``
+        does not need to be preloaded and the memory usage stays bounded for
+        long recordings. The data are then processed twice, first to estimate
+        the mean and standard deviation of the envelope of each channel, and
+        then to compute the z-scores. Chunks are padded to avoid edge effects,
+        so the scores closely match those obtained with the default of
+        ``None``, which processes the whole recording at once.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -89,6 +103,7 @@ def annotate_muscle_zscore(
     ----------
     .. footbibliography::
     """
+    n_chunk = _check_chunk_duration(chunk_duration, raw.info["sfreq"])
     raw_copy = raw.copy()
 
     if ch_type is None:
@@ -108,25 +123,30 @@ def annotate_muscle_zscore(
     else:
         _check_option("ch_type", ch_type, ["mag", "grad", "eeg"])
     raw_copy.pick(ch_type)
+    sfreq = raw_copy.info["sfreq"]
 
-    raw_copy.filter(
-        filter_freq[0],
-        filter_freq[1],
-        fir_design="firwin",
-        pad="reflect_limited",
-        n_jobs=n_jobs,
-    )
-    raw_copy.apply_hilbert(envelope=True, n_jobs=n_jobs)
+    if n_chunk is None:
+        raw_copy.filter(
+            filter_freq[0],
+            filter_freq[1],
+            fir_design="firwin",
+            pad="reflect_limited",
+            n_jobs=n_jobs,
+        )
+        raw_copy.apply_hilbert(envelope=True, n_jobs=n_jobs)
 
-    data = raw_copy.get_data(reject_by_annotation="NaN")
-    nan_mask = ~np.isnan(data[0])
-    sfreq = raw_copy.info["sfreq"]
+        data = raw_copy.get_data(reject_by_annotation="NaN")
+        nan_mask = ~np.isnan(data[0])
 
-    art_scores = zscore(data[:, nan_mask], axis=1)
-    art_scores = art_scores.sum(axis=0) / np.sqrt(art_scores.shape[0])
+        art_scores = zscore(data[:, nan_mask], axis=1)
+        art_scores = art_scores.sum(axis=0) / np.sqrt(art_scores.shape[0])
+    else:
+        nan_mask, art_scores = _muscle_scores_chunked(
+            raw_copy, filter_freq, n_chunk, n_jobs
+        )
     art_scores = filter_data(art_scores, sfreq, None, 4)
 
-    scores_muscle = np.zeros(data.shape[1])
+    scores_muscle = np.zeros(nan_mask.size)
     scores_muscle[nan_mask] = art_scores
 
     art_mask = scores_muscle > threshold
@@ -149,6 +169,68 @@ def annotate_muscle_zscore(
     return annot, scores_muscle
 
 
+def _muscle_scores_chunked(raw, filter_freq, n_chunk, n_jobs):
+    """Compute the summed z-scores of the envelopes of the good samples in chunks."""
+    n_channels = len(raw.ch_names)
+    # samples kept by raw.get_data(reject_by_annotation="NaN")
+    good = np.ones(raw.n_times, bool)
+    for onset, end in zip(*_annotations_starts_stops(raw, ["BAD"])):
+        good[onset:end] = False
+
+    # first pass: combine the mean and sum of squared deviations of the chunks
+    count, mean, m2 = 0, np.zeros(n_channels), np.zeros(n_channels)
+    for start, stop, env in _iter_envelope_chunks(raw, filter_freq, n_chunk, n_jobs):
+        env = env[:, good[start:stop]]
+        if env.shape[1] == 0:
+            continue
+        chunk_mean = env.mean(axis=1)
+        delta = chunk_mean - mean
+        total = count + env.shape[1]
+        mean += delta * (env.shape[1] / total)
+        m2 += ((env - chunk_mean[:, np.newaxis]) ** 2).sum(axis=1)
+        m2 += delta**2 * (count * env.shape[1] / total)
+        count = total
+    std = np.sqrt(m2 / count)
+
+    # second pass: z-score and sum across channels
+    scores = np.zeros(raw.n_times)
+    for start, stop, env in _iter_envelope_chunks(raw, filter_freq, n_chunk, n_jobs):
+        env -= mean[:, np.newaxis]
+        env /= std[:, np.newaxis]
+        scores[start:stop] = env.sum(axis=0) / np.sqrt(n_channels)
+    return good, scores[good]
+
+
+def _iter_envelope_chunks(raw, filter_freq, n_chunk, n_jobs):
+    """Iterate over chunks of the band-pass filtered envelope of the data.
+
+    Like raw.filter, each segment between "edge" and "bad_acq_skip"
+    annotations is filtered separately. Chunks are read with enough padding
+    for the filter and the Hilbert transform, which is then discarded.
+    """
+    sfreq = raw.info["sfreq"]
+    h = create_filter(None, sfreq, *filter_freq, fir_design="firwin", verbose=False)
+    n_pad = len(h) + int(sfreq)
+    onsets, ends = _annotations_starts_stops(raw, ("edge", "bad_acq_skip"), invert=True)
+    for onset, end in zip(onsets, ends):
+        for start in range(onset, end, n_chunk):
+            stop = min(start + n_chunk, end)
+            read_start, read_stop = max(start - n_pad, onset), min(stop + n_pad, end)
+            data = raw[:, read_start:read_stop][0]
+            data = filter_data(
+                data,
+                sfreq,
+                *filter_freq,
+                fir_design="firwin",
+                pad="reflect_limited",
+                n_jobs=n_jobs,
+                verbose=False,
+            )
+            n_fft = next_fast_len(data.shape[1])
+            env = _my_hilbert(data, n_fft=n_fft, envelope=True)
+            yield start, stop, env[:, start - read_start : stop - read_start]
+
+
 def annotate_movement(
     raw,
     pos,
@@ -66,15 +66,8 @@ def ctps(data, is_raw=True):
     else:
         phase_angles = data  # phase angles can be computed externally
 
-    # initialize array for results
-    ks_dynamics = np.zeros_like(phase_angles[0])
-    pk_dynamics = np.zeros_like(phase_angles[0])
-
-    # calculate Kuiper's statistic for each source
-    for ii, source in enumerate(np.transpose(phase_angles, [1, 0, 2])):
-        ks, pk = kuiper(source)
-        pk_dynamics[ii, :] = pk
-        ks_dynamics[ii, :] = ks
+    # calculate Kuiper's statistic for all sources at once
+    ks_dynamics, pk_dynamics = kuiper(phase_angles)
 
     return ks_dynamics, pk_dynamics, phase_angles if is_raw else None
 
@@ -84,8 +77,8 @@ def kuiper(data, dtype=np.float64):  # noqa: D401
 
     Parameters
     ----------
-    data : ndarray, shape (n_sources,) | (n_sources, n_times)
-           Empirical distribution.
+    data : ndarray, shape (n_trials,) | (n_trials, ...)
+           Empirical distribution, with trials along the first axis.
     dtype : str | obj
         The data type to be used.
 
@@ -107,8 +100,8 @@ def kuiper(data, dtype=np.float64):  # noqa: D401
     j1 = (np.arange(n_trials, dtype=dtype) + 1.0) / float(n_trials)
     j2 = np.arange(n_trials, dtype=dtype) / float(n_trials)
     if n_dim > 1:  # single phase vector (n_trials)
-        j1 = j1[:, np.newaxis]
-        j2 = j2[:, np.newaxis]
+        j1 = j1.reshape((n_trials,) + (1,) * (n_dim - 1))
+        j2 = j2.reshape((n_trials,) + (1,) * (n_dim - 1))
     d1 = (j1 - data).max(axis=0)
     d2 = (data - j2).max(axis=0)
     n_eff = n_trials
@@ -123,8 +116,8 @@ def _prob_kuiper(d, n_eff, dtype="f8"):
 
     Parameters
     ----------
-    d : float
-        The kuiper distance value.
+    d : float | ndarray
+        The kuiper distance value(s).
     n_eff : int
         The effective number of elements.
     dtype : str | obj
@@ -143,14 +136,13 @@ def _prob_kuiper(d, n_eff, dtype="f8"):
     [2] Kuiper NH 1962. Proceedings of the Koninklijke Nederlands Akademie
     van Wetenschappen, ser Vol 63 pp 38-47
     """
-    n_time_slices = np.size(d)  # single value or vector
     n_points = 100
 
     en = math.sqrt(n_eff)
-    k_lambda = (en + 0.155 + 0.24 / en) * d  # see [1]
+    k_lambda = (en + 0.155 + 0.24 / en) * np.atleast_1d(d)  # see [1]
     l2 = k_lambda**2.0
     j2 = (np.arange(n_points) + 1) ** 2
-    j2 = j2.repeat(n_time_slices).reshape(n_points, n_time_slices)
+    j2 = j2.reshape((n_points,) + (1,) * l2.ndim)
     fact = 4.0 * j2 * l2 - 1.0
 
     # compute normalized pK value in range [0,1]
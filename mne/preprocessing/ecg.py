@@ -11,7 +11,7 @@ from ..epochs import BaseEpochs, Epochs
 from ..evoked import Evoked
 from ..filter import filter_data
 from ..io import BaseRaw, RawArray
-from ..utils import int_like, logger, sum_squared, verbose, warn
+from ..utils import int_like, logger, verbose, warn
 
 
 @verbose
@@ -99,23 +99,17 @@ def qrs_detector(
     clean_events = list()
     for thresh_value in thresh_runs:
         thresh1 = init_max * thresh_value
-        numcross = list()
-        time = list()
-        rms = list()
-        ii = 0
-        while ii < (n_points - win_size):
-            window = ecg_abs[ii : ii + win_size]
-            if window[0] > thresh1:
-                max_time = np.argmax(window)
-                time.append(ii + max_time)
-                nx = np.sum(
-                    np.diff(((window > thresh1).astype(np.int64) == 1).astype(int))
-                )
-                numcross.append(nx)
-                rms.append(np.sqrt(sum_squared(window) / window.size))
-                ii += win_size
-            else:
-                ii += 1
+        # windows start at supra-threshold samples, skipping win_size samples
+        # after each window
+        starts = _get_window_starts(
+            np.flatnonzero(ecg_abs[: max(n_points - win_size, 0)] > thresh1),
+            win_size,
+        )
+        windows = ecg_abs[starts[:, np.newaxis] + np.arange(win_size)]
+        time = list(starts + np.argmax(windows, axis=1))
+        # sum of the diff of the supra-threshold mask, which starts above
+        numcross = list((windows[:, -1] > thresh1).astype(int) - 1)
+        rms = list(np.sqrt(np.sum(windows * windows, axis=1) / win_size))
 
         if len(rms) == 0:
             rms.append(0.0)
@@ -154,6 +148,16 @@ def qrs_detector(
     return clean_events
 
 
+def _get_window_starts(candidates, win_size):
+    """Get the starts of non-overlapping windows from sorted candidate starts."""
+    starts = list()
+    ii = 0
+    while ii < len(candidates):
+        starts.append(candidates[ii])
+        ii = np.searchsorted(candidates, candidates[ii] + win_size)
+    return np.array(starts, int)
+
+
 @verbose
 def find_ecg_events(
     raw,
@@ -119,24 +119,19 @@ def _find_eog_events(
     # hardcode verbose=False to suppress filter param messages (since this
     # filter is not under user control)
     fmax = np.minimum(45, sampling_rate / 2.0 - 0.75)  # protect Nyquist
-    filteog = np.array(
-        [
-            filter_data(
-                x,
-                sampling_rate,
-                2,
-                fmax,
-                None,
-                filter_length,
-                0.5,
-                0.5,
-                phase="zero-double",
-                fir_window="hann",
-                fir_design="firwin2",
-                verbose=False,
-            )
-            for x in eog
-        ]
+    filteog = filter_data(
+        eog,
+        sampling_rate,
+        2,
+        fmax,
+        None,
+        filter_length,
+        0.5,
+        0.5,
+        phase="zero-double",
+        fir_window="hann",
+        fir_design="firwin2",
+        verbose=False,
     )
     temp = np.sqrt(np.sum(filteog**2, axis=1))
     indexmax = np.argmax(temp)
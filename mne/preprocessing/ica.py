@@ -84,6 +84,7 @@ from ..utils import (
     logger,
     pinv,
     repr_html,
+    use_log_level,
     verbose,
     warn,
 )
@@ -127,6 +128,75 @@ def _make_xy_sfunc(func, ndim_output=False):
     return sfunc
 
 
+# Approximate size of the chunks of Raw data read at once by ICA.fit(batch="stream")
+_ICA_STREAM_BYTES = 100e6
+
+
+def _get_stream_n_chunk(n_channels, decim):
+    n_chunk = max(int(_ICA_STREAM_BYTES // (8 * n_channels)), 1)
+    return max(n_chunk // decim, 1) * decim
+
+
+class _ICARawStream:
+    """Stream chunks of Raw data for out-of-core PCA and infomax."""
+
+    def __init__(self, ica, raw, picks, start, stop, decim, reject_by_annotation):
+        self.ica = ica
+        self.raw = raw
+        self.picks = picks
+        self.decim = 1 if decim is None else decim
+        self.reject_by_annotation = "omit" if reject_by_annotation else None
+        n_chunk = _get_stream_n_chunk(len(picks), self.decim)
+        self.bounds = [
+            (chunk_start, min(chunk_start + n_chunk, stop))
+            for chunk_start in range(start, stop, n_chunk)
+        ]
+        self.n_samples = None
+
+    @property
+    def shape(self):
+        return (self.n_samples, self.ica.n_components_)
+
+    def _read(self, start, stop):
+        data = self.raw.get_data(self.picks, start, stop, self.reject_by_annotation)
+        return data[:, :: self.decim]
+
+    def fit_pca(self, n_components):
+        """Compute the pre-whitener and the PCA, making one pass for each."""
+        ica = self.ica
+        logger.info(f"Streaming the data in {len(self.bounds)} chunks")
+        n_samples = 0
+        sums, sums_sq = np.zeros(len(self.picks)), np.zeros(len(self.picks))
+        if ica.noise_cov is None:
+            with use_log_level(False):
+                for start, stop in self.bounds:
+                    data = ica._do_proj(self._read(start, stop))
+                    n_samples += data.shape[1]
+                    sums += data.sum(axis=1)
+                    sums_sq += np.sum(data * data, axis=1)
+        ica._compute_pre_whitener(None, moments=(n_samples, sums, sums_sq))
+        pca = _PCA(n_components=n_components, whiten=True)
+        with use_log_level(False):
+            for start, stop in self.bounds:
+                pca.partial_fit(ica._pre_whiten(self._read(start, stop)).T)
+        self.n_samples = pca.n_samples_
+        return pca
+
+    def iter_chunks(self, rng):
+        """Yield the whitened ICA input for each chunk in random order."""
+        ica = self.ica
+        n_components = ica.n_components_
+        whitener = (
+            ica.pca_components_[:n_components]
+            / np.sqrt(ica.pca_explained_variance_[:n_components])[:, np.newaxis]
+        )
+        for ci in rng.permutation(len(self.bounds)):
+            with use_log_level(False):
+                data = ica._pre_whiten(self._read(*self.bounds[ci]))
+            data -= ica.pca_mean_[:, np.newaxis]
+            yield data.T @ whitener.T
+
+
 # Violate our assumption that the output is 1D so can't be used.
 # Could eventually be added but probably not worth the effort unless someone
 # requests it.
@@ -603,6 +673,7 @@ class ICA(ContainsMixin):
         flat=None,
         tstep=2.0,
         reject_by_annotation=True,
+        batch=None,
         verbose=None,
     ):
         """Run the ICA decomposition on raw data.
@@ -658,6 +729,17 @@ class ICA(ContainsMixin):
         %(reject_by_annotation_raw)s
 
             .. versionadded:: 0.14.0
+        batch : None | ``'stream'``
+            If ``'stream'``, the data are read from disk in chunks instead of
+            being loaded into memory, which allows fitting on recordings
+            larger than the available RAM: the pre-whitener and the PCA are
+            computed from the accumulated channel covariance, and each infomax
+            step goes over the chunks in random order. Only supported for
+            `~mne.io.Raw` data with ``method='infomax'`` (including extended
+            infomax) and without ``reject`` or ``flat``. Defaults to None,
+            which loads all data at once.
+
+            .. versionadded:: 1.11
         %(verbose)s
 
         Returns
@@ -671,6 +753,19 @@ class ICA(ContainsMixin):
                 _require_version(mod, f"use method={repr(method)}")
 
         _validate_type(inst, (BaseRaw, BaseEpochs), "inst", "Raw or Epochs")
+        _check_option("batch", batch, (None, "stream"))
+        if batch == "stream":
+            _validate_type(inst, BaseRaw, "inst", "Raw when batch='stream'")
+            if self.method not in ("infomax", "extended-infomax"):
+                raise ValueError(
+                    "batch='stream' is only supported for method='infomax', got "
+                    f"method={repr(self.method)}"
+                )
+            if reject is not None or flat is not None:
+                raise ValueError(
+                    "reject and flat must be None when batch='stream', consider "
+                    "annotating bad segments instead"
+                )
 
         if np.isclose(inst.info["highpass"], 0.0):
             warn(
@@ -746,13 +841,15 @@ class ICA(ContainsMixin):
                 tstep,
                 reject_by_annotation,
                 verbose,
+                batch,
             )
         else:
             assert isinstance(inst, BaseEpochs)
             self._fit_epochs(inst, picks, decim, verbose)
 
         # sort ICA components by explained variance
-        var = _ica_explained_variance(self, inst)
+        n_chunk = None if batch is None else _get_stream_n_chunk(len(picks), 1)
+        var = _ica_explained_variance(self, inst, n_chunk=n_chunk)
         var_ord = var.argsort()[::-1]
         _sort_components(self, var_ord, copy=False)
         t_stop = time()
@@ -790,10 +887,20 @@ class ICA(ContainsMixin):
         tstep,
         reject_by_annotation,
         verbose,
+        batch=None,
     ):
         """Aux method."""
         start, stop = _check_start_stop(raw, start, stop)
 
+        if batch == "stream":
+            stream = _ICARawStream(
+                self, raw, picks, start, stop, decim, reject_by_annotation
+            )
+            self.reject_ = None
+            self._fit(stream, "raw")
+            self.n_samples_ = stream.shape[0]
+            return self
+
         reject_by_annotation = "omit" if reject_by_annotation else None
         # this will be a copy
         data = raw.get_data(picks, start, stop, reject_by_annotation)
@@ -840,28 +947,42 @@ class ICA(ContainsMixin):
 
         return self
 
-    def _compute_pre_whitener(self, data):
+    def _compute_pre_whitener(self, data, moments=None):
         """Aux function."""
-        data = self._do_proj(data, log_suffix="(pre-whitener computation)")
+        if moments is None:
+            data = self._do_proj(data, log_suffix="(pre-whitener computation)")
+            n_channels = len(data)
+
+            def _std(picks):
+                return np.std(data[picks])
+
+        else:
+            # number of samples, sums and sums of squares of each channel
+            n_samples, sums, sums_sq = moments
+            n_channels = len(sums)
+
+            def _std(picks):
+                n = n_samples * len(picks)
+                return np.sqrt(sums_sq[picks].sum() / n - (sums[picks].sum() / n) ** 2)
 
         if self.noise_cov is None:
             # use standardization as whitener
             # Scale (z-score) the data by channel type
             info = self.info
-            pre_whitener = np.empty([len(data), 1])
+            pre_whitener = np.empty([n_channels, 1])
             for _, picks_ in _picks_by_type(info, ref_meg=False, exclude=[]):
-                pre_whitener[picks_] = np.std(data[picks_])
+                pre_whitener[picks_] = _std(picks_)
             if _contains_ch_type(info, "ref_meg"):
                 picks_ = pick_types(info, ref_meg=True, exclude=[])
-                pre_whitener[picks_] = np.std(data[picks_])
+                pre_whitener[picks_] = _std(picks_)
             if _contains_ch_type(info, "eog"):
                 picks_ = pick_types(info, eog=True, exclude=[])
-                pre_whitener[picks_] = np.std(data[picks_])
+                pre_whitener[picks_] = _std(picks_)
         else:
             pre_whitener, _ = compute_whitener(
                 self.noise_cov, self.info, picks=self.info.ch_names
             )
-            assert data.shape[0] == pre_whitener.shape[1]
+            assert n_channels == pre_whitener.shape[1]
         self.pre_whitener_ = pre_whitener
 
     def _do_proj(self, data, log_suffix=""):
@@ -892,12 +1013,14 @@ class ICA(ContainsMixin):
     def _fit(self, data, fit_type):
         """Aux function."""
         random_state = check_random_state(self.random_state)
-        n_channels, n_samples = data.shape
-        self._compute_pre_whitener(data)
-        data = self._pre_whiten(data)
-
-        pca = _PCA(n_components=self._max_pca_components, whiten=True)
-        data = pca.fit_transform(data.T)
+        stream = isinstance(data, _ICARawStream)
+        if stream:
+            pca = data.fit_pca(self._max_pca_components)
+        else:
+            self._compute_pre_whitener(data)
+            data = self._pre_whiten(data)
+            pca = _PCA(n_components=self._max_pca_components, whiten=True)
+            data = pca.fit_transform(data.T)
         use_ev = pca.explained_variance_ratio_
         n_pca = self.n_pca_components
         if isinstance(n_pca, float):
@@ -964,8 +1087,9 @@ class ICA(ContainsMixin):
             self.unmixing_matrix_ = ica.components_
             self.n_iter_ = ica.n_iter_
         elif self.method in ("infomax", "extended-infomax"):
+            # the stream only yields the selected components
             unmixing_matrix, n_iter = infomax(
-                data[:, sel],
+                data if stream else data[:, sel],
                 random_state=random_state,
                 return_n_iter=True,
                 **self.fit_params,
@@ -1432,23 +1556,7 @@ class ICA(ContainsMixin):
         scores : ndarray
             Scores for each source as returned from score_func.
         """
-        if isinstance(inst, BaseRaw):
-            _check_compensation_grade(
-                self.info, inst.info, "ICA", "Raw", ch_names=self.ch_names
-            )
-            sources = self._transform_raw(inst, start, stop, reject_by_annotation)
-        elif isinstance(inst, BaseEpochs):
-            _check_compensation_grade(
-                self.info, inst.info, "ICA", "Epochs", ch_names=self.ch_names
-            )
-            sources = self._transform_epochs(inst, concatenate=True)
-        elif isinstance(inst, Evoked):
-            _check_compensation_grade(
-                self.info, inst.info, "ICA", "Evoked", ch_names=self.ch_names
-            )
-            sources = self._transform_evoked(inst)
-        else:
-            raise ValueError("Data input must be of Raw, Epochs or Evoked type")
+        sources = self._get_scoring_sources(inst, start, stop, reject_by_annotation)
 
         if target is not None:  # we can have univariate metrics without target
             target = self._check_target(target, inst, start, stop, reject_by_annotation)
@@ -1469,6 +1577,27 @@ class ICA(ContainsMixin):
 
         return scores
 
+    def _get_scoring_sources(self, inst, start, stop, reject_by_annotation):
+        """Get the sources used for scoring, concatenated across epochs."""
+        if isinstance(inst, BaseRaw):
+            _check_compensation_grade(
+                self.info, inst.info, "ICA", "Raw", ch_names=self.ch_names
+            )
+            sources = self._transform_raw(inst, start, stop, reject_by_annotation)
+        elif isinstance(inst, BaseEpochs):
+            _check_compensation_grade(
+                self.info, inst.info, "ICA", "Epochs", ch_names=self.ch_names
+            )
+            sources = self._transform_epochs(inst, concatenate=True)
+        elif isinstance(inst, Evoked):
+            _check_compensation_grade(
+                self.info, inst.info, "ICA", "Evoked", ch_names=self.ch_names
+            )
+            sources = self._transform_evoked(inst)
+        else:
+            raise ValueError("Data input must be of Raw, Epochs or Evoked type")
+        return sources
+
     def _check_target(self, target, inst, start, stop, reject_by_annotation=False):
         """Aux Method."""
         if isinstance(inst, BaseRaw):
@@ -1532,19 +1661,19 @@ class ICA(ContainsMixin):
             else:
                 target_names.append(ch)
 
-        for ii, (ch, target) in enumerate(zip(target_names, targets)):
-            scores += [
-                self.score_sources(
-                    inst,
-                    target=target,
-                    score_func="pearsonr",
-                    start=start,
-                    stop=stop,
-                    l_freq=l_freq,
-                    h_freq=h_freq,
-                    reject_by_annotation=reject_by_annotation,
-                )
-            ]
+        # compute and filter the sources only once for all targets
+        sources = self._get_scoring_sources(inst, start, stop, reject_by_annotation)
+        targets = np.array([np.ravel(target) for target in targets])
+        if sources.shape[-1] != targets.shape[-1]:
+            raise ValueError(
+                "Sources and target do not have the same number of time slices."
+            )
+        if isinstance(inst, BaseRaw):
+            sources, targets = _band_pass_filter(inst, sources, targets, l_freq, h_freq)
+        all_scores = _pearsonr_rows(sources, targets)
+
+        for ii, (ch, this_scores) in enumerate(zip(target_names, all_scores)):
+            scores += [this_scores]
             # pick last scores
             if measure == "zscore":
                 this_idx = _find_outliers(scores[-1], threshold=threshold)
@@ -2192,7 +2321,14 @@ class ICA(ContainsMixin):
         ----------
         inst : instance of Raw, Epochs or Evoked
             The data to be processed (i.e., cleaned). It will be modified
-            in-place.
+            in-place. If a :class:`~mne.io.Raw` instance is not preloaded,
+            all steps are folded into a single ``(n_channels, n_channels)``
+            operator that is applied while the data are read in blocks
+            (e.g., by :meth:`~mne.io.Raw.save`), so that recordings that do
+            not fit into memory can be cleaned.
+
+            .. versionchanged:: 1.11
+               Support for Raw data that is not preloaded.
         include : array_like of int
             The indices referring to columns in the ummixing matrix. The
             components to be kept. If ``None`` (default), all components
@@ -2208,9 +2344,11 @@ class ICA(ContainsMixin):
         start : int | float | None
             First sample to include. If float, data will be interpreted as
             time in seconds. If None, data will be used from the first sample.
+            Only supported for preloaded Raw data.
         stop : int | float | None
             Last sample to not include. If float, data will be interpreted as
             time in seconds. If None, data will be used to the last sample.
+            Only supported for preloaded Raw data.
         %(on_baseline_ica)s
         %(verbose)s
 
@@ -2281,13 +2419,18 @@ class ICA(ContainsMixin):
 
     def _apply_raw(self, raw, include, exclude, n_pca_components, start, stop):
         """Aux method."""
-        _check_preload(raw, "ica.apply")
-
-        start, stop = _check_start_stop(raw, start, stop)
-
         picks = pick_types(
             raw.info, meg=False, include=self.ch_names, exclude="bads", ref_meg=False
         )
+        if not raw.preload:
+            if start is not None or stop is not None:
+                raise ValueError(
+                    "start and stop can only be used when applying ICA to "
+                    "preloaded Raw data"
+                )
+            return self._apply_raw_lazy(raw, picks, include, exclude, n_pca_components)
+
+        start, stop = _check_start_stop(raw, start, stop)
 
         data = raw[picks, start:stop][0]
         data = self._pick_sources(data, include, exclude, n_pca_components)
@@ -2295,6 +2438,24 @@ class ICA(ContainsMixin):
         raw[picks, start:stop] = data
         return raw
 
+    def _apply_raw_lazy(self, raw, picks, include, exclude, n_pca_components):
+        """Clean non-preloaded Raw data while they are read."""
+        proj_mat, offset = self._get_sources_operator(
+            len(picks), include, exclude, n_pca_components
+        )
+        n_chan = raw.info["nchan"]
+        mult = np.eye(n_chan)
+        mult[np.ix_(picks, picks)] = proj_mat
+        full_offset = np.zeros(n_chan)
+        full_offset[picks] = offset
+        if raw._ica_op is not None:  # compose with a previous cleaning
+            prev_mult, prev_offset = raw._ica_op
+            full_offset += mult @ prev_offset
+            mult = mult @ prev_mult
+        raw._ica_op = (mult, full_offset)
+        logger.info("    The data will be cleaned while they are read")
+        return raw
+
     def _apply_epochs(self, epochs, include, exclude, n_pca_components):
         """Aux method."""
         _check_preload(epochs, "ica.apply")
@@ -2344,12 +2505,22 @@ class ICA(ContainsMixin):
 
     def _pick_sources(self, data, include, exclude, n_pca_components):
         """Aux function."""
+        proj_mat, offset = self._get_sources_operator(
+            len(data), include, exclude, n_pca_components
+        )
+        data = np.dot(proj_mat, data)
+        data += offset[:, np.newaxis]
+        return data
+
+    def _get_sources_operator(self, n_ch, include, exclude, n_pca_components):
+        """Fold pre-whitening, (un)mixing and component removal into one op.
+
+        The cleaned data are ``proj_mat @ data + offset[:, np.newaxis]``.
+        """
         if n_pca_components is None:
             n_pca_components = self.n_pca_components
-        data = self._pre_whiten(data)
         exclude = self._check_exclude(exclude)
         _n_pca_comp = self._check_n_pca_components(n_pca_components)
-        n_ch, _ = data.shape
 
         max_pca_components = self.pca_components_.shape[0]
         if not self.n_components_ <= _n_pca_comp <= max_pca_components:
@@ -2365,10 +2536,6 @@ class ICA(ContainsMixin):
             f"component{_pl(self.n_components_)})"
         )
 
-        # Apply first PCA
-        if self.pca_mean_ is not None:
-            data -= self.pca_mean_[:, None]
-
         sel_keep = np.arange(self.n_components_)
         if include not in (None, []):
             sel_keep = np.unique(include)
@@ -2405,19 +2572,23 @@ class ICA(ContainsMixin):
             (sel_keep, np.arange(self.n_components_, _n_pca_comp))
         )
         proj_mat = np.dot(mixing[:, sel_keep], unmixing[sel_keep, :])
-        data = np.dot(proj_mat, data)
         assert proj_mat.shape == (n_ch,) * 2
 
+        # the PCA mean is removed before and restored after projecting
+        offset = np.zeros(n_ch)
         if self.pca_mean_ is not None:
-            data += self.pca_mean_[:, None]
+            offset = self.pca_mean_ - proj_mat @ self.pca_mean_
 
-        # restore scaling
+        # pre-whiten before and restore scaling after projecting
+        proj_mat = proj_mat @ self._pre_whiten(np.eye(n_ch))
         if self.noise_cov is None:  # revert standardization
-            data *= self.pre_whitener_
+            proj_mat *= self.pre_whitener_
+            offset *= self.pre_whitener_[:, 0]
         else:
-            data = np.linalg.pinv(self.pre_whitener_, rcond=1e-14) @ data
-
-        return data
+            unwhitener = np.linalg.pinv(self.pre_whitener_, rcond=1e-14)
+            proj_mat = unwhitener @ proj_mat
+            offset = unwhitener @ offset
+        return proj_mat, offset
 
     @verbose
     def save(self, fname, *, overwrite=False, verbose=None):
@@ -2835,7 +3006,16 @@ def _find_sources(sources, target, score_func):
     return scores
 
 
-def _ica_explained_variance(ica, inst, normalize=False):
+def _pearsonr_rows(sources, targets):
+    """Compute the Pearson correlation of each target with each source."""
+    sources = sources - sources.mean(axis=-1, keepdims=True)
+    sources /= np.linalg.norm(sources, axis=-1, keepdims=True)
+    targets = targets - targets.mean(axis=-1, keepdims=True)
+    targets /= np.linalg.norm(targets, axis=-1, keepdims=True)
+    return np.clip(targets @ sources.T, -1.0, 1.0)
+
+
+def _ica_explained_variance(ica, inst, normalize=False, *, n_chunk=None):
     """Check variance accounted for by each component in supplied data.
 
     This function is only used for sorting the components.
@@ -2848,6 +3028,8 @@ def _ica_explained_variance(ica, inst, normalize=False):
         Data to explain with ICA. Instance of Raw, Epochs or Evoked.
     normalize : bool
         Whether to normalize the variance.
+    n_chunk : int | None
+        If not None, Raw data are read in chunks of this many samples.
 
     Returns
     -------
@@ -2862,21 +3044,31 @@ def _ica_explained_variance(ica, inst, normalize=False):
             "second argument must an instance of either Raw, Epochs or Evoked."
         )
 
-    source_data = _get_inst_data(ica.get_sources(inst))
+    if isinstance(inst, BaseRaw) and n_chunk is not None:
+        # accumulate the source power without loading all data
+        picks = ica._get_picks(inst)
+        power, n_samp = 0.0, 0
+        with use_log_level(False):
+            for start in range(0, inst.n_times, n_chunk):
+                source_data = ica._transform(
+                    inst.get_data(picks, start, start + n_chunk)
+                )
+                power += np.sum(source_data**2, axis=1)
+                n_samp += source_data.shape[1]
+        n_chan = len(power)
+    else:
+        source_data = _get_inst_data(ica.get_sources(inst))
 
-    # if epochs - reshape to channels x timesamples
-    if isinstance(inst, BaseEpochs):
-        n_epochs, n_chan, n_samp = source_data.shape
-        source_data = source_data.transpose(1, 0, 2).reshape(
-            (n_chan, n_epochs * n_samp)
-        )
+        # if epochs - reshape to channels x timesamples
+        if isinstance(inst, BaseEpochs):
+            n_epochs, n_chan, n_samp = source_data.shape
+            source_data = source_data.transpose(1, 0, 2).reshape(
+                (n_chan, n_epochs * n_samp)
+            )
 
-    n_chan, n_samp = source_data.shape
-    var = (
-        np.sum(ica.mixing_matrix_**2, axis=0)
-        * np.sum(source_data**2, axis=1)
-        / (n_chan * n_samp - 1)
-    )
+        n_chan, n_samp = source_data.shape
+        power = np.sum(source_data**2, axis=1)
+    var = np.sum(ica.mixing_matrix_**2, axis=0) * power / (n_chan * n_samp - 1)
     if normalize:
         var /= var.sum()
     return var
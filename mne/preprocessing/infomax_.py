@@ -8,7 +8,15 @@ import numpy as np
 from scipy.special import expit
 from scipy.stats import kurtosis
 
-from ..utils import check_random_state, logger, random_permutation, verbose
+from ..fixes import has_numba, jit
+from ..utils import (
+    _check_option,
+    _validate_type,
+    check_random_state,
+    logger,
+    random_permutation,
+    verbose,
+)
 
 
 @verbose
@@ -30,6 +38,8 @@ def infomax(
     blowup_fac=0.5,
     n_small_angle=20,
     use_bias=True,
+    engine="standard",
+    dtype="float64",
     verbose=None,
     return_n_iter=False,
 ):
@@ -95,6 +105,21 @@ def infomax(
     use_bias : bool
         This quantity indicates if the bias should be computed.
         Defaults to True.
+    engine : str
+        The implementation of the training loop. ``"standard"`` (default) is
+        the reference implementation. ``"fast"`` gathers each block into
+        preallocated buffers, fuses the products of the weight update, and
+        estimates the kurtosis with :mod:`numba` (when available), which gives
+        the same unmixing matrix (up to floating point error) in less time.
+
+        .. versionadded:: 1.11
+    dtype : str
+        The floating point type used for the training, either ``"float64"``
+        (default) or ``"float32"``. ``"float32"`` halves the memory used by
+        the data and can be faster, but is less accurate, and is only
+        available with ``engine="fast"``.
+
+        .. versionadded:: 1.11
     %(verbose)s
     return_n_iter : bool
         Whether to return the number of iterations performed. Defaults to
@@ -117,6 +142,13 @@ def infomax(
            and supergaussian sources. Neural Computation, 11(2), 417-441, 1999.
     """
     rng = check_random_state(random_state)
+    _check_option("engine", engine, ("standard", "fast"))
+    _validate_type(dtype, str, "dtype")
+    _check_option("dtype", dtype, ("float64", "float32"))
+    if dtype != "float64" and engine != "fast":
+        raise ValueError(f'dtype="{dtype}" is only supported with engine="fast"')
+    fast = engine == "fast"
+    dtype = np.dtype(dtype)
 
     # define some default parameters
     max_weight = 1e8
@@ -144,18 +176,19 @@ def infomax(
 
     logger.info(f"Computing{' Extended ' if extended else ' '}Infomax ICA")
 
-    # collect parameters
-    nblock = n_samples // block
-    lastt = (nblock - 1) * block + 1
-
     # initialize training
     if weights is None:
         weights = np.identity(n_features, dtype=np.float64)
     else:
         weights = weights.T
+    if fast:
+        # the fast updates operate in place on contiguous arrays
+        weights = np.array(weights, dtype=dtype, order="C")
+        if isinstance(data, np.ndarray):
+            data = np.ascontiguousarray(data, dtype=dtype)
 
     BI = block * np.identity(n_features, dtype=np.float64)
-    bias = np.zeros((n_features, 1), dtype=np.float64)
+    bias = np.zeros((n_features, 1), dtype=weights.dtype)
     onesrow = np.ones((1, block), dtype=np.float64)
     startweights = weights.copy()
     oldweights = startweights.copy()
@@ -165,6 +198,19 @@ def infomax(
     blockno = 0
     signcount = 0
     initial_ext_blocks = ext_blocks  # save the initial value in case of reset
+    if fast:
+        # buffers for the gathered block (and kurtosis) samples
+        x_block = np.empty((block, n_features), dtype)
+        bufs = (
+            np.empty((block, n_features), dtype),  # u
+            np.empty((block, n_features), dtype),  # y
+            np.empty((block, n_features), dtype),  # v
+            np.empty((n_features, n_features), dtype),  # gram
+            np.empty((n_features, n_features), dtype),  # w_gram
+        )
+        x_kurt = np.empty((min(kurt_size, n_samples), n_features), dtype)
+        u_kurt = np.empty_like(x_kurt)
+        f_signs = np.ones(n_features, dtype)
 
     # for extended Infomax
     if extended:
@@ -180,76 +226,107 @@ def infomax(
     # trainings loop
     olddelta, oldchange = 1.0, 0.0
     while step < max_iter:
-        # shuffle data at each step
-        permute = random_permutation(n_samples, rng)
-
-        # ICA training block
-        # loop across block samples
-        for t in range(0, lastt, block):
-            u = np.dot(data[permute[t : t + block], :], weights)
-            u += np.dot(bias, onesrow).T
-
-            if extended:
-                # extended ICA update
-                y = np.tanh(u)
-                weights += l_rate * np.dot(
-                    weights, BI - signs[None, :] * np.dot(u.T, y) - np.dot(u.T, u)
-                )
-                if use_bias:
-                    bias += l_rate * np.reshape(
-                        np.sum(y, axis=0, dtype=np.float64) * -2.0, (n_features, 1)
+        for chunk in _iter_chunks(data, rng):
+            if fast:
+                chunk = np.ascontiguousarray(chunk, dtype=dtype)
+            # shuffle data at each step
+            n_chunk = len(chunk)
+            permute = random_permutation(n_chunk, rng)
+            lastt = (n_chunk // block - 1) * block + 1
+
+            # ICA training block
+            # loop across block samples
+            for t in range(0, lastt, block):
+                if fast:
+                    np.take(chunk, permute[t : t + block], axis=0, out=x_block)
+                    if extended:
+                        f_signs[:] = signs
+                    max_weight_val = _infomax_update(
+                        x_block,
+                        weights,
+                        bias[:, 0],
+                        f_signs,
+                        dtype.type(l_rate),
+                        extended,
+                        use_bias,
+                        bufs,
                     )
+                else:
+                    u = np.dot(chunk[permute[t : t + block], :], weights)
+                    u += np.dot(bias, onesrow).T
+
+                    if extended:
+                        # extended ICA update
+                        y = np.tanh(u)
+                        weights += l_rate * np.dot(
+                            weights,
+                            BI - signs[None, :] * np.dot(u.T, y) - np.dot(u.T, u),
+                        )
+                        if use_bias:
+                            bias += l_rate * np.reshape(
+                                np.sum(y, axis=0, dtype=np.float64) * -2.0,
+                                (n_features, 1),
+                            )
 
-            else:
-                # logistic ICA weights update
-                y = expit(u)
-                weights += l_rate * np.dot(weights, BI + np.dot(u.T, (1.0 - 2.0 * y)))
-
-                if use_bias:
-                    bias += l_rate * np.reshape(
-                        np.sum((1.0 - 2.0 * y), axis=0, dtype=np.float64),
-                        (n_features, 1),
-                    )
-
-            # check change limit
-            max_weight_val = np.max(np.abs(weights))
-            if max_weight_val > max_weight:
-                wts_blowup = True
+                    else:
+                        # logistic ICA weights update
+                        y = expit(u)
+                        weights += l_rate * np.dot(
+                            weights, BI + np.dot(u.T, (1.0 - 2.0 * y))
+                        )
+
+                        if use_bias:
+                            bias += l_rate * np.reshape(
+                                np.sum((1.0 - 2.0 * y), axis=0, dtype=np.float64),
+                                (n_features, 1),
+                            )
+                    max_weight_val = np.max(np.abs(weights))
+
+                # check change limit
+                if max_weight_val > max_weight:
+                    wts_blowup = True
+
+                blockno += 1
+                if wts_blowup:
+                    break
+
+                # ICA kurtosis estimation
+                if extended:
+                    if ext_blocks > 0 and blockno % ext_blocks == 0:
+                        if kurt_size < n_chunk:
+                            rp = np.floor(rng.uniform(0, 1, kurt_size) * (n_chunk - 1))
+                            rp = rp.astype(int)
+                            if fast:
+                                np.take(chunk, rp, axis=0, out=x_kurt)
+                                np.dot(x_kurt, weights, out=u_kurt)
+                                kurt = _infomax_kurtosis(u_kurt)
+                            else:
+                                tpartact = np.dot(chunk[rp, :], weights).T
+                        elif fast:
+                            kurt = _infomax_kurtosis(np.dot(chunk, weights))
+                        else:
+                            tpartact = np.dot(chunk, weights).T
+
+                        # estimate kurtosis
+                        if not fast:
+                            kurt = kurtosis(tpartact, axis=1, fisher=True)
+                        signs, old_kurt, oldsigns, signcount, ext_blocks = (
+                            _update_signs(
+                                kurt,
+                                old_kurt,
+                                oldsigns,
+                                signcount,
+                                ext_blocks,
+                                extmomentum,
+                                signsbias,
+                                signcount_threshold,
+                                signcount_step,
+                            )
+                        )
 
-            blockno += 1
             if wts_blowup:
                 break
 
-            # ICA kurtosis estimation
-            if extended:
-                if ext_blocks > 0 and blockno % ext_blocks == 0:
-                    if kurt_size < n_samples:
-                        rp = np.floor(rng.uniform(0, 1, kurt_size) * (n_samples - 1))
-                        tpartact = np.dot(data[rp.astype(int), :], weights).T
-                    else:
-                        tpartact = np.dot(data, weights).T
-
-                    # estimate kurtosis
-                    kurt = kurtosis(tpartact, axis=1, fisher=True)
-
-                    if extmomentum != 0:
-                        kurt = extmomentum * old_kurt + (1.0 - extmomentum) * kurt
-                        old_kurt = kurt
-
-                    # estimate weighted signs
-                    signs = np.sign(kurt + signsbias)
-
-                    ndiff = (signs - oldsigns != 0).sum()
-                    if ndiff == 0:
-                        signcount += 1
-                    else:
-                        signcount = 0
-                    oldsigns = signs
-
-                    if signcount >= signcount_threshold:
-                        ext_blocks = np.fix(ext_blocks * signcount_step)
-                        signcount = 0
-
         # here we continue after the for loop over the ICA training blocks
         # if weights in bounds:
         if not wts_blowup:
@@ -306,7 +383,7 @@ def infomax(
             weights = startweights.copy()
             oldweights = startweights.copy()
             olddelta = np.zeros((1, n_features_square), dtype=np.float64)
-            bias = np.zeros((n_features, 1), dtype=np.float64)
+            bias = np.zeros((n_features, 1), dtype=weights.dtype)
 
             ext_blocks = initial_ext_blocks
 
@@ -329,7 +406,118 @@ def infomax(
                 )
 
     # prepare return values
+    weights = weights.astype(np.float64, copy=False)
     if return_n_iter:
         return weights.T, step
     else:
         return weights.T
+
+
+def _update_signs(
+    kurt,
+    old_kurt,
+    oldsigns,
+    signcount,
+    ext_blocks,
+    extmomentum,
+    signsbias,
+    signcount_threshold,
+    signcount_step,
+):
+    if extmomentum != 0:
+        kurt = extmomentum * old_kurt + (1.0 - extmomentum) * kurt
+        old_kurt = kurt
+
+    # estimate weighted signs
+    signs = np.sign(kurt + signsbias)
+
+    ndiff = (signs - oldsigns != 0).sum()
+    if ndiff == 0:
+        signcount += 1
+    else:
+        signcount = 0
+    oldsigns = signs
+
+    if signcount >= signcount_threshold:
+        ext_blocks = np.fix(ext_blocks * signcount_step)
+        signcount = 0
+    return signs, old_kurt, oldsigns, signcount, ext_blocks
+
+
+def _infomax_update(x, weights, bias, signs, l_rate, extended, use_bias, bufs):
+    # One block of the (extended) Infomax learning rule, updating weights and
+    # bias in place using preallocated buffers. The two Gram products of the
+    # reference implementation are fused into a single one:
+    #
+    #     u.T @ u + signs * (u.T @ y) == u.T @ (u + signs * y)
+    #     -u.T @ (1 - 2 * y) == u.T @ (2 * y - 1)
+    #
+    # with 2 * expit(u) - 1 == tanh(u / 2) for the logistic rule.
+    u, y, v, gram, w_gram = bufs
+    np.dot(x, weights, out=u)
+    u += bias
+    if extended:
+        np.tanh(u, out=y)
+        bias_step = y.sum(axis=0)
+        bias_step *= -2.0
+        np.multiply(y, signs, out=v)
+        v += u
+    else:
+        np.multiply(u, 0.5, out=y)
+        np.tanh(y, out=v)
+        bias_step = v.sum(axis=0)
+        bias_step *= -1.0
+    np.dot(u.T, v, out=gram)
+    np.dot(weights, gram, out=w_gram)
+    w_gram *= l_rate
+    weights *= 1.0 + l_rate * len(x)
+    weights -= w_gram
+    if use_bias:
+        bias_step *= l_rate
+        bias += bias_step
+    return np.abs(weights).max()
+
+
+def _infomax_kurtosis_fallback(u):
+    # Fisher kurtosis of the sources, same as kurtosis(u, axis=0, fisher=True)
+    d = u - u.mean(axis=0)
+    d *= d
+    m2 = d.mean(axis=0, dtype=np.float64)
+    d *= d
+    m4 = d.mean(axis=0, dtype=np.float64)
+    return m4 / (m2 * m2) - 3.0
+
+
+if has_numba:
+
+    @jit()
+    def _infomax_kurtosis(u):
+        # one pass per moment over the rows, without temporaries
+        n, k = u.shape
+        mean = np.zeros(k)
+        for ii in range(n):
+            for jj in range(k):
+                mean[jj] += u[ii, jj]
+        mean /= n
+        m2 = np.zeros(k)
+        m4 = np.zeros(k)
+        for ii in range(n):
+            for jj in range(k):
+                d = u[ii, jj] - mean[jj]
+                d *= d
+                m2[jj] += d
+                m4[jj] += d * d
+        m2 /= n
+        m4 /= n
+        return m4 / (m2 * m2) - 3.0
+
+else:  # pragma: no cover
+    _infomax_kurtosis = _infomax_kurtosis_fallback
+
+
+def _iter_chunks(data, rng):
+    # Instead of an array, data can be an object that streams chunks of samples
+    # (see ICA.fit), which are then visited in random order at each step
+    if isinstance(data, np.ndarray):
+        return (data,)
+    return data.iter_chunks(rng)
@@ -3,6 +3,7 @@
 # Copyright the MNE-Python contributors.
 
 from collections import Counter
+from copy import deepcopy
 from functools import partial
 from math import factorial
 from os import path as op
@@ -20,6 +21,7 @@ from .._fiff.pick import pick_info, pick_types
 from .._fiff.proc_history import _read_ctc
 from .._fiff.proj import Projection
 from .._fiff.tag import _coil_trans_to_loc, _loc_to_coil_trans
+from .._fiff.utils import _mult_cal_one
 from .._fiff.write import DATE_NONE, _generate_meas_id
 from .._ola import _COLA, _Interp2, _Storer
 from ..annotations import _annotations_starts_stops
@@ -27,7 +29,8 @@ from ..bem import _check_origin
 from ..channels.channels import _get_T1T2_mag_inds, fix_mag_coil_types
 from ..fixes import _safe_svd, bincount, sph_harm_y
 from ..forward import _concatenate_coils, _create_meg_coils, _prep_meg_channels
-from ..io import BaseRaw, RawArray
+from ..io import BaseRaw, RawArray, read_raw_fif
+from ..parallel import parallel_func
 from ..surface import _normalize_vectors
 from ..transforms import (
     Transform,
@@ -47,8 +50,10 @@ from ..transforms import (
     rot_to_quat,
 )
 from ..utils import (
+    _check_fname,
     _check_option,
     _clean_names,
+    _custom_lru_cache,
     _ensure_int,
     _pl,
     _time_mask,
@@ -238,6 +243,9 @@ def maxwell_filter(
     extended_proj=(),
     st_overlap=True,
     mc_interp="hann",
+    n_jobs=None,
+    out_fname=None,
+    overwrite=False,
     verbose=None,
 ):
     """Maxwell filter data using multipole moments.
@@ -291,6 +299,24 @@ def maxwell_filter(
 
         .. versionadded:: 1.10
     %(maxwell_mc_interp)s
+    %(n_jobs)s
+        Used to compute the decompositions for the different head positions
+        in parallel threads when ``head_pos`` is provided.
+
+        .. versionadded:: 1.11
+    out_fname : path-like | None
+        If not None, the data are read, processed and written to this FIF file
+        block by block instead of being loaded into memory, so that memory usage
+        is bounded by ``st_duration`` (or the data buffer size) rather than by the
+        duration of the recording. The filtered data are then returned as a
+        :class:`~mne.io.Raw` instance read (without preloading) from
+        ``out_fname``.
+
+        .. versionadded:: 1.11
+    %(overwrite)s
+        Only used when ``out_fname`` is not None.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -403,6 +429,8 @@ def maxwell_filter(
     .. footbibliography::
     """  # noqa: E501
     logger.info("Maxwell filtering raw data")
+    if out_fname is not None:
+        out_fname = _check_fname(out_fname, overwrite=overwrite)
     params = _prep_maxwell_filter(
         raw=raw,
         origin=origin,
@@ -426,9 +454,15 @@ def maxwell_filter(
         st_overlap=st_overlap,
         mc_interp=mc_interp,
     )
-    raw_sss = _run_maxwell_filter(raw, **params)
+    raw_sss = _run_maxwell_filter(
+        raw, stream=out_fname is not None, n_jobs=n_jobs, **params
+    )
     # Update info
     _update_sss_info(raw_sss, **params["update_kwargs"])
+    if out_fname is not None:
+        # the filter runs as the data are written
+        raw_sss.save(out_fname, overwrite=overwrite)
+        raw_sss = read_raw_fif(out_fname)
     logger.info("[done]")
     return raw_sss
 
@@ -714,19 +748,20 @@ def _run_maxwell_filter(
     st_fixed,
     st_overlap,
     mc,
+    stream=False,
+    n_jobs=None,
 ):
-    # Eventually find_bad_channels_maxwell could be sped up by moving this
-    # outside the loop (e.g., in the prep function) but regularization depends
-    # on which channels are being used, so easier just to include it here.
-    # The time it takes to recompute S and pS themselves is roughly on par
-    # with the np.dot with the data, so not a huge gain to be made there.
+    # find_bad_channels_maxwell modifies good_mask, so this must be done here
     if ctc is not None:
         ctc = ctc[good_mask][:, good_mask]
 
     add_channels = add_channels and copy
-    raw_sss, pos_picks = _copy_preload_add_channels(raw, add_channels, copy, info)
+    if stream:
+        raw_sss, pos_picks = _make_maxwell_stream(raw, add_channels, info)
+    else:
+        raw_sss, pos_picks = _copy_preload_add_channels(raw, add_channels, copy, info)
+        del raw
     sfreq = info["sfreq"]
-    del raw
     if not st_only:
         # remove MEG projectors, they won't apply now
         _remove_meg_projs_comps(raw_sss, ignore_ref)
@@ -749,9 +784,31 @@ def _run_maxwell_filter(
 
     # This must be initialized inside _run_maxwell_filter because
     # find_bad_channels_maxwell modifies good_mask
-    mc.initialize(_get_this_decomp_trans, info["dev_head_t"], S_recon)
+    mc.initialize(_get_this_decomp_trans, info["dev_head_t"], S_recon, n_jobs=n_jobs)
     update_kwargs.update(reg_moments=mc.reg_moments_0)
 
+    if stream:
+        # the data are processed as they are read from raw_sss
+        raw_sss._raw_extras[0]["blocks"] = _iter_maxwell_blocks(
+            raw,
+            onsets,
+            ends,
+            n_chan=len(raw_sss.ch_names),
+            pos_picks=pos_picks,
+            meg_picks=meg_picks,
+            good_mask=good_mask,
+            these_picks=these_picks,
+            ctc=ctc,
+            st_duration=st_duration,
+            st_correlation=st_correlation,
+            st_only=st_only,
+            st_fixed=st_fixed,
+            st_overlap=st_overlap,
+            mc=mc,
+            sfreq=sfreq,
+        )
+        return raw_sss
+
     # Process each valid block of data separately
     for onset, end in zip(onsets, ends):
         n = end - onset
@@ -834,6 +891,145 @@ def _run_maxwell_filter(
     return raw_sss
 
 
+class _QueueStorer(_Storer):
+    """Fill rows of queued blocks with processed data and pass the blocks on."""
+
+    def __init__(self, n_chan, picks, emit):
+        super().__init__(np.zeros((n_chan, 0)), picks=picks)
+        self.queue = np.zeros((n_chan, 0))
+        self.emit = emit
+
+    def put(self, block):
+        self.queue = np.concatenate([self.queue, block], axis=1)
+
+    def __call__(self, out):
+        n = out.shape[-1]
+        block, self.queue = self.queue[:, :n], self.queue[:, n:]
+        block[self.picks] = out
+        self.idx += n
+        self.emit(block)
+
+
+def _iter_maxwell_blocks(
+    raw,
+    onsets,
+    ends,
+    *,
+    n_chan,
+    pos_picks,
+    meg_picks,
+    good_mask,
+    these_picks,
+    ctc,
+    st_duration,
+    st_correlation,
+    st_only,
+    st_fixed,
+    st_overlap,
+    mc,
+    sfreq,
+):
+    """Yield consecutive blocks of Maxwell filtered data, reading raw as needed.
+
+    This performs the same passes as _run_maxwell_filter, but interleaved so that
+    only the data buffered by the tSSS overlap-add processing are held in memory.
+    """
+    use_n = int(round(raw.buffer_size_sec * sfreq))
+    n_orig = len(raw.ch_names)
+
+    def _read(start, stop):
+        data = np.zeros((n_chan, stop - start))
+        data[:n_orig] = raw._getitem((slice(None), slice(start, stop)), False)
+        return data
+
+    def _read_lims(start, stop):
+        lims = list(range(start, stop, use_n)) + [stop]
+        return zip(lims[:-1], lims[1:])
+
+    def _segment(onset, end):
+        n = end - onset
+        assert n > 0
+        tsss_valid = n >= st_duration
+        if st_overlap and tsss_valid and st_correlation is not None:
+            n_overlap = st_duration // 2
+            window = "hann"
+        else:
+            n_overlap = 0
+            window = "boxcar"
+        if st_fixed and st_correlation is not None:
+            fun = partial(_do_tSSS_on_avg_trans, mc=mc)
+        else:
+            fun = _do_tSSS
+        done = list()
+
+        def _mc_feed(block):
+            # Second pass: movement compensation, st_fixed=False
+            data, orig_in_data, resid, pos_data, n_positions = mc.feed(
+                block[meg_picks], good_mask, st_only
+            )
+            block[meg_picks] = data
+            if len(pos_picks) > 0:
+                block[pos_picks] = pos_data
+            if not st_fixed and st_correlation is not None:
+                store.put(block)
+                tsss.feed(
+                    block[meg_picks],
+                    orig_in_data,
+                    resid,
+                    n_positions=n_positions,
+                    sfreq=sfreq,
+                )
+            else:
+                done.append(block)
+
+        if st_correlation is not None:
+            # processed data are stored once a whole tSSS window has been fed
+            store = _QueueStorer(
+                n_chan, these_picks, _mc_feed if st_fixed else done.append
+            )
+            tsss = _COLA(
+                partial(
+                    fun,
+                    st_correlation=st_correlation,
+                    tsss_valid=tsss_valid,
+                    sfreq=sfreq,
+                ),
+                store,
+                n,
+                min(st_duration, n),
+                n_overlap,
+                sfreq,
+                window,
+                name="tSSS-COLA",
+            )
+        for start, stop in _read_lims(onset, end):
+            # First pass: cross_talk, st_fixed=True
+            block = _read(start, stop)
+            ctc_data = block[meg_picks[good_mask]]
+            if ctc is not None:
+                ctc_data = ctc.dot(ctc_data)
+            if st_fixed and st_correlation is not None:
+                store.put(block)
+                tsss.feed(
+                    block[meg_picks] if st_only else ctc_data, ctc_data, sfreq=sfreq
+                )
+            else:
+                block[meg_picks[good_mask]] = ctc_data
+                _mc_feed(block)
+            yield from done
+            done.clear()
+
+    # Data outside of the valid segments are passed through unchanged
+    last = 0
+    for onset, end in zip(onsets, ends):
+        for start, stop in _read_lims(last, onset):
+            yield _read(start, stop)
+        yield from _segment(onset, end)
+        last = end
+    for start, stop in _read_lims(last, len(raw.times)):
+        yield _read(start, stop)
+
+
 class _MoveComp:
     """Perform movement compensation."""
 
@@ -845,11 +1041,26 @@ class _MoveComp:
         self.reconstruct = reconstruct
 
     def get_decomp_by_offset(self, offset):
+        if offset not in self._ops:
+            # Compute the operators for the next n_jobs head positions at once
+            idx = np.where(self.pos[1] == offset)[0][0]
+            offsets = self.pos[1][idx : idx + self._n_jobs]
+            ops = self._parallel(
+                self._p_fun(this_offset, verbose=logger.level)
+                for this_offset in offsets
+            )
+            self._ops.update(zip(offsets, ops))
+        return self._ops.pop(offset)
+
+    @verbose
+    def _compute_ops(self, offset, verbose=None):
         idx = np.where(self.pos[1] == offset)[0][0]
         dev_head_t = self.pos[0][idx]
         t = offset / self.sfreq
+        # with movement compensation each position is new, so only cache the
+        # decomposition for a static head position
         S_decomp, S_decomp_full, pS_decomp, reg_moments, n_use_in = self.get_decomp(
-            dev_head_t, t=t
+            dev_head_t, t=t, cache=len(self.pos[1]) == 1
         )
         S_recon_reg = self.S_recon.take(reg_moments[:n_use_in], axis=1)
         if self.reconstruct == "orig":
@@ -863,15 +1074,26 @@ class _MoveComp:
         op_resid -= np.dot(S_decomp[:, n_use_in:], pS_decomp[n_use_in:])
         return op_sss, op_in, op_resid
 
-    def initialize(self, get_decomp, dev_head_t, S_recon):
+    def initialize(self, get_decomp, dev_head_t, S_recon, *, n_jobs=None):
         """Secondary initialization."""
+        # The heavy lifting is done by BLAS/LAPACK, so threads are enough
+        self._parallel, self._p_fun, self._n_jobs = parallel_func(
+            self._compute_ops,
+            n_jobs,
+            prefer="threads",
+            max_jobs=len(self.pos[1]),
+            verbose=False,
+        )
+        self._ops = dict()
         self.smooth = _Interp2(
             self.pos[1],
             self.get_decomp_by_offset,
             interp=self.interp,
             name="MC",
         )
-        _, _, pS_decomp, self.reg_moments_0, _ = get_decomp(dev_head_t, t=0.0)
+        _, _, pS_decomp, self.reg_moments_0, _ = get_decomp(
+            dev_head_t, t=0.0, cache=True
+        )
         self.n_good = pS_decomp.shape[1]
         self.S_recon = S_recon
         self.offset = 0
@@ -952,7 +1174,8 @@ def _trans_lims(pos, start, stop):
             rel_stop = rel_stop - start
             if rel_start == rel_stop:
                 continue  # our first pos occurs on first time sample
-            this_quat = pos[2][max(pos_idx[0] - 1 if len(pos_idx) else 0, 0)]
+            # the last position before this block
+            this_quat = pos[2][max(np.searchsorted(pos[1], start, "right") - 1, 0)]
             n_positions += 1
         else:
             rel_start = pos[1][pos_idx[ti]] - start
@@ -1156,18 +1379,7 @@ def _copy_preload_add_channels(raw, add_channels, copy, info):
     with raw.info._unlock():
         raw.info["chs"] = info["chs"]  # updated coil types
     if add_channels:
-        kinds = [
-            FIFF.FIFFV_QUAT_1,
-            FIFF.FIFFV_QUAT_2,
-            FIFF.FIFFV_QUAT_3,
-            FIFF.FIFFV_QUAT_4,
-            FIFF.FIFFV_QUAT_5,
-            FIFF.FIFFV_QUAT_6,
-            FIFF.FIFFV_HPI_G,
-            FIFF.FIFFV_HPI_ERR,
-            FIFF.FIFFV_HPI_MOV,
-        ]
-        out_shape = (len(raw.ch_names) + len(kinds), len(raw.times))
+        out_shape = (len(raw.ch_names) + len(_POS_KINDS), len(raw.times))
         out_data = np.zeros(out_shape, np.float64)
         msg = "    Appending head position result channels and "
         if raw.preload:
@@ -1180,29 +1392,8 @@ def _copy_preload_add_channels(raw, add_channels, copy, info):
                 raw._preload_data(out_data[: len(raw.ch_names)])
             raw._data = out_data
         assert raw.preload is True
-        off = len(raw.ch_names)
-        chpi_chs = [
-            dict(
-                ch_name=f"CHPI{ii:03d}",
-                logno=ii + 1,
-                scanno=off + ii + 1,
-                unit_mul=-1,
-                range=1.0,
-                unit=-1,
-                kind=kinds[ii],
-                coord_frame=FIFF.FIFFV_COORD_UNKNOWN,
-                cal=1e-4,
-                coil_type=FWD.COIL_UNKNOWN,
-                loc=np.zeros(12),
-            )
-            for ii in range(len(kinds))
-        ]
-        raw.info["chs"].extend(chpi_chs)
-        raw.info._update_redundant()
-        raw.info._check_consistency()
+        pos_picks = _add_pos_chs(raw.info)
         assert raw._data.shape == (raw.info["nchan"], len(raw.times))
-        # Return the pos picks
-        pos_picks = np.arange(len(raw.ch_names) - len(chpi_chs), len(raw.ch_names))
         return raw, pos_picks
     else:
         if copy:
@@ -1214,6 +1405,98 @@ def _copy_preload_add_channels(raw, add_channels, copy, info):
         return raw, np.array([], int)
 
 
+_POS_KINDS = (
+    FIFF.FIFFV_QUAT_1,
+    FIFF.FIFFV_QUAT_2,
+    FIFF.FIFFV_QUAT_3,
+    FIFF.FIFFV_QUAT_4,
+    FIFF.FIFFV_QUAT_5,
+    FIFF.FIFFV_QUAT_6,
+    FIFF.FIFFV_HPI_G,
+    FIFF.FIFFV_HPI_ERR,
+    FIFF.FIFFV_HPI_MOV,
+)
+
+
+def _add_pos_chs(info):
+    """Append the cHPI head position result channels to info (in place)."""
+    off = len(info["ch_names"])
+    chpi_chs = [
+        dict(
+            ch_name=f"CHPI{ii:03d}",
+            logno=ii + 1,
+            scanno=off + ii + 1,
+            unit_mul=-1,
+            range=1.0,
+            unit=-1,
+            kind=kind,
+            coord_frame=FIFF.FIFFV_COORD_UNKNOWN,
+            cal=1e-4,
+            coil_type=FWD.COIL_UNKNOWN,
+            loc=np.zeros(12),
+        )
+        for ii, kind in enumerate(_POS_KINDS)
+    ]
+    info["chs"].extend(chpi_chs)
+    info._update_redundant()
+    info._check_consistency()
+    # Return the pos picks
+    return np.arange(off, off + len(chpi_chs))
+
+
+def _make_maxwell_stream(raw, add_channels, info):
+    """Set up a Raw whose data get Maxwell filtered as they are read."""
+    out_info = raw.info.copy()
+    with out_info._unlock():
+        out_info["chs"] = deepcopy(info["chs"])  # updated coil types
+    if add_channels:
+        logger.info("    Appending head position result channels")
+        pos_picks = _add_pos_chs(out_info)
+    else:
+        pos_picks = np.array([], int)
+    logger.info("    Processing data from disk block by block")
+    return _RawMaxwellStream(raw, out_info), pos_picks
+
+
+class _RawMaxwellStream(BaseRaw):
+    """Raw data that are Maxwell filtered block by block as they are read.
+
+    The data can only be read sequentially (e.g., by :meth:`~mne.io.Raw.save`),
+    as the underlying generator of processed blocks only moves forward.
+    """
+
+    def __init__(self, raw, info):
+        super().__init__(
+            info,
+            preload=False,
+            first_samps=[raw.first_samp],
+            last_samps=[raw.last_samp],
+            raw_extras=[dict(blocks=None, buffer=np.zeros((info["nchan"], 0)))],
+            buffer_size_sec=raw.buffer_size_sec,
+            verbose=False,
+        )
+        self._raw_extras[0].update(
+            buffer_start=raw.first_samp, cals=self._cals[:, np.newaxis]
+        )
+        self.set_annotations(raw.annotations)
+
+    def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
+        """Read a segment of data, processing as many new blocks as needed."""
+        extras = self._raw_extras[fi]
+        buffer, buffer_start = extras["buffer"], extras["buffer_start"]
+        if start < buffer_start:
+            raise RuntimeError(
+                "Maxwell filtered data can only be read sequentially, cannot read "
+                f"from sample {start} after sample {buffer_start}"
+            )
+        while buffer_start + buffer.shape[1] < stop:
+            buffer = np.concatenate([buffer, next(extras["blocks"])], axis=1)
+        buffer = buffer[:, start - buffer_start :]
+        extras["buffer"], extras["buffer_start"] = buffer, start
+        one = buffer[:, : stop - start] / extras["cals"]
+        _mult_cal_one(data, one, idx, cals, mult)
+
+
 def _check_pos(pos, coord_frame, raw, st_fixed):
     """Check for a valid pos array and transform it to a more usable form."""
     _validate_type(pos, (np.ndarray, None), "head_pos")
@@ -1286,8 +1569,13 @@ def _get_decomp(
     t,
     mag_scale,
     mult,
+    cache=False,
 ):
-    """Get a decomposition matrix and pseudoinverse matrices."""
+    """Get a decomposition matrix and pseudoinverse matrices.
+
+    With ``cache=True`` (only used for static head positions), the basis and
+    the regularization are reused across runs with the same geometry.
+    """
     #
     # Fine calibration processing (point-like magnetometers and calib. coeffs)
     #
@@ -1301,6 +1589,7 @@ def _get_decomp(
         grad_picks,
         mag_picks,
         mag_scale,
+        cache=cache,
     )
     if mult is not None:
         S_decomp_full = mult @ S_decomp_full
@@ -1342,7 +1631,7 @@ def _get_decomp(
     # Regularization
     #
     S_decomp, reg_moments, n_use_in = _regularize(
-        regularize, exp, S_decomp, mag_or_fine, extended_remove, t=t
+        regularize, exp, S_decomp, mag_or_fine, extended_remove, t=t, cache=cache
     )
     S_decomp_full = S_decomp_full.take(reg_moments, axis=1)
 
@@ -1369,9 +1658,51 @@ def _get_decomp(
 
 
 def _get_s_decomp(
-    exp, all_coils, trans, coil_scale, cal, ignore_ref, grad_picks, mag_picks, mag_scale
+    exp,
+    all_coils,
+    trans,
+    coil_scale,
+    cal,
+    ignore_ref,
+    grad_picks,
+    mag_picks,
+    mag_scale,
+    *,
+    cache=False,
 ):
     """Get S_decomp."""
+    if not cache:
+        return _compute_s_decomp(
+            exp,
+            all_coils,
+            trans,
+            coil_scale,
+            cal,
+            ignore_ref,
+            grad_picks,
+            mag_picks,
+            mag_scale,
+        )
+    # The slice maps of the coil sets are not needed (and cannot be hashed)
+    all_coils = all_coils[:5]
+    if cal is not None:
+        cal = dict(cal, grad_coilsets=[coils[:5] for coils in cal["grad_coilsets"]])
+    return _compute_s_decomp_cached(
+        exp,
+        all_coils,
+        trans,
+        coil_scale,
+        cal,
+        ignore_ref,
+        grad_picks,
+        mag_picks,
+        mag_scale,
+    ).copy()
+
+
+def _compute_s_decomp(
+    exp, all_coils, trans, coil_scale, cal, ignore_ref, grad_picks, mag_picks, mag_scale
+):
     S_decomp = _trans_sss_basis(exp, all_coils, trans, coil_scale)
     if cal is not None:
         # Compute point-like mags to incorporate gradiometer imbalance
@@ -1386,9 +1717,22 @@ def _get_s_decomp(
     return S_decomp
 
 
+# Keyed by the content of the coil geometry, origin, orders, fine calibration
+# and device-to-head transform, so repeated runs can skip the basis computation
+_compute_s_decomp_cached = _custom_lru_cache(20)(_compute_s_decomp)
+
+
 @verbose
 def _regularize(
-    regularize, exp, S_decomp, mag_or_fine, extended_remove, t, verbose=None
+    regularize,
+    exp,
+    S_decomp,
+    mag_or_fine,
+    extended_remove,
+    t,
+    *,
+    cache=False,
+    verbose=None,
 ):
     """Regularize a decomposition matrix."""
     # ALWAYS regularize the out components according to norm, since
@@ -1400,7 +1744,7 @@ def _regularize(
     t_str = f"{t:8.3f}"
     if regularize is not None:  # regularize='in'
         in_removes, out_removes = _regularize_in(
-            int_order, ext_order, S_decomp, mag_or_fine, extended_remove
+            int_order, ext_order, S_decomp, mag_or_fine, extended_remove, cache=cache
         )
     else:
         in_removes = []
@@ -2352,8 +2696,35 @@ def _regularize_out(int_order, ext_order, mag_or_fine, extended_remove):
     return list(range(n_in, n_in + 3 * remove_homog)) + extended_remove
 
 
-def _regularize_in(int_order, ext_order, S_decomp, mag_or_fine, extended_remove):
+def _regularize_in(
+    int_order, ext_order, S_decomp, mag_or_fine, extended_remove, *, cache=False
+):
     """Regularize basis set using idealized SNR measure."""
+    func = _compute_regularize_in_cached if cache else _compute_regularize_in
+    in_removes, out_removes, eigs, I_tot, max_info = func(
+        int_order, ext_order, S_decomp, mag_or_fine, extended_remove
+    )
+    # log here so that cached results are reported, too
+    if len(eigs):
+        degrees, orders = _get_degrees_orders(int_order)
+        for eig, ri in zip(eigs, in_removes):
+            logger.debug(
+                f"            Condition {eig[0]:0.3f} / {eig[1]:0.3f} = "
+                f"{eig[0] / eig[1]:03.1f}, Removing in component "
+                f"{ri}: l={degrees[ri]}, m={orders[ri]:+0.0f}"
+            )
+    if max_info is not None:
+        logger.debug(
+            f"        Resulting information: {I_tot:0.1f} "
+            f"bits/sample ({100 * I_tot / max_info:0.1f}% of peak "
+            f"{max_info:0.1f})"
+        )
+    return in_removes, out_removes
+
+
+def _compute_regularize_in(
+    int_order, ext_order, S_decomp, mag_or_fine, extended_remove
+):
     n_in, n_out = _get_n_moments([int_order, ext_order])
 
     # The "signal" terms depend only on the inner expansion order
@@ -2433,21 +2804,14 @@ def _regularize_in(int_order, ext_order, S_decomp, mag_or_fine, extended_remove)
         max_info = np.max(I_tots)
         lim_idx = np.where(I_tots >= 0.98 * max_info)[0][0]
         in_removes = remove_order[:lim_idx]
-        for ii, ri in enumerate(in_removes):
-            eig = eigs[ii]
-            logger.debug(
-                f"            Condition {eig[0]:0.3f} / {eig[1]:0.3f} = "
-                f"{eig[0] / eig[1]:03.1f}, Removing in component "
-                f"{ri}: l={degrees[ri]}, m={orders[ri]:+0.0f}"
-            )
-        logger.debug(
-            f"        Resulting information: {I_tots[lim_idx]:0.1f} "
-            f"bits/sample ({100 * I_tots[lim_idx] / max_info:0.1f}% of peak "
-            f"{max_info:0.1f})"
-        )
+        I_tot = I_tots[lim_idx]
     else:
         in_removes = remove_order[:0]
-    return in_removes, out_removes
+        I_tot = max_info = None
+    return in_removes, out_removes, eigs[: len(in_removes)], I_tot, max_info
+
+
+_compute_regularize_in_cached = _custom_lru_cache(20)(_compute_regularize_in)
 
 
 def _compute_sphere_activation_in(degrees):
@@ -2666,7 +3030,11 @@ def find_bad_channels_maxwell(
        standard or z-score of the difference.
 
     Data are processed in chunks of the given ``duration``, and channels that
-    are bad for at least ``min_count`` chunks are returned.
+    are bad for at least ``min_count`` chunks are returned. Within a chunk,
+    the worst channel is excluded and steps 1 and 3-5 are repeated until no
+    channel exceeds the limit. Unless ``head_pos`` is used, the SSS
+    reconstruction of a chunk is updated as channels are excluded instead of
+    being recomputed, as long as the (regularized) SSS basis does not change.
 
     Channels marked as *flat* in step 2 are excluded from all subsequent steps
     of noisy channel detection.
@@ -2819,17 +3187,32 @@ def find_bad_channels_maxwell(
         # Bad pass
         chunk_noisy = list()
         params["st_duration"] = int(round(chunk_raw.times[-1] * raw.info["sfreq"]))
+        params["good_mask"][:] = [
+            chunk_raw.ch_names[pick] not in raw.info["bads"] + chunk_flats
+            for pick in params["meg_picks"]
+        ]
+        assert np.array_equal(params["meg_picks"][params["good_mask"]], these_picks)
+        if len(params["head_pos"][1]) == 1:
+            # Without movement, the reconstruction can be downdated as
+            # channels get excluded instead of rerunning SSS every time
+            sss = _DowndateSSS(orig_data[params["meg_picks"]], params)
+        else:
+            sss = None
         for n_iter in range(1, 101):  # iteratively exclude the worst ones
             assert set(raw.info["bads"]) & set(chunk_noisy) == set()
-            params["good_mask"][:] = [
-                chunk_raw.ch_names[pick]
-                not in raw.info["bads"] + chunk_noisy + chunk_flats
-                for pick in params["meg_picks"]
-            ]
-            chunk_raw._data[:] = orig_data
-            delta = chunk_raw.get_data(these_picks)
-            with use_log_level(_verbose_safe_false()):
-                _run_maxwell_filter(chunk_raw, copy=False, **params)
+            if sss is None:
+                params["good_mask"][:] = [
+                    chunk_raw.ch_names[pick]
+                    not in raw.info["bads"] + chunk_noisy + chunk_flats
+                    for pick in params["meg_picks"]
+                ]
+                chunk_raw._data[:] = orig_data
+                delta = chunk_raw.get_data(these_picks)
+                with use_log_level(_verbose_safe_false()):
+                    _run_maxwell_filter(chunk_raw, copy=False, **params)
+                delta -= chunk_raw.get_data(these_picks)
+            else:
+                delta = sss.residual()
 
             if n_iter == 1 and len(chunk_flats):
                 logger.info(
@@ -2837,7 +3220,6 @@ def find_bad_channels_maxwell(
                     len(chunk_flats),
                     " ".join(chunk_flats),
                 )
-            delta -= chunk_raw.get_data(these_picks)
             # p2p
             range_ = np.ptp(delta, axis=-1)
             cs_picks = np.searchsorted(params["meg_picks"], these_picks)
@@ -2858,6 +3240,8 @@ def find_bad_channels_maxwell(
             name = raw.ch_names[these_picks[idx]]
             logger.debug(f"            Bad:       {name} {max_:0.1f}")
             these_picks.pop(idx)
+            if sss is not None:
+                sss.exclude(idx)
             chunk_noisy.append(name)
         noisy_chs.update(chunk_noisy)
     noisy_chs = sorted(
@@ -2896,6 +3280,87 @@ def find_bad_channels_maxwell(
         return noisy_chs, flat_chs
 
 
+class _DowndateSSS:
+    """Reconstruct data with SSS while excluding good channels one by one.
+
+    Excluding a channel reruns the (regularized) decomposition for the
+    remaining channels. As long as it keeps the same basis, only rank-one
+    (Sherman-Morrison) downdates of the inverse Gram matrix of the (scaled and
+    column-normalized) basis and of the data projected onto it are needed,
+    which is equivalent to recomputing the pseudoinverse and the projection of
+    the data. Otherwise (e.g., when ``regularize="in"`` selects different
+    moments), the projection is recomputed for the new basis.
+    """
+
+    def __init__(self, data, params):
+        self.all_data = data
+        self.params = params
+        self._setup(*self._decompose())
+
+    def _decompose(self):
+        with use_log_level(_verbose_safe_false()):
+            _, S_decomp_full, pS_decomp, reg_moments, _ = self.params[
+                "_get_this_decomp_trans"
+            ](self.params["head_pos"][0][0], t=0.0, cache=True)
+        return S_decomp_full, pS_decomp, reg_moments
+
+    def _setup(self, S_decomp_full, pS_decomp, reg_moments):
+        good_mask = self.params["good_mask"]
+        self.S_decomp_full = S_decomp_full
+        self.reg_moments = reg_moments
+        self.good_idx = np.flatnonzero(good_mask)
+        self.cs = self.params["coil_scale"][good_mask]
+        S_decomp = S_decomp_full[good_mask]
+        norm = np.linalg.norm(S_decomp * self.cs, axis=0)
+        self.basis = S_decomp * self.cs / norm
+        self.recon = S_decomp / norm
+        pinv = pS_decomp / self.cs.T * norm[:, np.newaxis]
+        self.G_inv = pinv @ pinv.T
+        self.data = self.all_data[good_mask]
+        self.ctc = self.params["ctc"]
+        if self.ctc is not None:
+            self.ctc = self.ctc[good_mask][:, good_mask]
+            data = self.ctc @ self.data
+        else:
+            data = self.data
+        data = data * self.cs
+        self.coef = pinv @ data
+        self.proj = self.basis.T @ data
+        self.use = np.ones(len(self.data), bool)
+
+    def residual(self):
+        """Get the difference between the good data and their reconstruction."""
+        return self.data[self.use] - self.recon[self.use] @ self.coef
+
+    def exclude(self, idx):
+        """Exclude the idx-th of the currently used channels."""
+        ki = np.where(self.use)[0][idx]
+        self.params["good_mask"][self.good_idx[ki]] = False
+        decomp = self._decompose()
+        if not (
+            np.array_equal(decomp[2], self.reg_moments)
+            and np.array_equal(decomp[0], self.S_decomp_full)
+        ):
+            self._setup(*decomp)
+            return
+        if self.ctc is None:
+            data_k = self.data[ki]
+        else:
+            data_k = self.ctc[ki, self.use] @ self.data[self.use]
+        self.use[ki] = False
+        basis_k = self.basis[ki]
+        self.proj -= np.outer(basis_k, self.cs[ki] * data_k)
+        if self.ctc is not None:
+            # the cross-talk from this channel to the others goes away, too
+            leak = self.basis[self.use].T @ (
+                self.cs[self.use, 0] * self.ctc[self.use, ki]
+            )
+            self.proj -= np.outer(leak, self.data[ki])
+        G_inv_b = self.G_inv @ basis_k
+        self.G_inv += np.outer(G_inv_b, G_inv_b) / (1.0 - basis_k @ G_inv_b)
+        self.coef = self.G_inv @ self.proj
+
+
 def _read_cross_talk(cross_talk, ch_names):
     sss_ctc = dict()
     ctc = None
@@ -2998,5 +3463,5 @@ def compute_maxwell_basis(
     )
     _, S_decomp_full, pS_decomp, reg_moments, n_use_in = params[
         "_get_this_decomp_trans"
-    ](info["dev_head_t"], t=0.0)
+    ](info["dev_head_t"], t=0.0, cache=True)
     return S_decomp_full, pS_decomp, reg_moments, n_use_in
@@ -14,7 +14,7 @@ from ...utils import _validate_type, pinv, warn
 from ..nirs import _validate_nirs_info, source_detector_distances
 
 
-def beer_lambert_law(raw, ppf=6.0):
+def beer_lambert_law(raw, ppf=6.0, *, copy=True):
     r"""Convert NIRS optical density data to haemoglobin concentration.
 
     Parameters
@@ -26,13 +26,19 @@ def beer_lambert_law(raw, ppf=6.0):
 
         .. versionchanged:: 1.7
            Support for different factors for the two wavelengths.
+    copy : bool
+        If ``True`` (default), the data are copied. Otherwise the conversion
+        is done in place, which avoids holding two copies of the data.
+
+        .. versionadded:: 1.11
 
     Returns
     -------
     raw : instance of Raw
         The modified raw instance.
     """
-    raw = raw.copy().load_data()
+    raw = raw.copy() if copy else raw
+    raw.load_data()
     _validate_type(raw, BaseRaw, "raw")
     _validate_type(ppf, ("numeric", "array-like"), "ppf")
     ppf = np.array(ppf, float)
@@ -64,13 +70,19 @@ def beer_lambert_law(raw, ppf=6.0):
             "likely due to optode locations being stored in a "
             " unit other than meters."
         )
+    # pinv(abs_coef * distance * ppf) == pinv(abs_coef * ppf) / distance, so all
+    # pairs are converted at once (and zero distances give zero concentrations)
+    iEL = pinv(abs_coef * ppf) * 1e-3
+    distances = distances[picks[::2]]
+    scale = np.divide(1.0, distances, out=np.zeros_like(distances), where=distances > 0)
+    n_block = max(_MBLL_BLOCK_SIZE // len(picks), 1)
+    for start in range(0, len(raw.times), n_block):
+        sl = slice(start, start + n_block)
+        data = raw._data[picks, sl].reshape(len(picks) // 2, 2, -1)
+        data = np.einsum("ij,pjt->pit", iEL, data) * scale[:, np.newaxis, np.newaxis]
+        raw._data[picks, sl] = data.reshape(len(picks), -1)
     rename = dict()
     for ii, jj in zip(picks[::2], picks[1::2]):
-        EL = abs_coef * distances[ii] * ppf
-        iEL = pinv(EL)
-
-        raw._data[[ii, jj]] = iEL @ raw._data[[ii, jj]] * 1e-3
-
         # Update channel information
         coil_dict = dict(hbo=FIFF.FIFFV_COIL_FNIRS_HBO, hbr=FIFF.FIFFV_COIL_FNIRS_HBR)
         for ki, kind in zip((ii, jj), ("hbo", "hbr")):
@@ -85,6 +97,10 @@ def beer_lambert_law(raw, ppf=6.0):
     return raw
 
 
+# number of values (channels x samples) converted at once
+_MBLL_BLOCK_SIZE = 10_000_000
+
+
 def _load_absorption(freqs):
     """Load molar extinction coefficients."""
     # Data from https://omlc.org/spectra/hemoglobin/summary.html
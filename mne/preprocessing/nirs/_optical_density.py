@@ -11,13 +11,18 @@ from ..nirs import _validate_nirs_info
 
 
 @verbose
-def optical_density(raw, *, verbose=None):
+def optical_density(raw, *, copy=True, verbose=None):
     r"""Convert NIRS raw data to optical density.
 
     Parameters
     ----------
     raw : instance of Raw
         The raw data.
+    copy : bool
+        If ``True`` (default), the data are copied. Otherwise the conversion
+        is done in place, which avoids holding two copies of the data.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -25,7 +30,8 @@ def optical_density(raw, *, verbose=None):
     raw : instance of Raw
         The modified raw instance.
     """
-    raw = raw.copy().load_data()
+    raw = raw.copy() if copy else raw
+    raw.load_data()
     _validate_type(raw, BaseRaw, "raw")
     picks = _validate_nirs_info(raw.info, fnirs="cw_amplitude")
 
@@ -33,7 +39,7 @@ def optical_density(raw, *, verbose=None):
     # not occur. If they do it is likely due to hardware or movement issues.
     # Set all negative values to abs(x), this also has the benefit of ensuring
     # that the means are all greater than zero for the division below.
-    if np.any(raw._data[picks] <= 0):
+    if any(np.any(raw._data[pi] <= 0) for pi in picks):
         warn("Negative intensities encountered. Setting to abs(x)")
         min_ = np.inf
         for pi in picks:
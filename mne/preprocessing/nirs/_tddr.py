@@ -12,7 +12,7 @@ from ..nirs import _validate_nirs_info
 
 
 @verbose
-def temporal_derivative_distribution_repair(raw, *, verbose=None):
+def temporal_derivative_distribution_repair(raw, *, copy=True, verbose=None):
     """Apply temporal derivative distribution repair to data.
 
     Applies temporal derivative distribution repair (TDDR) to data
@@ -23,6 +23,11 @@ def temporal_derivative_distribution_repair(raw, *, verbose=None):
     ----------
     raw : instance of Raw
         The raw data.
+    copy : bool
+        If ``True`` (default), the data are copied. Otherwise the data are
+        modified in place.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -44,14 +49,18 @@ def temporal_derivative_distribution_repair(raw, *, verbose=None):
     ----------
     .. footbibliography::
     """
-    raw = raw.copy().load_data()
+    raw = raw.copy() if copy else raw
+    raw.load_data()
     _validate_type(raw, BaseRaw, "raw")
     picks = _validate_nirs_info(raw.info)
 
     if not len(picks):
         raise RuntimeError("TDDR should be run on optical density or hemoglobin data.")
-    for pick in picks:
-        raw._data[pick] = _TDDR(raw._data[pick], raw.info["sfreq"])
+    # process blocks of channels at once (each channel needs all of its samples)
+    n_block = max(int(_TDDR_BLOCK_BYTES // (8 * raw.n_times)), 1)
+    for start in range(0, len(picks), n_block):
+        block = picks[start : start + n_block]
+        raw._data[block] = _TDDR(raw._data[block].T, raw.info["sfreq"]).T
 
     return raw
 
@@ -59,10 +68,15 @@ def temporal_derivative_distribution_repair(raw, *, verbose=None):
 # provide a short alias
 tddr = temporal_derivative_distribution_repair
 
+# size (in bytes) of each of the (about ten) channels x samples temporary
+# arrays used by TDDR on a block of channels
+_TDDR_BLOCK_BYTES = 16e6
+
 
 # Taken from https://github.com/frankfishburn/TDDR/ (MIT license).
 # With permission https://github.com/frankfishburn/TDDR/issues/1.
-# The only modification is the name, scipy signal import and flake fixes.
+# Modifications are the name, scipy signal import, flake fixes, and the
+# processing of all channels at once (instead of one call per channel).
 def _TDDR(signal, sample_rate):
     # This function is the reference implementation for the TDDR algorithm for
     #   motion correction of fNIRS data, as described in:
@@ -84,20 +98,19 @@ def _TDDR(signal, sample_rate):
     #   signals_corrected: A [sample x channel] matrix of corrected optical
     #   density data
     signal = np.array(signal)
-    if len(signal.shape) != 1:
-        for ch in range(signal.shape[1]):
-            signal[:, ch] = _TDDR(signal[:, ch], sample_rate)
-        return signal
+    ndim = signal.ndim
+    # work on [channel x sample], each channel being processed independently
+    signal = np.atleast_2d(signal.T)
 
     # Preprocess: Separate high and low frequencies
     filter_cutoff = 0.5
     filter_order = 3
     Fc = filter_cutoff * 2 / sample_rate
-    signal_mean = np.mean(signal)
+    signal_mean = np.mean(signal, axis=-1, keepdims=True)
     signal -= signal_mean
     if Fc < 1:
         fb, fa = butter(filter_order, Fc)
-        signal_low = filtfilt(fb, fa, signal, padlen=0)
+        signal_low = filtfilt(fb, fa, signal, axis=-1, padlen=0)
     else:
         signal_low = signal
 
@@ -106,50 +119,67 @@ def _TDDR(signal, sample_rate):
     # Initialize
     tune = 4.685
     D = np.sqrt(np.finfo(signal.dtype).eps)
-    mu = np.inf
+    mu = np.full((len(signal), 1), np.inf)
 
     # Step 1. Compute temporal derivative of the signal
-    deriv = np.diff(signal_low)
+    deriv = np.diff(signal_low, axis=-1)
 
     # Step 2. Initialize observation weights
     w = np.ones(deriv.shape)
 
-    # Step 3. Iterative estimation of robust weights
+    # Step 3. Iterative estimation of robust weights (of the channels whose
+    # estimate has not converged yet)
+    active = np.arange(len(signal))
     for _ in range(50):
-        mu0 = mu
+        mu0 = mu[active]
+        this_deriv, this_w = deriv[active], w[active]
 
         # Step 3a. Estimate weighted mean
-        mu = np.sum(w * deriv) / np.sum(w)
+        this_mu = np.sum(this_w * this_deriv, axis=-1, keepdims=True)
+        this_mu /= np.sum(this_w, axis=-1, keepdims=True)
+        mu[active] = this_mu
 
         # Step 3b. Calculate absolute residuals of estimate
-        dev = np.abs(deriv - mu)
+        dev = this_deriv  # a copy, so we can operate in place
+        dev -= this_mu
+        np.abs(dev, out=dev)
 
         # Step 3c. Robust estimate of standard deviation of the residuals
-        sigma = 1.4826 * np.median(dev)
+        sigma = 1.4826 * np.median(dev, axis=-1, keepdims=True)
 
         # Step 3d. Scale deviations by standard deviation and tuning parameter
-        if sigma == 0:
-            break
-        r = dev / (sigma * tune)
+        nonzero = sigma[:, 0] != 0
+        if not nonzero.all():
+            active, mu0, this_mu = active[nonzero], mu0[nonzero], this_mu[nonzero]
+            dev, sigma = dev[nonzero], sigma[nonzero]
+        r = dev
+        r /= sigma * tune
 
         # Step 3e. Calculate new weights according to Tukey's biweight function
-        w = ((1 - r**2) * (r < 1)) ** 2
+        # (i.e., ((1 - r**2) * (r < 1)) ** 2)
+        r *= r
+        np.subtract(1.0, r, out=r)
+        np.maximum(r, 0.0, out=r)
+        r *= r
+        w[active] = r
 
         # Step 3f. Terminate if new estimate is within
         # machine-precision of old estimate
-        if abs(mu - mu0) < D * max(abs(mu), abs(mu0)):
+        converged = np.abs(this_mu - mu0) < D * np.maximum(np.abs(this_mu), np.abs(mu0))
+        active = active[~converged[:, 0]]
+        if not active.size:
             break
 
     # Step 4. Apply robust weights to centered derivative
     new_deriv = w * (deriv - mu)
 
     # Step 5. Integrate corrected derivative
-    signal_low_corrected = np.cumsum(np.insert(new_deriv, 0, 0.0))
+    signal_low_corrected = np.cumsum(np.insert(new_deriv, 0, 0.0, axis=-1), axis=-1)
 
     # Postprocess: Center the corrected signal
-    signal_low_corrected = signal_low_corrected - np.mean(signal_low_corrected)
+    signal_low_corrected -= np.mean(signal_low_corrected, axis=-1, keepdims=True)
 
     # Postprocess: Merge back with uncorrected high frequency component
     signal_corrected = signal_low_corrected + signal_high + signal_mean
 
-    return signal_corrected
+    return signal_corrected[0] if ndim == 1 else signal_corrected.T
@@ -6,10 +6,12 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
+from mne import create_info
 from mne.datasets import testing
 from mne.datasets.testing import data_path
-from mne.io import read_raw_nirx
-from mne.preprocessing.nirs import beer_lambert_law, optical_density, tddr
+from mne.io import RawArray, read_raw_nirx
+from mne.preprocessing.nirs import _tddr, beer_lambert_law, optical_density, tddr
+from mne.preprocessing.nirs._tddr import _TDDR
 
 fname_nirx_15_2 = (
     data_path(download=False) / "NIRx" / "nirscout" / "nirx_15_2_recording"
@@ -53,3 +55,64 @@ def test_temporal_derivative_distribution_repair(fname, tmp_path):
     assert np.max(np.diff(raw_hb._data[0])) < shift_amp
     assert_allclose(raw_hb._data[1], 0.0)  # unchanged
     assert_allclose(raw_hb._data[2], 1.0)  # unchanged
+
+
+def test_tddr_batched_in_place():
+    """Test TDDR on all channels at once and the in-place pipeline."""
+    rng = np.random.default_rng(0)
+    n_pairs, n_times = 20, 3000
+    ch_names = [
+        f"S{ii + 1}_D{ii + 1} {wl}" for ii in range(n_pairs) for wl in (760, 850)
+    ]
+    info = create_info(ch_names, 10.0, "fnirs_cw_amplitude")
+    data = np.exp(np.cumsum(rng.standard_normal((2 * n_pairs, n_times)), axis=1) * 1e-3)
+    data[:, n_times // 2 :] *= rng.uniform(0.5, 2, (2 * n_pairs, 1))  # shifts
+    raw = RawArray(data, info)
+    for ii, ch in enumerate(raw.info["chs"]):
+        ch["loc"][3:6] = [0.01 * (ii // 2), 0.0, 0.0]
+        ch["loc"][6:9] = [0.01 * (ii // 2), 0.03, 0.0]
+        ch["loc"][9] = (760, 850)[ii % 2]
+
+    raw_od = optical_density(raw)
+    # each channel converges after a different number of iterations
+    want = np.array([_TDDR(x, raw.info["sfreq"]) for x in raw_od.get_data()])
+    assert_allclose(_TDDR(raw_od.get_data().T, raw.info["sfreq"]).T, want)
+    raw_hb = beer_lambert_law(tddr(raw_od))
+    assert_allclose(tddr(raw_od)._data, want)
+
+    # in place
+    raw_in_place = raw.copy()
+    out = beer_lambert_law(
+        tddr(optical_density(raw_in_place, copy=False), copy=False), copy=False
+    )
+    assert out is raw_in_place
+    assert out.ch_names == raw_hb.ch_names
+    assert_allclose(out._data, raw_hb._data, rtol=1e-10, atol=1e-20)
+
+
+def test_tddr_long_blocks(monkeypatch):
+    """Test that long recordings still process several channels per block."""
+    rng = np.random.default_rng(0)
+    n_pairs, n_times = 10, 120_000
+    ch_names = [
+        f"S{ii + 1}_D{ii + 1} {wl}" for ii in range(n_pairs) for wl in (760, 850)
+    ]
+    info = create_info(ch_names, 10.0, "fnirs_od")
+    data = np.cumsum(rng.standard_normal((2 * n_pairs, n_times)), axis=1) * 1e-3
+    data[:, n_times // 2 :] += rng.uniform(-1, 1, (2 * n_pairs, 1))  # shifts
+    raw = RawArray(data, info)
+    for ii, ch in enumerate(raw.info["chs"]):
+        ch["loc"][3:6] = [0.01 * (ii // 2), 0.0, 0.0]
+        ch["loc"][6:9] = [0.01 * (ii // 2), 0.03, 0.0]
+        ch["loc"][9] = (760, 850)[ii % 2]
+    n_block = list()
+
+    def _count_tddr(signal, sample_rate):
+        n_block.append(signal.shape[1])
+        return _TDDR(signal, sample_rate)
+
+    monkeypatch.setattr(_tddr, "_TDDR", _count_tddr)
+    out = tddr(raw)
+    assert n_block == [16, 4]  # 16 MB per temporary array
+    want = np.array([_TDDR(x, raw.info["sfreq"]) for x in data])
+    assert_allclose(out.get_data(), want)
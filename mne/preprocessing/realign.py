@@ -6,12 +6,22 @@ import numpy as np
 from numpy.polynomial.polynomial import Polynomial
 from scipy.stats import pearsonr
 
+from .._fiff.pick import pick_types
 from ..io import BaseRaw
-from ..utils import _validate_type, logger, verbose, warn
+from ..utils import (
+    _check_chunk_duration,
+    _check_option,
+    _validate_type,
+    logger,
+    verbose,
+    warn,
+)
 
 
 @verbose
-def realign_raw(raw, other, t_raw, t_other, *, verbose=None):
+def realign_raw(
+    raw, other, t_raw, t_other, *, drift="linear", chunk_duration=None, verbose=None
+):
     """Realign two simultaneous recordings.
 
     Due to clock drift, recordings at a given same sample rate made by two
@@ -32,6 +42,25 @@ def realign_raw(raw, other, t_raw, t_other, *, verbose=None):
             find_events(raw)[:, 0] / raw.info["sfreq"] - raw.first_time
     t_other : array-like, shape (n_events,)
         The times of shared events in ``other`` relative to ``other.times[0]``.
+    drift : ``'linear'`` | ``'piecewise'``
+        The clock drift model. ``'linear'`` (default) estimates a single
+        offset and drift rate. ``'piecewise'`` fits a continuous
+        piecewise-linear function with a knot every 20 events, which can
+        follow drift rates that change during long recordings. It uses the
+        fractional-delay resampler (see ``chunk_duration``).
+
+        .. versionadded:: 1.11
+    chunk_duration : float | None
+        Duration (in seconds) of output data to process at a time with the
+        windowed-sinc fractional-delay (polyphase) filter, which interpolates
+        ``other`` at the sample times of ``raw`` while reading it in chunks, so
+        that ``other`` does not need to be preloaded. With ``drift='linear'``,
+        None (default) instead loads ``other`` and resamples it with
+        :meth:`mne.io.Raw.resample`, and a float selects the fractional-delay
+        filter. With ``drift='piecewise'``, the fractional-delay filter is
+        always used and None means chunks of 10 s.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Notes
@@ -47,6 +76,9 @@ def realign_raw(raw, other, t_raw, t_other, *, verbose=None):
     5. Crop the end of ``raw`` or ``other``, depending on which stopped
        recording first (and the clock drift rate).
 
+    With ``drift='piecewise'`` or ``chunk_duration``, stim channels are
+    realigned by taking the nearest sample instead of being filtered.
+
     This function is primarily designed to work on recordings made at the same
     sample rate, but it can also operate on recordings made at different
     sample rates to resample and deal with clock drift simultaneously.
@@ -65,10 +97,23 @@ def realign_raw(raw, other, t_raw, t_other, *, verbose=None):
     if len(t_raw) < 20:
         warn("Fewer than 20 times passed, results may be unreliable")
 
+    _check_option("drift", drift, ("linear", "piecewise"))
+    # chunks are counted in output (i.e., raw) samples
+    n_chunk = _check_chunk_duration(chunk_duration, raw.info["sfreq"])
+    fractional = drift == "piecewise" or n_chunk is not None
+
     # 1. Compute correction factors
-    poly = Polynomial.fit(x=t_other, y=t_raw, deg=1)
-    converted = poly.convert(domain=(-1, 1))
-    [zero_ord, first_ord] = converted.coef
+    if drift == "linear":
+        poly = Polynomial.fit(x=t_other, y=t_raw, deg=1)
+        converted = poly.convert(domain=(-1, 1))
+        [zero_ord, first_ord] = converted.coef
+        knots = np.array([0.0, 1.0])
+        values = zero_ord + first_ord * knots
+    else:
+        knots, values = _fit_piecewise_linear(t_other, t_raw)
+        logger.info(f"Fitted {len(knots) - 1} linear drift segment(s)")
+        zero_ord = _interp_extrap(0.0, knots, values)
+        first_ord = (values[-1] - values[0]) / (knots[-1] - knots[0])
     logger.info(
         f"Zero order coefficient: {zero_ord} \nFirst order coefficient: {first_ord}"
     )
@@ -80,6 +125,10 @@ def realign_raw(raw, other, t_raw, t_other, *, verbose=None):
         warn(msg + ", results may be unreliable")
     else:
         logger.info(msg)
+    if np.any(np.diff(values) <= 0):
+        raise ValueError(
+            "The estimated drift model is not monotonic, cannot resample safely"
+        )
     dr_ms_s = 1000 * abs(1 - first_ord)
     logger.info(
         f"Drift rate: {1000 * dr_ms_s:0.1f} μs/s "
@@ -90,36 +139,54 @@ def realign_raw(raw, other, t_raw, t_other, *, verbose=None):
     # 2. Crop start of recordings to match
     if zero_ord > 0:  # need to crop start of raw to match other
         logger.info(f"Cropping {zero_ord:0.3f} s from the start of raw")
+        first_time = raw.first_time
         raw.crop(zero_ord, None)
         t_raw -= zero_ord
+        # the crop snaps to a sample, so shift by the amount actually removed
+        values = values - (raw.first_time - first_time)
     elif zero_ord < 0:  # need to crop start of other to match raw
-        t_crop = -zero_ord / first_ord
+        if drift == "linear":
+            t_crop = -zero_ord / first_ord
+        else:
+            t_crop = _interp_extrap(0.0, values, knots)
         logger.info(f"Cropping {t_crop:0.3f} s from the start of other")
+        first_time = other.first_time
         other.crop(t_crop, None)
         t_other -= t_crop
+        knots = knots - (other.first_time - first_time)
 
     # 3. Resample data using the first-order term
-    nan_ch_names = [
-        ch for ch in other.info["ch_names"] if np.isnan(other.get_data(picks=ch)).any()
-    ]
-    if len(nan_ch_names) > 0:  # Issue warning if any channel in other has nan values
-        warn(
-            f"Channel(s) {', '.join(nan_ch_names)} in `other` contain NaN values. "
-            "Resampling these channels will result in the whole channel being NaN. "
-            "(If realigning eye-tracking data, consider using interpolate_blinks and "
-            "passing interpolate_gaze=True)"
-        )
-    logger.info("Resampling other")
-    sfreq_new = raw.info["sfreq"] * first_ord
-    other.load_data().resample(sfreq_new)
-    with other.info._unlock():
-        other.info["sfreq"] = raw.info["sfreq"]
+    if fractional:
+        first_time = other.first_time
+        _realign_fractional(other, raw.info["sfreq"], knots, values, n_chunk)
+    else:
+        nan_ch_names = [
+            ch
+            for ch in other.info["ch_names"]
+            if np.isnan(other.get_data(picks=ch)).any()
+        ]
+        _warn_nan_channels(nan_ch_names)
+        logger.info("Resampling other")
+        sfreq_new = raw.info["sfreq"] * first_ord
+        other.load_data().resample(sfreq_new)
+        with other.info._unlock():
+            other.info["sfreq"] = raw.info["sfreq"]
 
     # 4. Realign the onsets and durations in other.annotations
     # Must happen before end cropping to avoid losing annotations
     logger.info("Correcting annotations in other")
-    other.annotations.onset *= first_ord
-    other.annotations.duration *= first_ord
+    if fractional:
+        onset = other.annotations.onset - first_time
+        offset = onset + other.annotations.duration
+        onset, offset = (
+            _interp_extrap(onset, knots, values),
+            _interp_extrap(offset, knots, values),
+        )
+        other.annotations.onset = onset + other.first_time
+        other.annotations.duration = offset - onset
+    else:
+        other.annotations.onset *= first_ord
+        other.annotations.duration *= first_ord
 
     # 5. Crop the end of one of the recordings if necessary
     delta = raw.times[-1] - other.times[-1]
@@ -130,3 +197,142 @@ def realign_raw(raw, other, t_raw, t_other, *, verbose=None):
     elif delta < 0:
         logger.info(msg + "other")
         other.crop(0, raw.times[-1])
+
+
+def _warn_nan_channels(nan_ch_names):
+    if len(nan_ch_names) > 0:  # Issue warning if any channel in other has nan values
+        warn(
+            f"Channel(s) {', '.join(nan_ch_names)} in `other` contain NaN values. "
+            "Resampling these channels will result in the whole channel being NaN. "
+            "(If realigning eye-tracking data, consider using interpolate_blinks and "
+            "passing interpolate_gaze=True)"
+        )
+
+
+def _interp_extrap(x, xp, fp):
+    """Evaluate a piecewise-linear function, extrapolating linearly."""
+    x = np.asarray(x, float)
+    out = np.interp(x, xp, fp)
+    for sl, mask in ((slice(None, 2), x < xp[0]), (slice(-2, None), x > xp[-1])):
+        slope = (fp[sl][1] - fp[sl][0]) / (xp[sl][1] - xp[sl][0])
+        out = np.where(mask, fp[sl][0] + (x - xp[sl][0]) * slope, out)
+    return out[()] if out.ndim == 0 else out
+
+
+def _fit_piecewise_linear(x, y, n_per_segment=20):
+    """Fit a continuous piecewise-linear function of x to y.
+
+    Knots are placed every ``n_per_segment`` points (sorted along x) so that
+    each segment is estimated from at least ``n_per_segment`` points.
+    """
+    order = np.argsort(x)
+    x, y = x[order], y[order]
+    inner = x[n_per_segment : len(x) - n_per_segment + 1 : n_per_segment]
+    knots = np.unique(np.concatenate([[x[0]], inner, [x[-1]]]))
+
+    def _basis(t):
+        return np.column_stack(
+            [np.ones_like(t), t] + [np.maximum(t - knot, 0) for knot in knots[1:-1]]
+        )
+
+    coef = np.linalg.lstsq(_basis(x), y, rcond=None)[0]
+    return knots, _basis(knots) @ coef
+
+
+# half-width (in samples) and number of phases of the fractional-delay filter
+_FD_HALF_WIDTH = 32
+_FD_N_PHASES = 512
+# default duration (in s) of output processed at a time; the taps of a chunk
+# take 2 * half_width floats per output sample, so this bounds memory usage
+_FD_CHUNK_DURATION = 10.0
+
+
+def _fractional_delay_table(half_width, cutoff):
+    """Tabulate the windowed-sinc fractional-delay filter for each phase.
+
+    Row ``p`` holds the taps applied to samples ``n - half_width + 1`` to
+    ``n + half_width`` to interpolate the signal at ``n + p / _FD_N_PHASES``.
+    """
+    offsets = np.arange(-half_width + 1, half_width + 1)
+    phases = np.arange(_FD_N_PHASES + 1) / _FD_N_PHASES
+    x = phases[:, np.newaxis] - offsets
+    table = 2 * cutoff * np.sinc(2 * cutoff * x)
+    # Kaiser window (beta=8.6) evaluated at the fractional tap positions
+    beta = 8.6
+    table *= np.i0(beta * np.sqrt(np.clip(1 - (x / half_width) ** 2, 0, 1)))
+    table /= np.i0(beta)
+    table /= table.sum(axis=1, keepdims=True)  # unit gain at DC
+    return offsets, table
+
+
+def _realign_fractional(other, sfreq, knots, values, n_chunk):
+    """Interpolate other at the sample times of raw, reading it in chunks."""
+    o_sfreq = other.info["sfreq"]
+    n_in = other.n_times
+    n_out = int(np.floor(_interp_extrap(other.times[-1], knots, values) * sfreq)) + 1
+    # position of each output sample in (fractional) samples of other
+    pos = _interp_extrap(np.arange(n_out) / sfreq, values, knots) * o_sfreq
+    # lowpass at the output Nyquist frequency when samples get sparser
+    ratio = min(sfreq * np.min(np.diff(values) / np.diff(knots)) / o_sfreq, 1.0)
+    half_width = int(np.ceil(_FD_HALF_WIDTH / ratio))
+    offsets, table = _fractional_delay_table(half_width, 0.5 * ratio)
+    stim_picks = pick_types(other.info, meg=False, ref_meg=False, stim=True)
+    if n_chunk is None:
+        n_chunk = _check_chunk_duration(_FD_CHUNK_DURATION, sfreq)
+    logger.info(
+        f"Resampling other with a {2 * half_width}-tap fractional-delay filter "
+        f"in {int(np.ceil(n_out / n_chunk))} chunk(s)"
+    )
+    new_data = np.empty((len(other.ch_names), n_out))
+    nan_chs = np.zeros(len(other.ch_names), bool)
+    for start in range(0, n_out, n_chunk):
+        this_pos = pos[start : start + n_chunk]
+        base = np.floor(this_pos).astype(int)
+        phase = (this_pos - base) * _FD_N_PHASES
+        idx = np.floor(phase).astype(int)
+        frac = (phase - idx)[:, np.newaxis]
+        taps = table[idx] * (1 - frac) + table[np.minimum(idx + 1, _FD_N_PHASES)] * frac
+        read_start = max(base[0] + offsets[0], 0)
+        read_stop = min(base[-1] + offsets[-1] + 1, n_in)
+        data = other.get_data(start=read_start, stop=read_stop)
+        nan_chs |= np.isnan(data).any(axis=1)
+        out = new_data[:, start : start + n_chunk]
+        out.fill(0.0)
+        for ti, offset in enumerate(offsets):
+            # extend the edges of other by repeating its first and last samples
+            this_idx = np.clip(base + offset, 0, n_in - 1) - read_start
+            out += data[:, this_idx] * taps[:, ti]
+        if len(stim_picks):
+            stim = data[stim_picks]
+            nearest = np.clip(np.round(this_pos).astype(int), 0, n_in - 1)
+            out[stim_picks] = stim[:, nearest - read_start]
+            # make sure that no nonzero stim sample is skipped (when other has
+            # more samples than raw) by placing it at its nearest output sample
+            ci, ii = np.nonzero(stim)
+            ki = np.clip(np.searchsorted(pos, ii + read_start), 1, n_out - 1)
+            left = ii + read_start - pos[ki - 1] <= pos[ki] - ii - read_start
+            ki[left] -= 1
+            keep = (
+                (ki >= start)
+                & (ki < start + len(this_pos))
+                & (np.abs(pos[ki] - ii - read_start) < 1)
+            )
+            ci, ii, ki = ci[keep], ii[keep], ki[keep] - start
+            keep = out[stim_picks[ci], ki] == 0
+            out[stim_picks[ci[keep]], ki[keep]] = stim[ci[keep], ii[keep]]
+    _warn_nan_channels([other.ch_names[ci] for ci in np.flatnonzero(nan_chs)])
+
+    # update the raw instance as Raw.resample does
+    in_offsets = np.cumsum(other._raw_lengths)[:-1]
+    n_news = np.diff(np.concatenate([[0], np.searchsorted(pos, in_offsets), [n_out]]))
+    ratio = n_out / n_in
+    other._cropped_samp = int(np.round(other._cropped_samp * ratio))
+    other._first_samps = np.round(other._first_samps * ratio).astype(int)
+    other._last_samps = np.array(other._first_samps) + n_news - 1
+    other._data = new_data
+    other.preload = True
+    lowpass = other.info.get("lowpass")
+    lowpass = np.inf if lowpass is None else lowpass
+    with other.info._unlock():
+        other.info["lowpass"] = min(lowpass, sfreq / 2.0)
+        other.info["sfreq"] = sfreq
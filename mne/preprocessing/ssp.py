@@ -8,9 +8,17 @@ import numpy as np
 
 from .._fiff.pick import pick_types
 from .._fiff.reference import make_eeg_average_ref_proj
+from ..cov import _check_n_samples
 from ..epochs import Epochs
-from ..proj import compute_proj_epochs, compute_proj_evoked
-from ..utils import _validate_type, logger, verbose, warn
+from ..evoked import combine_evoked
+from ..filter import create_filter
+from ..proj import (
+    _compute_proj,
+    _epochs_desc_prefix,
+    compute_proj_epochs,
+    compute_proj_evoked,
+)
+from ..utils import _check_chunk_duration, _pl, _validate_type, logger, verbose, warn
 from .ecg import find_ecg_events
 from .eog import find_eog_events
 
@@ -55,12 +63,17 @@ def _compute_exg_proj(
     return_drop_log,
     copy,
     meg,
+    chunk_duration,
     verbose,
 ):
     """Compute SSP/PCA projections for ECG or EOG artifacts."""
+    n_chunk = _check_chunk_duration(chunk_duration, raw.info["sfreq"])
+    if raw.preload:
+        n_chunk = None  # the data are already in memory
     raw = raw.copy() if copy else raw
     del copy
-    raw.load_data()  # we will filter it later
+    if n_chunk is None:
+        raw.load_data()  # we will filter it later
 
     if no_proj:
         projs = []
@@ -235,12 +248,8 @@ def _compute_exg_proj(
         my_info, meg=True, eeg=True, eog=True, ecg=True, ref_meg=ref_meg, exclude="bads"
     )
 
-    raw.filter(
-        l_freq,
-        h_freq,
-        picks=picks,
+    filter_kwargs = dict(
         filter_length=filter_length,
-        n_jobs=n_jobs,
         method=filter_method,
         iir_params=iir_params,
         l_trans_bandwidth=0.5,
@@ -248,13 +257,7 @@ def _compute_exg_proj(
         phase="zero-double",
         fir_design="firwin2",
     )
-
-    epochs = Epochs(
-        raw,
-        events,
-        None,
-        tmin,
-        tmax,
+    epochs_kwargs = dict(
         baseline=None,
         preload=True,
         picks=picks,
@@ -262,21 +265,43 @@ def _compute_exg_proj(
         flat=flat,
         proj=True,
     )
-
-    drop_log = epochs.drop_log
-    if epochs.events.shape[0] < 1:
-        warn("No good epochs found")
-        return ([], events) + ((drop_log,) if return_drop_log else ())
-
-    if average:
-        evoked = epochs.average()
-        ev_projs = compute_proj_evoked(
-            evoked, n_grad=n_grad, n_mag=n_mag, n_eeg=n_eeg, meg=meg
+    if n_chunk is not None:
+        ev_projs, drop_log = _compute_exg_proj_chunked(
+            raw,
+            events,
+            tmin,
+            tmax,
+            l_freq,
+            h_freq,
+            picks,
+            n_chunk,
+            filter_kwargs,
+            epochs_kwargs,
+            average,
+            n_grad,
+            n_mag,
+            n_eeg,
+            n_jobs,
+            meg,
         )
     else:
-        ev_projs = compute_proj_epochs(
-            epochs, n_grad=n_grad, n_mag=n_mag, n_eeg=n_eeg, n_jobs=n_jobs, meg=meg
-        )
+        raw.filter(l_freq, h_freq, picks=picks, n_jobs=n_jobs, **filter_kwargs)
+        epochs = Epochs(raw, events, None, tmin, tmax, **epochs_kwargs)
+        drop_log = epochs.drop_log
+        if epochs.events.shape[0] < 1:
+            ev_projs = None
+        elif average:
+            evoked = epochs.average()
+            ev_projs = compute_proj_evoked(
+                evoked, n_grad=n_grad, n_mag=n_mag, n_eeg=n_eeg, meg=meg
+            )
+        else:
+            ev_projs = compute_proj_epochs(
+                epochs, n_grad=n_grad, n_mag=n_mag, n_eeg=n_eeg, n_jobs=n_jobs, meg=meg
+            )
+    if ev_projs is None:
+        warn("No good epochs found")
+        return ([], events) + ((drop_log,) if return_drop_log else ())
 
     for p in ev_projs:
         p["desc"] = mode + "-" + p["desc"]
@@ -286,6 +311,88 @@ def _compute_exg_proj(
     return (projs, events) + ((drop_log,) if return_drop_log else ())
 
 
+def _compute_exg_proj_chunked(
+    raw,
+    events,
+    tmin,
+    tmax,
+    l_freq,
+    h_freq,
+    picks,
+    n_chunk,
+    filter_kwargs,
+    epochs_kwargs,
+    average,
+    n_grad,
+    n_mag,
+    n_eeg,
+    n_jobs,
+    meg,
+):
+    """Compute ExG projectors reading and filtering one chunk at a time."""
+    sfreq = raw.info["sfreq"]
+    filt = create_filter(None, sfreq, l_freq, h_freq, **filter_kwargs)
+    # samples affected by the edges of each filtered chunk (the IIR ringing
+    # estimate is doubled for the forward-backward pass)
+    n_pad = len(filt) if isinstance(filt, np.ndarray) else 2 * filt["padlen"]
+    n_pad = int(n_pad) + 1
+    rel = events[:, 0] - raw.first_samp
+    win = (int(np.round(tmin * sfreq)), int(np.round(tmax * sfreq)))
+    # split the (consecutive) events by the chunk their onset falls into
+    splits = np.flatnonzero(np.diff(rel // n_chunk)) + 1
+
+    drop_log, evokeds, epochs = (), list(), None
+    data, n_samples = 0.0, 0
+    for block in np.split(np.arange(len(events)), splits):
+        read_start = max(rel[block].min() + win[0] - n_pad, 0)
+        read_stop = min(rel[block].max() + win[1] + n_pad, raw.n_times - 1)
+        raw_chunk = raw.copy().crop(
+            read_start / sfreq, read_stop / sfreq, include_tmax=True
+        )
+        raw_chunk.load_data(verbose=False)
+        raw_chunk.filter(
+            l_freq, h_freq, picks=picks, n_jobs=n_jobs, verbose=False, **filter_kwargs
+        )
+        block_epochs = Epochs(
+            raw_chunk, events[block], None, tmin, tmax, verbose=False, **epochs_kwargs
+        )
+        del raw_chunk
+        drop_log += block_epochs.drop_log
+        if len(block_epochs) == 0:
+            continue
+        epochs = block_epochs
+        if average:
+            evokeds.append(epochs.average())
+        else:
+            this_data = epochs.get_data(copy=False).transpose(1, 0, 2)
+            this_data = this_data.reshape(len(epochs.ch_names), -1)
+            data += np.dot(this_data, this_data.T)
+            n_samples += this_data.shape[1]
+    logger.info(
+        f"Read {len(splits) + 1} chunk{_pl(len(splits) + 1)}, "
+        f"dropped {sum(map(bool, drop_log))}/{len(drop_log)} epochs"
+    )
+    if epochs is None:
+        return None, drop_log
+    if average:
+        evoked = combine_evoked(evokeds, weights="nave")
+        ev_projs = compute_proj_evoked(
+            evoked, n_grad=n_grad, n_mag=n_mag, n_eeg=n_eeg, meg=meg
+        )
+    else:
+        _check_n_samples(n_samples, len(epochs.ch_names))
+        ev_projs = _compute_proj(
+            data,
+            epochs.info,
+            n_grad,
+            n_mag,
+            n_eeg,
+            _epochs_desc_prefix(epochs),
+            meg=meg,
+        )
+    return ev_projs, drop_log
+
+
 @verbose
 def compute_proj_ecg(
     raw,
@@ -316,13 +423,16 @@ def compute_proj_ecg(
     copy=True,
     return_drop_log=False,
     meg="separate",
+    *,
+    chunk_duration=None,
     verbose=None,
 ):
     """Compute SSP (signal-space projection) vectors for ECG artifacts.
 
     %(compute_proj_ecg)s
 
-    .. note:: Raw data will be loaded if it hasn't been preloaded already.
+    .. note:: Raw data will be loaded if it hasn't been preloaded already,
+              unless ``chunk_duration`` is used.
 
     Parameters
     ----------
@@ -392,6 +502,16 @@ def compute_proj_ecg(
         projectors computed for MEG will be ``n_mag``.
 
         .. versionadded:: 0.18
+    chunk_duration : float | None
+        If float and ``raw`` is not preloaded, the data are read, filtered,
+        and epoched in consecutive chunks of this duration (in seconds) plus
+        the padding required by the filter, and the projectors are computed
+        from sums accumulated across chunks. This keeps the memory usage
+        bounded for long recordings, and ``raw`` is never loaded or modified
+        (regardless of ``copy``). The projectors match those computed from
+        the whole recording up to numerical precision. Defaults to None.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -444,6 +564,7 @@ def compute_proj_ecg(
         return_drop_log,
         copy,
         meg,
+        chunk_duration,
         verbose,
     )
 
@@ -477,13 +598,16 @@ def compute_proj_eog(
     copy=True,
     return_drop_log=False,
     meg="separate",
+    *,
+    chunk_duration=None,
     verbose=None,
 ):
     """Compute SSP (signal-space projection) vectors for EOG artifacts.
 
     %(compute_proj_eog)s
 
-    .. note:: Raw data must be preloaded.
+    .. note:: Raw data will be loaded if it hasn't been preloaded already,
+              unless ``chunk_duration`` is used.
 
     Parameters
     ----------
@@ -549,6 +673,16 @@ def compute_proj_eog(
         projectors computed for MEG will be ``n_mag``.
 
         .. versionadded:: 0.18
+    chunk_duration : float | None
+        If float and ``raw`` is not preloaded, the data are read, filtered,
+        and epoched in consecutive chunks of this duration (in seconds) plus
+        the padding required by the filter, and the projectors are computed
+        from sums accumulated across chunks. This keeps the memory usage
+        bounded for long recordings, and ``raw`` is never loaded or modified
+        (regardless of ``copy``). The projectors match those computed from
+        the whole recording up to numerical precision. Defaults to None.
+
+        .. versionadded:: 1.11
     %(verbose)s
 
     Returns
@@ -601,5 +735,6 @@ def compute_proj_eog(
         return_drop_log,
         copy,
         meg,
+        chunk_duration,
         verbose,
     )
@@ -9,6 +9,7 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+from numpy.testing import assert_allclose, assert_array_equal
 
 from mne import create_info
 from mne.annotations import Annotations
@@ -294,6 +295,40 @@ def test_flat_bad_acq_skip():
     _check_annotation(raw_, annots[1], None, 0, 700, 799)
 
 
+@pytest.mark.parametrize("chunk_duration", (0.001, 0.037, 10.0))
+def test_annotate_amplitude_chunked(chunk_duration, tmp_path):
+    """Test annotate_amplitude on chunks of non-preloaded data."""
+    n_ch, n_times = 6, 2000
+    data = np.random.RandomState(0).randn(n_ch, n_times)
+    data[0, 1600:] = 0.0
+    data[1, 850:950] = 0.0
+    data[2, :200] = np.arange(0, 200 * 10, 10)
+    data[3, 1000:1300] = 0.0
+    data[3, 1400:1403] = 0.0  # too short
+    data[4, 1200:1300] = np.arange(0, 100 * 10, 10)
+    info = create_info(n_ch, 1000.0, ["eeg"] * 3 + ["mag"] * 3)
+    raw = RawArray(data, info)
+    raw.save(tmp_path / "test_raw.fif")
+    raw_lazy = read_raw_fif(tmp_path / "test_raw.fif")
+    annots = Annotations([0.9, 1.25], [0.2, 0.01], ["bad_acq_skip"] * 2)
+    raw.set_annotations(annots)
+    raw_lazy.set_annotations(annots)
+    for bad_percent in (5, 10, 20.1):
+        kwargs = dict(peak=5, flat=0.0, bad_percent=bad_percent)
+        want_annots, want_bads = annotate_amplitude(raw, **kwargs)
+        annots, bads = annotate_amplitude(
+            raw_lazy, chunk_duration=chunk_duration, **kwargs
+        )
+        assert not raw_lazy.preload
+        assert bads == want_bads
+        assert len(annots) > 0
+        assert_array_equal(annots.description, want_annots.description)
+        assert_allclose(annots.onset, want_annots.onset, atol=1e-6)
+        assert_allclose(annots.duration, want_annots.duration, atol=1e-6)
+    with pytest.raises(ValueError, match="'chunk_duration' should be positive"):
+        annotate_amplitude(raw, peak=5, chunk_duration=0)
+
+
 def _check_annotation(raw, annot, meas_date, first_samp, start_idx, stop_idx):
     """Util function to check an annotation."""
     assert meas_date == annot["orig_time"]
@@ -6,10 +6,10 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose, assert_array_equal
 
-from mne import Annotations, events_from_annotations
+from mne import Annotations, create_info, events_from_annotations
 from mne.chpi import read_head_pos
 from mne.datasets import testing
-from mne.io import read_raw_fif
+from mne.io import RawArray, read_raw_fif
 from mne.preprocessing import (
     annotate_break,
     annotate_movement,
@@ -190,6 +190,31 @@ def test_muscle_annotation_without_meeg_data(meas_date):
         annotate_muscle_zscore(raw, threshold=10)
 
 
+def test_muscle_annotation_chunked(tmp_path):
+    """Test annotate_muscle_zscore on chunks of non-preloaded data."""
+    sfreq = 1000.0
+    rng = np.random.RandomState(0)
+    data = rng.randn(5, int(20 * sfreq)) * 1e-6
+    times = np.arange(data.shape[1]) / sfreq
+    burst = (times > 5) & (times < 6) | (times > 15) & (times < 15.5)
+    data += 6e-6 * np.sin(2 * np.pi * 120 * times) * burst
+    raw = RawArray(data, create_info(5, sfreq, "eeg"))
+    raw.set_annotations(Annotations([10], [1], ["BAD_segment"]))
+    raw.save(tmp_path / "test_raw.fif")
+    raw_lazy = read_raw_fif(tmp_path / "test_raw.fif")
+    want_annot, want_scores = annotate_muscle_zscore(raw, threshold=4)
+    annot, scores = annotate_muscle_zscore(raw_lazy, threshold=4, chunk_duration=3.0)
+    assert not raw_lazy.preload
+    assert_array_equal(np.isnan(scores), np.isnan(want_scores))
+    # the padding of the chunks makes edge effects negligible
+    inner = slice(int(sfreq), -int(sfreq))
+    assert_allclose(scores[inner], want_scores[inner], atol=1e-3)
+    _assert_annotations_equal(annot, want_annot)
+    assert len(annot) == 2
+    with pytest.raises(ValueError, match="'chunk_duration' should be positive"):
+        annotate_muscle_zscore(raw, chunk_duration=-1)
+
+
 @pytest.mark.parametrize("meas_date", (None, "orig"))
 @testing.requires_testing_data
 def test_annotate_breaks(meas_date):
@@ -227,3 +227,39 @@ def test_compute_bridged_electrodes():
     picks = list(picks)
     assert np.all(ed_matrix[:, picks.index(idx0), picks.index(idx1)] == 0)
     assert np.all(np.isnan(ed_matrix[0][np.tril_indices(len(picks), -1)]))
+
+
+def test_compute_bridged_electrodes_chunked(tmp_path):
+    """Test computing bridged electrodes from covariances and in chunks."""
+    rng = np.random.default_rng(0)
+    sfreq, n_times = 250.0, 15000
+    data = rng.standard_normal((32, 4)) @ rng.standard_normal((4, n_times))
+    data = (data + rng.standard_normal((32, n_times))) * 10e-6
+    data[4] = data[3] + rng.standard_normal(n_times) * 0.5e-6
+    data[21] = data[20]
+    raw = RawArray(data, create_info(32, sfreq, "eeg"))
+    bridged_idx, ed_matrix = compute_bridged_electrodes(raw)
+    assert bridged_idx == [(3, 4), (20, 21)]
+    assert np.all(ed_matrix[:, 20, 21] == 0)
+    # compare with the variance of the differences
+    epochs_data = (
+        raw.copy()
+        .filter(0.5, 30)
+        .get_data()[:, : ed_matrix.shape[0] * 500]
+        .reshape(32, -1, 500)
+        .transpose(1, 0, 2)
+    )
+    for ii, jj in ((0, 1), (3, 4), (5, 31)):
+        want = np.var(epochs_data[:, ii] - epochs_data[:, jj], axis=1) * 1e12
+        assert_allclose(ed_matrix[:, ii, jj], want, rtol=1e-3, atol=1e-3)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw = read_raw_fif(fname)
+    bridged_idx_chunk, ed_matrix_chunk = compute_bridged_electrodes(
+        raw, chunk_duration=7.0
+    )
+    assert not raw.preload
+    assert bridged_idx_chunk == bridged_idx
+    assert_allclose(ed_matrix_chunk, ed_matrix, rtol=1e-3, atol=1e-3)
+    with pytest.raises(ValueError, match="should be positive"):
+        compute_bridged_electrodes(raw, chunk_duration=-1)
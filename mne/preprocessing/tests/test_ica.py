@@ -25,6 +25,7 @@ from mne import (
     EpochsArray,
     EvokedArray,
     Info,
+    compute_proj_raw,
     create_info,
     make_ad_hoc_cov,
     pick_channels_regexp,
@@ -183,6 +184,138 @@ def test_ica_simple(method):
     assert amari_distance < 0.1
 
 
+@pytest.mark.parametrize("noise_cov", (False, True))
+def test_ica_fit_stream(noise_cov, tmp_path, monkeypatch):
+    """Test fitting infomax on Raw data streamed from disk."""
+    n_components = 3
+    n_samples = 20000
+    rng = np.random.RandomState(0)
+    S = rng.laplace(size=(n_components, n_samples))
+    A = rng.randn(n_components, n_components)
+    info = create_info(n_components, 1000.0, "eeg")
+    with info._unlock():
+        info["highpass"] = 1.0
+    fname = tmp_path / "test_raw.fif"
+    RawArray(np.dot(A, S) * 1e-5, info).save(fname)
+    raw = read_raw_fif(fname)
+    cov = make_ad_hoc_cov(info) if noise_cov else None
+    # force the data to be read in several chunks
+    monkeypatch.setattr("mne.preprocessing.ica._ICA_STREAM_BYTES", 8 * 3 * 3000)
+    ica = ICA(
+        n_components=n_components, method="infomax", random_state=0, noise_cov=cov
+    )
+    with _record_warnings():  # no average reference
+        ica.fit(raw, batch="stream")
+    assert not raw.preload
+    assert ica.n_samples_ == n_samples
+    ica_mem = ICA(
+        n_components=n_components, method="infomax", random_state=0, noise_cov=cov
+    )
+    with _record_warnings():
+        ica_mem.fit(raw)
+    assert_allclose(ica.pre_whitener_, ica_mem.pre_whitener_, rtol=1e-7)
+    assert_allclose(ica.pca_explained_variance_, ica_mem.pca_explained_variance_)
+    for this_ica in (ica, ica_mem):
+        transform = this_ica.unmixing_matrix_ @ this_ica.pca_components_ @ A
+        amari_distance = np.mean(
+            np.sum(np.abs(transform), axis=1) / np.max(np.abs(transform), axis=1) - 1.0
+        )
+        assert amari_distance < 0.1
+    with pytest.raises(ValueError, match="reject and flat must be None"):
+        ica.fit(raw, reject=dict(eeg=1e-3), batch="stream")
+    with pytest.raises(ValueError, match="only supported for method='infomax'"):
+        ICA(method="fastica").fit(raw, batch="stream")
+
+
+@pytest.mark.parametrize("noise_cov", (False, True))
+def test_ica_apply_lazy(noise_cov, tmp_path):
+    """Test cleaning Raw data while it is read from disk."""
+    rng = np.random.RandomState(0)
+    info = create_info(6, 1000.0, "eeg")
+    with info._unlock():
+        info["highpass"] = 1.0
+    info["bads"] = [info["ch_names"][-1]]
+    fname = tmp_path / "test_raw.fif"
+    RawArray(rng.laplace(size=(6, 5000)) * 1e-5, info).save(fname)
+    raw = read_raw_fif(fname, preload=True)
+    cov = make_ad_hoc_cov(info) if noise_cov else None
+    ica = ICA(n_components=3, method="infomax", random_state=0, noise_cov=cov)
+    with _record_warnings():  # no average reference
+        ica.fit(raw)
+    ica.exclude = [1]
+    want = ica.apply(raw.copy()).get_data()
+    assert not np.allclose(want, raw.get_data())
+    raw_lazy = read_raw_fif(fname)
+    ica.apply(raw_lazy)
+    assert not raw_lazy.preload
+    assert_allclose(raw_lazy.get_data(), want, rtol=1e-10, atol=1e-20)
+    assert_allclose(
+        raw_lazy.get_data([0, 4], 100, 500), want[[0, 4], 100:500], atol=1e-20
+    )
+    fname_clean = tmp_path / "test_clean_raw.fif"
+    raw_lazy.save(fname_clean, buffer_size_sec=0.5)
+    assert_allclose(read_raw_fif(fname_clean).get_data(), want, rtol=1e-6)
+    # cleaning twice composes the operators
+    want_2 = ica.apply(raw.copy(), exclude=[0])
+    want_2 = ica.apply(want_2, exclude=[2]).get_data()
+    raw_lazy = ica.apply(read_raw_fif(fname), exclude=[0])
+    ica.apply(raw_lazy, exclude=[2])
+    assert_allclose(raw_lazy.get_data(), want_2, rtol=1e-10, atol=1e-20)
+    with pytest.raises(RuntimeError, match="after calling ICA.apply"):
+        raw_lazy.copy().pick([0, 1])
+    with pytest.raises(ValueError, match="different ICA cleaning"):
+        raw_lazy.copy().append(read_raw_fif(fname))
+    raw_lazy.load_data()
+    assert_allclose(raw_lazy.get_data(), want_2, rtol=1e-10, atol=1e-20)
+    # a projector applied after the lazy cleaning must act after it
+    proj = compute_proj_raw(raw, n_eeg=1, verbose="error")
+    raw.add_proj(proj)
+    want = ica.apply(raw.copy()).apply_proj().get_data()
+    raw_lazy = ica.apply(read_raw_fif(fname).add_proj(proj))
+    with pytest.raises(RuntimeError, match="after calling ICA.apply"):
+        raw_lazy.apply_proj()
+    assert_allclose(raw_lazy.load_data().apply_proj().get_data(), want, atol=1e-20)
+    # and one applied before acts before it
+    want = ica.apply(raw.copy().apply_proj()).get_data()
+    raw_lazy = ica.apply(read_raw_fif(fname).add_proj(proj).apply_proj())
+    assert_allclose(raw_lazy.get_data(), want, rtol=1e-10, atol=1e-20)
+
+
+def test_find_bads_batched():
+    """Test scoring components against several channels at once."""
+    rng = np.random.RandomState(0)
+    n_times = 10000
+    ch_types = ["eeg"] * 5 + ["eog"] * 2
+    info = create_info(len(ch_types), 100.0, ch_types)
+    with info._unlock():
+        info["highpass"] = 1.0
+    sources = rng.laplace(size=(5, n_times))
+    data = np.concatenate([rng.randn(5, 5) @ sources, sources[:2] + 0.5], axis=0)
+    data += 0.1 * rng.randn(*data.shape)
+    raw = RawArray(data * 1e-5, info)
+    ica = ICA(n_components=5, method="infomax", random_state=0)
+    with _record_warnings():  # no average reference
+        ica.fit(raw)
+    eog_chs = raw.ch_names[-2:]
+    for l_freq, h_freq in ((None, None), (1, 10)):
+        kwargs = dict(l_freq=l_freq, h_freq=h_freq, start=1000, stop=9000)
+        want = [
+            ica.score_sources(raw, target=ch, score_func="pearsonr", **kwargs)
+            for ch in eog_chs
+        ]
+        inds, scores = ica.find_bads_eog(
+            raw, threshold=0.9, measure="correlation", **kwargs
+        )
+        assert_allclose(scores, want, rtol=1e-10, atol=1e-12)
+        assert len(inds) == 2
+        assert set(inds) == set(np.argmax(np.abs(want), axis=1))
+    # a single channel gives 1D scores
+    _, scores = ica.find_bads_eog(raw, ch_name=eog_chs[0])
+    assert scores.shape == (5,)
+    want = ica.score_sources(raw, target=eog_chs[0], l_freq=1, h_freq=10)
+    assert_allclose(scores, want, rtol=1e-10)
+
+
 def test_warnings():
     """Test that ICA warns on certain input data conditions."""
     raw = read_raw_fif(raw_fname).crop(0, 5).load_data()
@@ -541,8 +674,8 @@ def test_ica_core(method, n_components, noise_cov, n_pca_components, browser_bac
     # test preload filter
     raw3 = raw.copy()
     raw3.preload = False
-    with pytest.raises(RuntimeError, match="to be loaded"):
-        ica.apply(raw3)
+    with pytest.raises(ValueError, match="only be used when applying ICA to"):
+        ica.apply(raw3, start=0)
 
     #######################################################################
     # test epochs decomposition
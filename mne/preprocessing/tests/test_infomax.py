@@ -6,7 +6,7 @@
 
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal
 from scipy import stats
 
 from mne.preprocessing.infomax_ import infomax
@@ -192,7 +192,38 @@ def test_infomax_n_iter(return_n_iter):
         assert isinstance(r, np.ndarray)
 
 
-def _get_pca(rng=None):
+@pytest.mark.parametrize("extended", [True, False])
+def test_infomax_fast(extended, numba_conditional):
+    """Test that the fast engine matches the standard one."""
+    rng = np.random.RandomState(0)
+    n_samples = 2000
+    s = np.c_[rng.laplace(size=(n_samples, 2)), rng.uniform(-1, 1, (n_samples, 2))]
+    m = np.dot(s, rng.randn(4, 4).T)
+    X = _get_pca(rng, n_components=4).fit_transform(m)
+    kwargs = dict(extended=extended, kurt_size=500, max_iter=20, return_n_iter=True)
+    want, n_iter = infomax(X, random_state=0, **kwargs)
+    got, n_iter_fast = infomax(X, random_state=0, engine="fast", **kwargs)
+    assert n_iter_fast == n_iter
+    assert_allclose(got, want, rtol=1e-7, atol=1e-10)
+    # reproducible
+    again, _ = infomax(X, random_state=0, engine="fast", **kwargs)
+    assert_allclose(again, got, rtol=0, atol=0)
+    # single precision
+    got_32, _ = infomax(X, random_state=0, engine="fast", dtype="float32", **kwargs)
+    assert got_32.dtype == np.float64
+    assert_allclose(got_32, want, rtol=1e-3, atol=1e-4)
+    with pytest.raises(ValueError, match="only supported with engine"):
+        infomax(X, dtype="float32")
+    with pytest.raises(ValueError, match="Invalid value for the 'engine'"):
+        infomax(X, engine="foo")
+
+
+def _get_pca(rng=None, n_components=2):
     from sklearn.decomposition import PCA
 
-    return PCA(n_components=2, whiten=True, svd_solver="randomized", random_state=rng)
+    return PCA(
+        n_components=n_components,
+        whiten=True,
+        svd_solver="randomized",
+        random_state=rng,
+    )
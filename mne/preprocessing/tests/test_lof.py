@@ -4,9 +4,11 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from mne.io import read_raw_fif
+from mne import create_info
+from mne.io import RawArray, read_raw_fif
 from mne.preprocessing import find_bad_channels_lof
 
 base_dir = Path(__file__).parent.parent.parent / "io" / "tests" / "data"
@@ -36,3 +38,46 @@ def test_lof(n_neighbors, ch_type, n_ch, n_bad):
     assert bads == bads_2
     with pytest.raises(ValueError, match="channel type"):
         find_bad_channels_lof(raw)
+
+
+def test_lof_summary(tmp_path):
+    """Test LOF detection on streamed summary features."""
+    pytest.importorskip("sklearn")
+    rng = np.random.default_rng(0)
+    sfreq, n_times = 250.0, 30000
+    data = rng.standard_normal((32, 4)) @ rng.standard_normal((4, n_times))
+    data = (data + 0.3 * rng.standard_normal((32, n_times))) * 1e-5
+    data[3] = rng.standard_normal(n_times) * 1e-4  # noisy
+    data[7] *= 1e-3  # (almost) flat
+    data[12, 10000:12500] += rng.standard_normal(2500) * 2e-4  # transient
+    raw = RawArray(data, create_info(32, sfreq, "eeg"))
+    raw.set_meas_date(0)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw = read_raw_fif(fname)
+    bads, scores, annot = find_bad_channels_lof(
+        raw,
+        10,
+        threshold=3.0,
+        features="summary",
+        return_scores=True,
+        return_annotations=True,
+    )
+    assert not raw.preload
+    assert bads == ["3", "7"]
+    assert scores.shape == (32,)
+    assert set(annot.description) == {"BAD_lof"}
+    for ch_name in ("3", "7"):
+        mask = [ch_names == (ch_name,) for ch_names in annot.ch_names]
+        assert annot.duration[mask].sum() == raw.times[-1] + 1 / sfreq
+    mask = [ch_names == ("12",) for ch_names in annot.ch_names]
+    onsets = annot.onset[mask] - raw.first_time
+    assert any(
+        onset <= 40 and onset + duration >= 50
+        for onset, duration in zip(onsets, annot.duration[mask])
+    )
+    raw.set_annotations(annot)
+    with pytest.raises(ValueError, match="requires features='summary'"):
+        find_bad_channels_lof(raw, return_annotations=True)
+    with pytest.raises(ValueError, match="longer than the data"):
+        find_bad_channels_lof(raw, features="summary", window_duration=1000.0)
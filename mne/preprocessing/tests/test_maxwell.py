@@ -23,6 +23,7 @@ from mne.fixes import sph_harm_y
 from mne.forward import _prep_meg_channels, use_coil_def
 from mne.io import (
     BaseRaw,
+    RawArray,
     read_info,
     read_raw_bti,
     read_raw_ctf,
@@ -48,9 +49,11 @@ from mne.preprocessing.maxwell import (
     _sh_negate,
     _sh_real_to_complex,
     _sss_basis_basic,
+    _trans_lims,
     _trans_sss_basis,
 )
 from mne.rank import _compute_rank_int, _get_rank_sss, compute_rank
+from mne.transforms import rot_to_quat
 from mne.utils import (
     _record_warnings,
     assert_meg_snr,
@@ -237,6 +240,11 @@ def test_movement_compensation_basic(tmp_path):
     assert_meg_snr(
         raw_sss, read_crop(sss_movecomp_reg_in_fname, lims), 0.5, 1.9, chpi_med_tol=121
     )
+    # decompositions computed in parallel are identical
+    raw_sss_par = maxwell_filter(
+        raw, head_pos=head_pos, origin=mf_head_origin, n_jobs=2
+    )
+    assert_allclose(raw_sss_par.get_data(), raw_sss.get_data(), rtol=1e-7, atol=0)
 
     #
     # Movement compensation,    regularization,    tSSS at the end
@@ -311,6 +319,23 @@ def test_movement_compensation_basic(tmp_path):
     )
 
 
+def test_trans_lims_no_update():
+    """Test the head position used for blocks without a position update."""
+    quats = np.zeros((3, 9))
+    quats[:, 3] = [0.0, 0.01, 0.02]  # x translations
+    pos = (None, np.array([0, 100, 200]), quats)
+    # no update inside the block: the last position before it is used
+    got, n_positions, avg_quat = _trans_lims(pos, 120, 180)
+    assert n_positions == 1
+    assert_allclose(got, np.tile(quats[1][:, np.newaxis], 60))
+    assert_allclose(avg_quat, quats[1, :6])
+    # an update inside the block starts a new position
+    got, n_positions, avg_quat = _trans_lims(pos, 150, 250)
+    assert n_positions == 2
+    assert_allclose(got[3], [0.01] * 50 + [0.02] * 50)
+    assert_allclose(avg_quat[3], 0.015)
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_movement_compensation_smooth():
@@ -773,6 +798,34 @@ def test_st_overlap():
     _assert_shielding(raw_tsss, power, 35.6, max_factor=35.7)
 
 
+@pytest.mark.slowtest
+@testing.requires_testing_data
+@pytest.mark.parametrize("st_fixed", (True, False))
+@pytest.mark.filterwarnings("ignore:st_fixed=False is untested.*:RuntimeWarning")
+def test_maxwell_filter_out_fname(st_fixed, tmp_path):
+    """Test Maxwell filtering block by block to disk."""
+    raw = read_crop(raw_fname, (0.0, 4.0))
+    raw.info["bads"] = ["MEG0111", "MEG2112"]
+    assert not raw.preload
+    head_pos = read_head_pos(pos_fname)
+    kwargs = dict(
+        origin=mf_head_origin, st_duration=1.0, head_pos=head_pos, st_fixed=st_fixed
+    )
+    raw_sss = _maxwell_filter_ola(raw, **kwargs)
+    fname = tmp_path / "test_raw_sss.fif"
+    with catch_logging() as log:
+        raw_sss_disk = _maxwell_filter_ola(raw, out_fname=fname, verbose=True, **kwargs)
+    assert "block by block" in log.getvalue()
+    assert not raw.preload and not raw_sss_disk.preload
+    assert raw_sss_disk.filenames == (fname,)
+    assert raw_sss_disk.ch_names == raw_sss.ch_names
+    assert raw_sss_disk.info["bads"] == raw_sss.info["bads"] == []
+    # data are stored in single precision
+    assert_allclose(raw_sss_disk.get_data(), raw_sss.get_data(), rtol=1e-6, atol=1e-20)
+    with pytest.raises(FileExistsError, match="Destination file exists"):
+        _maxwell_filter_ola(raw, out_fname=fname, **kwargs)
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_spatiotemporal_only():
@@ -1869,6 +1922,29 @@ def test_find_bads_maxwell_flat():
     assert noisy == want_noisy
 
 
+@pytest.mark.parametrize("regularize", (None, "in"))
+def test_find_bads_maxwell_downdate(regularize):
+    """Test that downdating the SSS decomposition matches rerunning SSS."""
+    raw = read_raw_fif(raw_small_fname).crop(0, 10).load_data()
+    raw.del_proj()
+    raw.info["bads"] = []
+    # two identical head positions force SSS to be rerun for each exclusion
+    trans = raw.info["dev_head_t"]["trans"]
+    head_pos = np.zeros((2, 10))
+    head_pos[:, 0] = raw._first_time + np.array([0, 5])
+    head_pos[:, 1:4] = rot_to_quat(trans[:3, :3])
+    head_pos[:, 4:7] = trans[:3, 3]
+    kwargs = dict(regularize=regularize, min_count=1, return_scores=True)
+    noisy, flat, scores = find_bad_channels_maxwell(raw, **kwargs)
+    assert "MEG 2443" in noisy
+    want_noisy, want_flat, want_scores = find_bad_channels_maxwell(
+        raw, head_pos=head_pos, **kwargs
+    )
+    assert noisy == want_noisy
+    assert flat == want_flat
+    assert_allclose(scores["scores_noisy"], want_scores["scores_noisy"], atol=1e-3)
+
+
 @pytest.mark.parametrize(
     "regularize, n, int_order",
     [
@@ -1899,6 +1975,61 @@ def test_compute_maxwell_basis(regularize, n, int_order):
     assert_allclose(got, want, atol=1e-16)
 
 
+def test_compute_maxwell_basis_cache(monkeypatch):
+    """Test that SSS bases are reused across runs with the same geometry."""
+    info = read_info(raw_small_fname)
+    with info._unlock():
+        info["projs"] = []
+    n_calls = list()
+    orig_trans_sss_basis = mne.preprocessing.maxwell._trans_sss_basis
+
+    def _count_trans_sss_basis(*args, **kwargs):
+        n_calls.append(None)
+        return orig_trans_sss_basis(*args, **kwargs)
+
+    monkeypatch.setattr(
+        mne.preprocessing.maxwell, "_trans_sss_basis", _count_trans_sss_basis
+    )
+    kwargs = dict(origin=(0.0, 0.0, 0.041), int_order=7)
+    want = compute_maxwell_basis(info, **kwargs)
+    n_first = len(n_calls)
+    assert n_first == 2  # reconstruction and decomposition
+    with catch_logging(verbose="debug") as log:
+        got = compute_maxwell_basis(info, **kwargs, verbose="debug")
+    assert len(n_calls) == n_first + 1  # only the reconstruction
+    assert "Removing in component" in log.getvalue()  # logged for cache hits
+    for w, g in zip(want, got):
+        assert_array_equal(w, g)
+    # modifying the returned arrays must not modify the cache
+    got[0][:] = 0.0
+    got = compute_maxwell_basis(info, **kwargs)
+    assert_array_equal(got[0], want[0])
+    # anything that changes the geometry invalidates it
+    with info._unlock():
+        info["dev_head_t"]["trans"][2, 3] += 0.001
+    got = compute_maxwell_basis(info, **kwargs)
+    assert len(n_calls) == n_first + 4
+    assert not np.allclose(got[0], want[0])
+    # with movement compensation, only the initial position is cached
+    n_cached = list()
+    orig_cached = mne.preprocessing.maxwell._compute_s_decomp_cached
+
+    def _count_cached(*args):
+        n_cached.append(None)
+        return orig_cached(*args)
+
+    monkeypatch.setattr(
+        mne.preprocessing.maxwell, "_compute_s_decomp_cached", _count_cached
+    )
+    raw = RawArray(np.zeros((len(info["ch_names"]), 1000)), info)
+    head_pos = np.zeros((3, 10))
+    head_pos[:, 0] = [0.0, 1.0, 2.0]
+    head_pos[:, 6] = [0.0, 0.001, 0.002]
+    head_pos[:, 7] = 1.0
+    maxwell_filter(raw, head_pos=head_pos, **kwargs)
+    assert len(n_cached) == 1
+
+
 @testing.requires_testing_data
 @pytest.mark.parametrize("bads", ("from_raw", "union", "keep"))
 def test_prepare_emptyroom_bads(bads):
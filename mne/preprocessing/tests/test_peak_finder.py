@@ -9,7 +9,7 @@ from numpy.testing import assert_array_equal, assert_equal
 from mne.preprocessing import peak_finder
 
 
-def test_peak_finder():
+def test_peak_finder(numba_conditional):
     """Test the peak detection method."""
     # check for random data
     rng = np.random.RandomState(42)
@@ -2,14 +2,17 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import re
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 from scipy.interpolate import interp1d
 
 from mne import Annotations, Epochs, create_info, find_events
-from mne.io import RawArray
+from mne.io import RawArray, read_raw_fif
 from mne.preprocessing import realign_raw
+from mne.utils import catch_logging
 
 
 @pytest.mark.parametrize("ratio_other", (0.9, 0.999, 1, 1.001, 1.1))  # drifts
@@ -187,3 +190,61 @@ def _annot_to_onset_dur(raw, other):
     onsets_other = other.annotations.onset - other.first_time
     dur_other = other.annotations.duration
     return onsets_raw, dur_raw, onsets_other, dur_other
+
+
+@pytest.mark.parametrize(
+    "drift, chunk_duration",
+    [("linear", 7.0), ("piecewise", 7.0), ("piecewise", None)],
+)
+def test_realign_chunked(drift, chunk_duration, tmp_path):
+    """Test realigning a non-preloaded raw with the fractional-delay filter."""
+    sfreq, duration = 200.0, 120.0
+    rng = np.random.default_rng(0)
+    freqs, phases = np.linspace(0.5, 30, 40), rng.uniform(0, 2 * np.pi, 40)
+    t_true = np.arange(3, duration - 3, 1.3) + rng.uniform(0, 0.3, 88)
+    times = np.arange(0, duration, 1 / sfreq)
+    # clock of other as a function of the true time (drift varies for piecewise)
+    clock = 1.0005 * (times - 2.0)
+    if drift == "piecewise":
+        clock += 2e-6 * (times - 60) ** 2
+
+    def _make_raw(true_times, kind):
+        data = np.zeros((2, len(true_times)))
+        samples = np.searchsorted(true_times, t_true)
+        data[0, samples] = 1.0
+        data[1] = np.sin(2 * np.pi * freqs * true_times[:, np.newaxis] + phases).sum(1)
+        info = create_info([f"{kind}_stim", f"{kind}_signal"], sfreq, ["stim", "eeg"])
+        raw = RawArray(data * [[1], [1e-6]], info)
+        raw.set_annotations(Annotations(samples / sfreq, 0.1, f"{kind}_annot"))
+        return raw
+
+    raw = _make_raw(times, "raw")
+    other = _make_raw(
+        np.interp(np.arange(0, clock[-1], 1 / sfreq), clock, times), "other"
+    )
+    fname = tmp_path / "test_raw.fif"
+    other.save(fname)
+    other = read_raw_fif(fname)
+    t_other = np.interp(t_true, times, clock)
+    with catch_logging(verbose=True) as log:
+        realign_raw(
+            raw, other, t_true, t_other, drift=drift, chunk_duration=chunk_duration
+        )
+        log = log.getvalue()
+    # without chunk_duration, the fractional-delay filter uses 10 s chunks
+    n_chunks = int(re.search(r"in (\d+) chunk\(s\)", log).group(1))
+    assert n_chunks == (12 if chunk_duration is None else 17)
+    assert other.preload
+    assert_allclose(raw.times, other.times)
+    assert other.info["sfreq"] == raw.info["sfreq"]
+    corr = np.corrcoef(raw.get_data("data"), other.get_data("data"))[0, 1]
+    assert corr > 0.99
+    events_raw = find_events(raw)
+    events_other = find_events(other)
+    assert len(events_raw) == len(events_other) > 80
+    assert_allclose(
+        events_raw[:, 0] - raw.first_samp, events_other[:, 0] - other.first_samp, atol=1
+    )
+    onsets_raw, dur_raw, onsets_other, dur_other = _annot_to_onset_dur(raw, other)
+    assert_allclose(onsets_raw, onsets_other, atol=2 / sfreq)
+    assert_allclose(dur_raw, dur_other, atol=1e-3)
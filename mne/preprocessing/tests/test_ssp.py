@@ -6,12 +6,12 @@ from pathlib import Path
 
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_equal
 
-from mne import pick_types
+from mne import create_info, pick_types
 from mne._fiff.proj import activate_proj, make_projector
 from mne.datasets import testing
-from mne.io import read_raw_ctf, read_raw_fif
+from mne.io import RawArray, read_raw_ctf, read_raw_fif
 from mne.preprocessing.ssp import compute_proj_ecg, compute_proj_eog
 from mne.utils import _record_warnings
 
@@ -160,6 +160,59 @@ def test_compute_proj_eog(average, short_raw):
         projs, events = compute_proj_eog(raw=raw, tmax=dur_use, ch_name="EOG 061")
 
 
+@pytest.mark.parametrize("average", (True, False))
+@pytest.mark.parametrize("filter_method", ("fir", "iir"))
+def test_compute_proj_exg_chunked(average, filter_method, tmp_path):
+    """Test computation of ExG projectors chunk by chunk."""
+    rng = np.random.default_rng(0)
+    sfreq = 200.0
+    times = np.arange(int(60 * sfreq)) / sfreq
+    blinks = sum(
+        np.exp(-0.5 * ((times - onset) / 0.08) ** 2)
+        for onset in np.arange(1.3, 59, 2.7)
+    )
+    eeg = rng.standard_normal((16, 1)) * blinks * 50e-6
+    eeg += rng.standard_normal((16, times.size)) * 5e-6
+    eog = blinks * 200e-6 + rng.standard_normal(times.size) * 5e-6
+    info = create_info(
+        [f"EEG{ii:03d}" for ii in range(16)] + ["EOG", "ECG"],
+        sfreq,
+        ["eeg"] * 16 + ["eog", "ecg"],
+    )
+    fname = tmp_path / "test_raw.fif"
+    RawArray(np.vstack([eeg, eog, blinks * 1e-3]), info).save(fname)
+    raw = read_raw_fif(fname)
+    kwargs = dict(
+        n_grad=0,
+        n_mag=0,
+        n_eeg=2,
+        no_proj=True,
+        reject=dict(eeg=300e-6),
+        average=average,
+        filter_method=filter_method,
+        return_drop_log=True,
+    )
+    for func, chunk_duration in ((compute_proj_eog, 7.0), (compute_proj_ecg, 3.0)):
+        projs, events, drop_log = func(raw.copy().load_data(), **kwargs)
+        projs_chunk, events_chunk, drop_log_chunk = func(
+            raw, chunk_duration=chunk_duration, **kwargs
+        )
+        assert not raw.preload
+        assert len(events) > 20
+        assert_array_equal(events, events_chunk)
+        assert drop_log == drop_log_chunk
+        assert len(projs) == len(projs_chunk) == 2
+        for proj, proj_chunk in zip(projs, projs_chunk):
+            assert proj["desc"] == proj_chunk["desc"]
+            corr = np.abs(proj["data"]["data"] @ proj_chunk["data"]["data"].T)
+            assert_allclose(corr, 1.0, atol=1e-8)
+            assert_allclose(
+                proj["explained_var"], proj_chunk["explained_var"], rtol=1e-5
+            )
+    with pytest.raises(ValueError, match="should be positive"):
+        compute_proj_eog(raw, chunk_duration=0.0)
+
+
 @pytest.mark.slowtest  # can be slow on OSX
 def test_compute_proj_parallel(short_raw):
     """Test computation of ExG projectors using parallelization."""
@@ -32,6 +32,9 @@ from .utils import (
     verbose,
 )
 
+# number of values (channels x samples) read at once by compute_proj_raw
+_PROJ_RAW_BLOCK_SIZE = 10_000_000
+
 
 @verbose
 def read_proj(fname, *, verbose=None):
@@ -209,6 +212,13 @@ def compute_proj_epochs(
     """
     # compute data covariance
     data = _compute_cov_epochs(epochs, n_jobs)
+    if desc_prefix is None:
+        desc_prefix = _epochs_desc_prefix(epochs)
+    return _compute_proj(data, epochs.info, n_grad, n_mag, n_eeg, desc_prefix, meg=meg)
+
+
+def _epochs_desc_prefix(epochs):
+    """Create the projector description prefix for epochs."""
     event_id = epochs.event_id
     if event_id is None or len(list(event_id.keys())) == 0:
         event_id = "0"
@@ -216,17 +226,24 @@ def compute_proj_epochs(
         event_id = str(list(event_id.values())[0])
     else:
         event_id = "Multiple-events"
-    if desc_prefix is None:
-        desc_prefix = f"{event_id}-{epochs.tmin:<.3f}-{epochs.tmax:<.3f}"
-    return _compute_proj(data, epochs.info, n_grad, n_mag, n_eeg, desc_prefix, meg=meg)
+    return f"{event_id}-{epochs.tmin:<.3f}-{epochs.tmax:<.3f}"
 
 
 def _compute_cov_epochs(epochs, n_jobs, *, log_drops=False):
     """Compute epochs covariance."""
     parallel, p_fun, n_jobs = parallel_func(np.dot, n_jobs)
     n_start = len(epochs.events)
-    data = parallel(p_fun(e, e.T) for e in epochs)
-    n_epochs = len(data)
+    if n_jobs == 1:
+        # accumulate while iterating so that only one epoch (and not one
+        # covariance per epoch) is held in memory at a time
+        data, n_epochs = 0.0, 0
+        for e in epochs:
+            data += np.dot(e, e.T)
+            n_epochs += 1
+    else:
+        data = parallel(p_fun(e, e.T) for e in epochs)
+        n_epochs = len(data)
+        data = sum(data)
     if n_epochs == 0:
         raise RuntimeError("No good epochs found")
     if log_drops:
@@ -234,7 +251,6 @@ def _compute_cov_epochs(epochs, n_jobs, *, log_drops=False):
 
     n_chan, n_samples = epochs.info["nchan"], len(epochs.times)
     _check_n_samples(n_samples * n_epochs, n_chan)
-    data = sum(data)
     return data
 
 
@@ -363,9 +379,13 @@ def compute_proj_raw(
         start = max(raw.time_as_index(start)[0], 0)
         stop = raw.time_as_index(stop)[0] if stop else raw.n_times
         stop = min(stop, raw.n_times)
-        data, times = raw[:, start:stop]
-        _check_n_samples(stop - start, data.shape[0])
-        data = np.dot(data, data.T)  # compute data covariance
+        _check_n_samples(stop - start, len(raw.ch_names))
+        # compute data covariance block by block to bound memory usage
+        n_block = max(int(_PROJ_RAW_BLOCK_SIZE // len(raw.ch_names)), 1)
+        data = 0.0
+        for first in range(start, stop, n_block):
+            block = raw[:, first : min(first + n_block, stop)][0]
+            data += np.dot(block, block.T)
         info = raw.info
         # convert back to times
         start = start / raw.info["sfreq"]
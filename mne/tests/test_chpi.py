@@ -10,13 +10,21 @@ from numpy.testing import assert_allclose, assert_array_equal, assert_array_less
 from scipy.interpolate import interp1d
 from scipy.spatial.distance import cdist
 
-from mne import pick_info, pick_types
+from mne import create_info, pick_info, pick_types
 from mne._fiff.constants import FIFF
 from mne.chpi import (
+    _CHPI_WARM_START_RESIDUAL,
+    ChpiTracker,
     _chpi_locs_to_times_dig,
     _compute_good_distances,
+    _fit_chpi_amplitudes,
+    _fit_magnetic_dipole,
     _get_hpi_initial_fit,
+    _magnetic_dipole_field_vec,
+    _magnetic_dipole_objective,
     _setup_ext_proj,
+    _setup_hpi_amplitude_fitting,
+    _setup_hpi_loc_fitting,
     compute_chpi_amplitudes,
     compute_chpi_locs,
     compute_chpi_snr,
@@ -41,7 +49,7 @@ from mne.io import (
     read_raw_kit,
 )
 from mne.simulation import add_chpi
-from mne.transforms import _angle_between_quats, rot_to_quat
+from mne.transforms import _angle_between_quats, _quat_to_affine, rot_to_quat
 from mne.utils import (
     _record_warnings,
     assert_meg_snr,
@@ -316,6 +324,65 @@ def test_calculate_chpi_positions_preload():
     assert object_diff(pos, pos_preload) == ""
 
 
+@testing.requires_testing_data
+def test_compute_chpi_amplitudes_batch(monkeypatch):
+    """Test that batched cHPI amplitude fits match window-by-window fits."""
+    raw = read_raw_fif(chpi_fif_fname, allow_maxshield="yes").crop(0, 3)
+    amps = compute_chpi_amplitudes(raw, t_step_min=0.05)
+    # one window at a time
+    monkeypatch.setattr("mne.chpi._CHPI_BATCH_BYTES", 1)
+    want = compute_chpi_amplitudes(raw, t_step_min=0.05)
+    assert_allclose(amps["times"], want["times"])
+    assert_allclose(amps["slopes"], want["slopes"], rtol=1e-7, atol=1e-20)
+    # and the same as fitting each window separately
+    hpi = _setup_hpi_amplitude_fitting(raw.info, "auto")
+    fit_idxs = raw.time_as_index(
+        np.arange(hpi["t_window"] / 2.0, len(raw.times) / raw.info["sfreq"], 0.05),
+        use_rounding=True,
+    )
+    assert len(fit_idxs) == len(amps["slopes"])
+    for mi in (0, len(fit_idxs) // 2, -1):
+        start = fit_idxs[mi] - hpi["n_window"] // 2
+        time_sl = slice(max(start, 0), min(start + hpi["n_window"], len(raw.times)))
+        sin_fit = _fit_chpi_amplitudes(raw, time_sl, hpi)
+        assert_allclose(amps["slopes"][mi], sin_fit, rtol=1e-7, atol=1e-20)
+
+
+def test_fit_magnetic_dipole_warm_start(monkeypatch):
+    """Test that a moderately poor warm start still finds the coil."""
+    # magnetometers on the upper half of a sphere
+    rng = np.random.default_rng(0)
+    n_mag = 150
+    phi = np.arccos(rng.uniform(0.0, 1.0, n_mag))
+    theta = rng.uniform(0, 2 * np.pi, n_mag)
+    info = create_info(n_mag, 1000.0, "mag")
+    with info._unlock():
+        for ch, p, t in zip(info["chs"], phi, theta):
+            ez = np.array([np.sin(p) * np.cos(t), np.sin(p) * np.sin(t), np.cos(p)])
+            ex = np.array([-np.sin(t), np.cos(t), 0.0])
+            ch["loc"][:12] = np.concatenate([0.12 * ez, ex, np.cross(ez, ex), ez])
+            ch["coil_type"] = FIFF.FIFFV_COIL_VV_MAG_T3
+    proj = _setup_ext_proj(info, 1)[0]
+    coils, whitener, guesses = _setup_hpi_loc_fitting(info, proj, "raise")
+    rr = np.array([0.02, -0.01, 0.06])
+    fwd = _magnetic_dipole_field_vec(rr[np.newaxis], coils, "raise")
+    B = np.dot([1e-7, 5e-8, 0.0], fwd)
+    B += 0.02 * np.std(B) * rng.standard_normal(B.shape)
+    # 5 mm off: poor, but the grid is not searched
+    x0 = rr + [0.005, 0.0, 0.0]
+    Bw = np.dot(whitener, B)
+    res0 = _magnetic_dipole_objective(x0, Bw, Bw @ Bw, coils, whitener, "raise")
+    assert 0.01 < res0 / (Bw @ Bw) < _CHPI_WARM_START_RESIDUAL
+    x, gof, _ = _fit_magnetic_dipole(B, x0, "raise", whitener, coils, guesses)
+    assert_allclose(x, rr, atol=5e-4)
+    assert 0.99 < gof < 1
+    # same result as when the grid competes with the warm start
+    monkeypatch.setattr("mne.chpi._CHPI_WARM_START_RESIDUAL", 0.0)
+    x_grid, gof_grid, _ = _fit_magnetic_dipole(B, x0, "raise", whitener, coils, guesses)
+    assert_allclose(x, x_grid, atol=1e-6)
+    assert_allclose(gof, gof_grid, rtol=1e-6)
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_calculate_chpi_positions_vv():
@@ -514,8 +581,8 @@ def test_calculate_head_pos_chpi_on_chpi5_in_shorter_steps():
     )  # 2 cm/s is not great but probably fine
 
 
-def test_simulate_calculate_head_pos_chpi():
-    """Test calculation of cHPI positions with simulated data."""
+def _simulate_chpi_raw():
+    """Simulate 10 s of cHPI data with the head moving along z."""
     # Read info dict from raw FIF file
     info = read_info(raw_fname)
     # Tune the info structure
@@ -577,6 +644,13 @@ def test_simulate_calculate_head_pos_chpi():
     raw_data = np.zeros((len(picks), int(duration * info["sfreq"] + 0.5)))
     raw = RawArray(raw_data, info)
     add_chpi(raw, dev_head_pos)
+    return raw, dev_head_pos
+
+
+def test_simulate_calculate_head_pos_chpi():
+    """Test calculation of cHPI positions with simulated data."""
+    raw, dev_head_pos = _simulate_chpi_raw()
+    head_pos_sfreq_quotient = 0.01
     quats = _calculate_chpi_positions(
         raw,
         t_step_min=raw.info["sfreq"] * head_pos_sfreq_quotient,
@@ -587,6 +661,52 @@ def test_simulate_calculate_head_pos_chpi():
         quats, dev_head_pos, dist_tol=0.001, angle_tol=1.0, vel_atol=4e-3
     )  # 4 mm/s
 
+    # splitting the fits across jobs gives the same locations
+    chpi_amplitudes = compute_chpi_amplitudes(raw, t_step_min=1.0, t_window=1.0)
+    chpi_locs = compute_chpi_locs(raw.info, chpi_amplitudes, t_step_max=1.0)
+    assert len(chpi_locs["times"]) > 2
+    chpi_locs_par = compute_chpi_locs(
+        raw.info, chpi_amplitudes, t_step_max=1.0, n_jobs=2
+    )
+    for key, val in chpi_locs.items():
+        assert_allclose(chpi_locs_par[key], val, rtol=1e-6, err_msg=key)
+
+
+def test_chpi_tracker():
+    """Test tracking cHPI locations and head positions in streamed data."""
+    raw, dev_head_pos = _simulate_chpi_raw()
+    chpi_amplitudes = compute_chpi_amplitudes(raw, t_step_min=1.0, t_window=1.0)
+    chpi_locs = compute_chpi_locs(raw.info, chpi_amplitudes, t_step_max=1.0)
+    quats = compute_head_pos(raw.info, chpi_locs)
+    # replay the recording in buffers of random lengths
+    tracker = ChpiTracker(raw.info, t_step=1.0, t_window=1.0)
+    data = raw.get_data()
+    rng = np.random.default_rng(0)
+    bounds = rng.integers(0, len(raw.times), 20)
+    bounds = np.unique(np.concatenate([[0], bounds, [len(raw.times)]]))
+    out = [
+        tracker.feed(data[:, start:stop])
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+    assert sum(len(this_locs["times"]) == 0 for this_locs, _ in out) > 0
+    locs_tracked = {
+        key: np.concatenate([this_locs[key] for this_locs, _ in out])
+        for key in chpi_locs
+    }
+    quats_tracked = np.concatenate([this_quats for _, this_quats in out])
+    assert len(locs_tracked["times"]) == len(chpi_locs["times"])
+    for key, val in chpi_locs.items():
+        assert_allclose(locs_tracked[key], val, rtol=1e-6, err_msg=key)
+    assert_allclose(quats_tracked, quats, rtol=1e-6, atol=1e-9)
+    _assert_quats(
+        quats_tracked, dev_head_pos, dist_tol=0.001, angle_tol=1.0, vel_atol=4e-3
+    )
+    assert_allclose(
+        tracker.dev_head_t["trans"], _quat_to_affine(quats_tracked[-1, 1:7])
+    )
+    with pytest.raises(ValueError, match="must have shape"):
+        tracker.feed(data[:-1])
+
 
 def _calculate_chpi_coil_locs(raw, verbose):
     """Wrap to facilitate change diff."""
@@ -414,6 +414,39 @@ def test_find_events():
         find_events(raw)
 
 
+def test_find_events_steps(numba_conditional):
+    """Test step extraction on stim and multi-channel data."""
+    data = np.zeros((2, 100))
+    data[0, 10:20] = 5
+    data[0, 20:22] = 6
+    data[0, 50:60] = 3
+    data[1, 30:40] = 1  # STI 015
+    data[1, 50:59] = 2
+    raw = RawArray(data, create_info(["STI 014", "STI 015"], 1000.0, "stim"))
+    assert_array_equal(
+        find_events(raw, stim_channel="STI 014", consecutive=True, shortest_event=1),
+        [[10, 0, 5], [20, 5, 6], [50, 0, 3]],
+    )
+    events = find_events(raw, stim_channel=["STI 014", "STI 015"])
+    assert_array_equal(
+        events[np.lexsort(events.T[::-1])],
+        [[10, 0, 5], [20, 5, 6], [30, 0, 1], [50, 0, 2], [50, 0, 3]],
+    )
+    # steps need to happen on all channels at once
+    assert_array_equal(
+        find_stim_steps(raw, stim_channel=["STI 014", "STI 015"]),
+        [[50, 0, 3]],
+    )
+    assert_array_equal(
+        find_stim_steps(raw, pad_stop=0, stim_channel="STI 015"),
+        [[30, 0, 1], [40, 1, 0], [50, 0, 2], [59, 2, 0]],
+    )
+    assert find_stim_steps(raw.copy().crop(0, 0.005), stim_channel="STI 014").shape == (
+        0,
+        3,
+    )
+
+
 def test_pick_events():
     """Test pick events in a events ndarray."""
     events = np.array([[1, 0, 1], [2, 1, 0], [3, 0, 4], [4, 4, 2], [5, 2, 0]])
@@ -3,6 +3,7 @@
 # Copyright the MNE-Python contributors.
 
 from copy import deepcopy
+from functools import lru_cache
 
 import numpy as np
 from scipy.fft import fft, fftfreq, ifft
@@ -12,6 +13,12 @@ from ..parallel import parallel_func
 from ..utils import _validate_type, legacy, logger, verbose
 from .tfr import AverageTFRArray, _ensure_slice, _get_data
 
+# Memory budget for the windows of a frequency chunk and for the spectra of a
+# block of epochs in _st_power_itc
+_ST_BLOCK_BYTES = 16e6
+# Number of frequency chunks whose windows are kept for later calls
+_ST_N_CACHED = 4
+
 
 def _check_input_st(x_in, n_fft):
     """Aux function."""
@@ -61,6 +68,14 @@ def _precompute_st_windows(n_samp, start_f, stop_f, sfreq, width):
     return windows
 
 
+@lru_cache(maxsize=_ST_N_CACHED)
+def _precompute_st_windows_cached(n_samp, start_f, stop_f, sfreq, width):
+    """Get read-only stockwell windows, reusing them across calls."""
+    windows = _precompute_st_windows(n_samp, start_f, stop_f, sfreq, width)
+    windows.flags.writeable = False
+    return windows
+
+
 def _st(x, start_f, windows):
     """Compute ST based on Ali Moukadem MATLAB code (used in tests)."""
     from scipy.fft import fft, ifft
@@ -82,21 +97,63 @@ def _st_power_itc(x, start_f, compute_itc, zero_pad, decim, W):
     n_samp = x.shape[-1]
     decim_indices = decim.indices(n_samp - zero_pad)
     n_out = len(range(*decim_indices))
-    psd = np.empty((len(W), n_out))
-    itc = np.empty_like(psd) if compute_itc else None
-    X = fft(x)
-    XX = np.concatenate([X, X], axis=-1)
-    for i_f, window in enumerate(W):
-        f = start_f + i_f
-        ST = ifft(XX[:, f : f + n_samp] * window)
-        TFR = ST[:, slice(*decim_indices)]
-        TFR_abs = np.abs(TFR)
-        TFR_abs[TFR_abs == 0] = 1.0
+    psd = np.zeros((len(W), n_out))
+    itc = np.zeros((len(W), n_out), np.complex128) if compute_itc else None
+    # Accumulate over blocks of epochs to bound the size of the
+    # (n_epochs, 2 * n_samp) spectra and (n_epochs, n_samp) transforms
+    n_block = max(1, int(_ST_BLOCK_BYTES // (32 * n_samp)))
+    for start in range(0, len(x), n_block):
+        X = fft(x[start : start + n_block])
+        XX = np.concatenate([X, X], axis=-1)
+        del X
+        for i_f, window in enumerate(W):
+            f = start_f + i_f
+            ST = ifft(XX[:, f : f + n_samp] * window)
+            TFR = ST[:, slice(*decim_indices)]
+            TFR_abs = np.abs(TFR)
+            TFR_abs[TFR_abs == 0] = 1.0
+            if compute_itc:
+                TFR /= TFR_abs
+                itc[i_f] += TFR.sum(axis=0)
+            TFR_abs *= TFR_abs
+            psd[i_f] += TFR_abs.sum(axis=0)
+    psd /= len(x)
+    if compute_itc:
+        itc = np.abs(itc / len(x))
+    return psd, itc
+
+
+def _st_power_itc_chunked(
+    x, start_f, stop_f, compute_itc, zero_pad, decim, width, sfreq
+):
+    """Compute ST power and ITC of each channel for chunks of frequencies.
+
+    Only the windows of one chunk of frequencies are computed at a time, and
+    they are used for all channels in ``x``. When there are few enough chunks,
+    they are also kept for later calls with the same parameters.
+    """
+    n_samp = x.shape[-1]
+    n_chunk = max(1, int(_ST_BLOCK_BYTES // (16 * n_samp)))
+    chunk_starts = range(start_f, stop_f, n_chunk)
+    # with more chunks than the cache holds, each call would evict all of them
+    if len(chunk_starts) <= _ST_N_CACHED:
+        get_windows = _precompute_st_windows_cached
+    else:
+        get_windows = _precompute_st_windows
+    psd, itc = list(), list()
+    for chunk_start in chunk_starts:
+        chunk_stop = min(chunk_start + n_chunk, stop_f)
+        W = get_windows(n_samp, chunk_start, chunk_stop, float(sfreq), float(width))
+        tfrs = [
+            _st_power_itc(x[:, c], chunk_start, compute_itc, zero_pad, decim, W)
+            for c in range(x.shape[1])
+        ]
+        del W
+        psd.append(np.array([this_psd for this_psd, _ in tfrs]))
         if compute_itc:
-            TFR /= TFR_abs
-            itc[i_f] = np.abs(np.mean(TFR, axis=0))
-        TFR_abs *= TFR_abs
-        psd[i_f] = np.mean(TFR_abs, axis=0)
+            itc.append(np.array([this_itc for _, this_itc in tfrs]))
+    psd = np.concatenate(psd, axis=1)
+    itc = np.concatenate(itc, axis=1) if compute_itc else None
     return psd, itc
 
 
@@ -194,20 +251,33 @@ def tfr_array_stockwell(
     data, n_fft_, zero_pad = _check_input_st(data, n_fft)
     start_f, stop_f, freqs = _compute_freqs_st(fmin, fmax, n_fft_, sfreq)
 
-    W = _precompute_st_windows(data.shape[-1], start_f, stop_f, sfreq, width)
     n_freq = stop_f - start_f
     psd = np.empty((n_channels, n_freq, n_out))
     itc = np.empty((n_channels, n_freq, n_out)) if return_itc else None
 
-    parallel, my_st, n_jobs = parallel_func(_st_power_itc, n_jobs, verbose=verbose)
+    parallel, my_st, n_jobs = parallel_func(
+        _st_power_itc_chunked, n_jobs, verbose=verbose
+    )
+    # split the channels across jobs so that each job computes the windows of
+    # each frequency chunk only once
+    ch_splits = np.array_split(np.arange(n_channels), min(n_jobs, n_channels))
     tfrs = parallel(
-        my_st(data[:, c, :], start_f, return_itc, zero_pad, decim, W)
-        for c in range(n_channels)
+        my_st(
+            data[:, picks, :],
+            start_f,
+            stop_f,
+            return_itc,
+            zero_pad,
+            decim,
+            width,
+            float(sfreq),
+        )
+        for picks in ch_splits
     )
-    for c, (this_psd, this_itc) in enumerate(iter(tfrs)):
-        psd[c] = this_psd
+    for picks, (this_psd, this_itc) in zip(ch_splits, tfrs):
+        psd[picks] = this_psd
         if this_itc is not None:
-            itc[c] = this_itc
+            itc[picks] = this_itc
 
     return psd, itc, freqs
 
@@ -12,7 +12,6 @@ from .._fiff.pick import _picks_to_idx, pick_channels
 from ..parallel import parallel_func
 from ..time_frequency.multitaper import (
     _compute_mt_params,
-    _csd_from_mt,
     _mt_spectra,
     _psd_from_mt_adaptive,
 )
@@ -27,7 +26,10 @@ from ..utils import (
     warn,
 )
 from ..viz.misc import plot_csd
-from .tfr import EpochsTFR, _cwt_array, _get_nfft, morlet
+from .tfr import EpochsTFR, _cwt_array, _ensure_slice, _get_nfft, morlet
+
+# Approximate size of the spectra of a block of epochs handed to a CSD kernel
+_CSD_BLOCK_BYTES = 100e6
 
 
 @verbose
@@ -826,6 +828,7 @@ def csd_array_fourier(
         _csd_fourier,
         params=[sfreq, n_times, freq_mask, n_fft],
         n_fft=n_fft,
+        spectrum_shape=(X.shape[1], 1, len(orig_frequencies)),
         ch_names=ch_names,
         projs=projs,
         n_jobs=n_jobs,
@@ -1038,6 +1041,7 @@ def csd_array_multitaper(
             max_iter,
         ],
         n_fft=n_fft,
+        spectrum_shape=(X.shape[1], len(window_fun), len(orig_frequencies)),
         ch_names=ch_names,
         projs=projs,
         n_jobs=n_jobs,
@@ -1231,6 +1235,11 @@ def csd_array_morlet(
         _csd_morlet,
         params=[sfreq, wavelets, nfft, csd_tslice, use_fft, decim],
         n_fft=1,
+        spectrum_shape=(
+            X.shape[1],
+            len(wavelets),
+            len(range(X.shape[2])[_ensure_slice(decim)]),
+        ),
         ch_names=ch_names,
         projs=projs,
         n_jobs=n_jobs,
@@ -1310,11 +1319,13 @@ def _execute_csd_function(
     projs=None,
     n_jobs=None,
     *,
+    spectrum_shape,
     verbose=None,
 ):
     """Estimate cross-spectral density with a given function.
 
-    This function will apply the given CSD function in parallel across epochs.
+    This function will apply the given CSD function in parallel across blocks
+    of epochs.
 
     Parameters
     ----------
@@ -1338,6 +1349,10 @@ def _execute_csd_function(
         List of projectors to store in the CSD object. Defaults to ``None``,
         which means the projectors defined in the Epochs object will be copied.
     %(n_jobs)s
+    spectrum_shape : tuple of int
+        The shape of the complex spectrum that ``csd_function`` computes for
+        one epoch (e.g., channels × tapers × FFT frequencies), used to bound the
+        memory needed for a block of epochs.
     %(verbose)s
 
     Returns
@@ -1358,11 +1373,18 @@ def _execute_csd_function(
     # execution.
     parallel, my_csd, n_jobs = parallel_func(csd_function, n_jobs, verbose=verbose)
 
-    # Compute CSD for each trial
-    n_blocks = int(np.ceil(n_epochs / float(n_jobs)))
-    for i in ProgressBar(range(n_blocks), mesg="CSD epoch blocks"):
-        epoch_block = X[i * n_jobs : (i + 1) * n_jobs]
-        csds = parallel(my_csd(this_epoch, *params) for this_epoch in epoch_block)
+    # Each call handles a block of epochs, so that the cross-spectra of all
+    # epochs (and tapers/time points) in the block can be summed with a single
+    # matrix product per frequency. Bound the complex spectra of a block (and
+    # the copy made to select frequencies or apply taper weights).
+    epoch_bytes = 2 * 16 * np.prod(spectrum_shape)
+    n_per_block = _CSD_BLOCK_BYTES // epoch_bytes
+    n_per_block = int(np.clip(n_per_block, 1, np.ceil(n_epochs / n_jobs)))
+    blocks = np.array_split(X, np.arange(n_per_block, n_epochs, n_per_block))
+    n_groups = int(np.ceil(len(blocks) / float(n_jobs)))
+    for i in ProgressBar(range(n_groups), mesg="CSD epoch blocks"):
+        epoch_blocks = blocks[i * n_jobs : (i + 1) * n_jobs]
+        csds = parallel(my_csd(this_block, *params) for this_block in epoch_blocks)
 
         # Add CSD matrices in-place
         csds_mean += np.sum(csds, axis=0)
@@ -1384,14 +1406,38 @@ def _execute_csd_function(
     )
 
 
+def _sum_cross_spectra(x_mt):
+    """Sum cross-spectra over epochs and observations for all channel pairs.
+
+    Parameters
+    ----------
+    x_mt : ndarray, shape (n_epochs, n_channels, n_obs, n_freqs)
+        The spectra, where ``n_obs`` are e.g. the tapers or time points that
+        are summed over.
+
+    Returns
+    -------
+    csd : ndarray, shape ((n_channels**2 + n_channels) / 2 , n_freqs)
+        For each frequency, the upper triangle of
+        ``sum(x_mt[:, i] * x_mt[:, j].conj())``.
+    """
+    n_channels, n_freqs = x_mt.shape[1], x_mt.shape[3]
+    # (n_freqs, n_channels, n_epochs * n_obs) so that one GEMM per frequency
+    # gives the full cross-spectral matrix
+    x_mt = np.transpose(x_mt, (3, 1, 0, 2)).reshape(n_freqs, n_channels, -1)
+    csds = np.matmul(x_mt, x_mt.conj().swapaxes(-1, -2))
+    iu = np.triu_indices(n_channels)
+    return csds[:, iu[0], iu[1]].T
+
+
 def _csd_fourier(X, sfreq, n_times, freq_mask, n_fft):
     """Compute cross spectral density (CSD) using short-time fourier transform.
 
-    Computes the CSD for a single epoch of data.
+    Computes the CSD summed over a block of epochs.
 
     Parameters
     ----------
-    X : ndarray, shape (n_channels, n_times)
+    X : ndarray, shape (n_epochs, n_channels, n_times)
         The time series data consisting of n_channels time-series of length
         n_times.
     sfreq : float
@@ -1404,24 +1450,11 @@ def _csd_fourier(X, sfreq, n_times, freq_mask, n_fft):
         Length of the FFT.
     """
     x_mt, _ = _mt_spectra(X, np.hanning(n_times), sfreq, n_fft)
+    x_mt = x_mt[..., freq_mask]
 
-    # Hack so we can sum over axis=-2
-    weights = np.array([1.0])[:, np.newaxis, np.newaxis, np.newaxis]
-
-    x_mt = x_mt[:, :, freq_mask]
-
-    # Calculating CSD
-    # Tiling x_mt so that we can easily use _csd_from_mt()
-    x_mt = x_mt[:, np.newaxis, :, :]
-    x_mt = np.tile(x_mt, [1, x_mt.shape[0], 1, 1])
-    y_mt = np.transpose(x_mt, axes=[1, 0, 2, 3])
-    weights_y = np.transpose(weights, axes=[1, 0, 2, 3])
-    csds = _csd_from_mt(x_mt, y_mt, weights, weights_y)
-
-    # FIXME: don't compute full matrix in the first place
-    csds = np.array(
-        [_sym_mat_to_vector(csds[:, :, i]) for i in range(csds.shape[-1])]
-    ).T
+    # Same as _csd_from_mt() with a single taper of weight 1
+    csds = _sum_cross_spectra(x_mt)
+    csds *= 2
 
     # Scaling by number of samples and compensating for loss of power
     # due to windowing (see section 11.5.2 in Bendat & Piersol).
@@ -1437,35 +1470,33 @@ def _csd_fourier(X, sfreq, n_times, freq_mask, n_fft):
 def _csd_multitaper(
     X, sfreq, n_times, window_fun, eigvals, freq_mask, n_fft, adaptive, max_iter=250
 ):
-    """Compute cross spectral density (CSD) using multitaper module."""
+    """Compute cross spectral density (CSD) using multitaper module.
+
+    Computes the CSD summed over a block of epochs.
+    """
     x_mt, _ = _mt_spectra(X, window_fun, sfreq, n_fft)
 
     if adaptive:
         # Compute adaptive weights
         _, weights = _psd_from_mt_adaptive(
-            x_mt, eigvals, freq_mask, max_iter, return_weights=True
+            x_mt.reshape((-1,) + x_mt.shape[2:]),
+            eigvals,
+            freq_mask,
+            max_iter,
+            return_weights=True,
         )
-        # Tiling weights so that we can easily use _csd_from_mt()
-        weights = weights[:, np.newaxis, :, :]
-        weights = np.tile(weights, [1, x_mt.shape[0], 1, 1])
+        weights = weights.reshape(x_mt.shape[:3] + (-1,))
     else:
         # Do not use adaptive weights
-        weights = np.sqrt(eigvals)[np.newaxis, np.newaxis, :, np.newaxis]
+        weights = np.sqrt(eigvals)[:, np.newaxis]
 
-    x_mt = x_mt[:, :, freq_mask]
+    x_mt = x_mt[..., freq_mask]
 
-    # Calculating CSD
-    # Tiling x_mt so that we can easily use _csd_from_mt()
-    x_mt = x_mt[:, np.newaxis, :, :]
-    x_mt = np.tile(x_mt, [1, x_mt.shape[0], 1, 1])
-    y_mt = np.transpose(x_mt, axes=[1, 0, 2, 3])
-    weights_y = np.transpose(weights, axes=[1, 0, 2, 3])
-    csds = _csd_from_mt(x_mt, y_mt, weights, weights_y)
-
-    # FIXME: don't compute full matrix in the first place
-    csds = np.array(
-        [_sym_mat_to_vector(csds[:, :, i]) for i in range(csds.shape[-1])]
-    ).T
+    # Fold the weights and their normalization (see _csd_from_mt()) into the
+    # tapered spectra, so that the CSD becomes a plain sum over tapers
+    weights = weights / np.sqrt((weights * weights).sum(axis=-2, keepdims=True))
+    csds = _sum_cross_spectra(x_mt * weights)
+    csds *= 2
 
     # Scaling by sampling frequency for compatibility with Matlab
     csds /= sfreq
@@ -1476,11 +1507,11 @@ def _csd_multitaper(
 def _csd_morlet(data, sfreq, wavelets, nfft, tslice=None, use_fft=True, decim=1):
     """Compute cross spectral density (CSD) using the given Morlet wavelets.
 
-    Computes the CSD for a single epoch of data.
+    Computes the CSD summed over a block of epochs.
 
     Parameters
     ----------
-    data : ndarray, shape (n_channels, n_times)
+    data : ndarray, shape (n_epochs, n_channels, n_times)
         The time series data consisting of n_channels time-series of length
         n_times.
     sfreq : float
@@ -1515,7 +1546,15 @@ def _csd_morlet(data, sfreq, wavelets, nfft, tslice=None, use_fft=True, decim=1)
     _vector_to_sym_mat : For converting the CSD to a full matrix.
     """
     # Compute PSD
-    psds = _cwt_array(data, wavelets, nfft, mode="same", use_fft=use_fft, decim=decim)
+    n_epochs, n_channels = data.shape[:2]
+    psds = _cwt_array(
+        data.reshape(n_epochs * n_channels, -1),
+        wavelets,
+        nfft,
+        mode="same",
+        use_fft=use_fft,
+        decim=decim,
+    )
 
     if tslice is not None:
         tstart = None if tslice.start is None else tslice.start // decim
@@ -1523,14 +1562,12 @@ def _csd_morlet(data, sfreq, wavelets, nfft, tslice=None, use_fft=True, decim=1)
         tstep = None if tslice.step is None else tslice.step // decim
         tslice = slice(tstart, tstop, tstep)
         psds = psds[:, :, tslice]
+    psds = psds.reshape(n_epochs, n_channels, len(wavelets), -1)
 
-    psds_conj = np.conj(psds)
-
-    # Compute the spectral density between all pairs of series
-    n_channels = data.shape[0]
-    csds = np.vstack(
-        [np.mean(psds[[i]] * psds_conj[i:], axis=2) for i in range(n_channels)]
-    )
+    # Compute the spectral density between all pairs of series, averaged over
+    # time within each epoch
+    csds = _sum_cross_spectra(psds.swapaxes(-1, -2))
+    csds /= psds.shape[-1]
 
     # Scaling by sampling frequency for compatibility with Matlab
     csds /= sfreq
@@ -10,6 +10,7 @@ from scipy.signal import spectrogram
 
 from ..parallel import parallel_func
 from ..utils import _check_option, _ensure_int, logger, verbose
+from ..utils.misc import _pl
 from ..utils.numerics import _mask_to_onsets_offsets
 
 
@@ -270,3 +271,130 @@ def psd_array_welch(
         shape = shape + (-1,)
     psds.shape = shape
     return psds, freqs
+
+
+def _welch_block(data, func, freq_sl):
+    """Compute unaggregated Welch segments for one block of data."""
+    return func(data)[2][:, freq_sl]
+
+
+@verbose
+def _psd_welch_raw(
+    raw,
+    sfreq,
+    fmin=0,
+    fmax=np.inf,
+    n_fft=256,
+    n_overlap=0,
+    n_per_seg=None,
+    n_jobs=None,
+    average="mean",
+    window="hamming",
+    remove_dc=True,
+    *,
+    output="power",
+    picks,
+    start,
+    stop,
+    reject_by_annotation,
+    verbose=None,
+):
+    """Compute Welch's PSD by streaming segments from a (non-preloaded) Raw.
+
+    This mirrors :func:`psd_array_welch`, but reads blocks of whole Welch
+    segments with :meth:`mne.io.Raw.get_data` and aggregates them on the fly,
+    so only ``n_channels × n_freqs`` running sums are kept in memory.
+    """
+    from ..annotations import _annotations_starts_stops
+
+    _check_option("average", average, ("mean",))
+    _check_option("output", output, ("power",))
+    detrend = "constant" if remove_dc else False
+    n_fft = _ensure_int(n_fft, "n_fft")
+    n_overlap = _ensure_int(n_overlap, "n_overlap")
+    if n_per_seg is not None:
+        n_per_seg = _ensure_int(n_per_seg, "n_per_seg")
+    n_fft, n_per_seg, n_overlap = _check_nfft(stop - start, n_fft, n_per_seg, n_overlap)
+    win_size = n_fft / float(sfreq)
+    logger.info(f"Effective window size : {win_size:0.3f} (s)")
+    freqs = np.arange(n_fft // 2 + 1, dtype=float) * (sfreq / n_fft)
+    freq_mask = (freqs >= fmin) & (freqs <= fmax)
+    if not freq_mask.any():
+        raise ValueError(f"No frequencies found between fmin={fmin} and fmax={fmax}")
+    freq_sl = slice(*(np.where(freq_mask)[0][[0, -1]] + [0, 1]))
+    del freq_mask
+    freqs = freqs[freq_sl]
+
+    # Good spans (same logic as BaseRaw.get_data(..., reject_by_annotation="NaN"))
+    used = np.ones(stop - start, bool)
+    if reject_by_annotation:
+        onsets, ends = _annotations_starts_stops(raw, ["BAD"])
+        keep = (onsets < stop) & (ends > start)
+        for onset, end in zip(
+            np.maximum(onsets[keep], start), np.minimum(ends[keep], stop)
+        ):
+            used[onset - start : end - start] = False
+    if not used.any():
+        raise ValueError("All data were rejected by annotations, cannot compute PSD")
+    span_starts, span_stops = _mask_to_onsets_offsets(used)
+    span_starts, span_stops = span_starts + start, span_stops + start
+
+    step = n_per_seg - n_overlap
+    # read roughly 10 MB of data at a time (cf. _spect_func)
+    n_block = max(1, int(10e6 // (8 * len(picks) * step)))
+    logger.info(
+        f"Streaming {len(span_starts)} good data span"
+        f"{_pl(len(span_starts))} in blocks of up to {n_block} segments"
+    )
+    _func = partial(
+        spectrogram,
+        detrend=detrend,
+        noverlap=n_overlap,
+        nperseg=n_per_seg,
+        nfft=n_fft,
+        fs=sfreq,
+        window=window,
+        mode="psd",
+    )
+    parallel, my_block, n_jobs = parallel_func(_welch_block, n_jobs=n_jobs)
+
+    def _stream_span(span_start, span_stop):
+        n_span = span_stop - span_start
+        if n_span < n_per_seg:
+            # SciPy shortens the window to the span length; see psd_array_welch
+            data = raw.get_data(picks, span_start, span_stop)
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    action="ignore",
+                    module="scipy",
+                    category=UserWarning,
+                    message=r"nperseg = \d+ is greater than input length",
+                )
+                return _welch_block(data, _func, freq_sl)[..., 0]
+        n_seg = 1 + (n_span - n_per_seg) // step
+        agg = 0.0
+        for seg_start in range(0, n_seg, n_block):
+            n_this = min(n_block, n_seg - seg_start)
+            first = span_start + seg_start * step
+            data = raw.get_data(picks, first, first + (n_this - 1) * step + n_per_seg)
+            spect = np.concatenate(
+                parallel(
+                    my_block(d, _func, freq_sl)
+                    for d in np.array_split(data, n_jobs)
+                    if d.size != 0
+                ),
+                axis=0,
+            )
+            del data
+            assert spect.shape[-1] == n_this, (spect.shape, n_this)
+            agg = agg + spect.sum(axis=-1)
+        return agg / n_seg
+
+    psds = list()
+    weights = list()
+    for span_start, span_stop in zip(span_starts, span_stops):
+        psds.append(_stream_span(span_start, span_stop))
+        w = span_stop - span_start
+        weights.append(w if w < n_per_seg else w - ((w - n_overlap) % step))
+    psds = np.average(psds, axis=0, weights=weights)
+    return psds, freqs
@@ -46,7 +46,11 @@ from ..utils.check import (
     check_fname,
 )
 from ..utils.misc import _pl
-from ..utils.spectrum import _get_instance_type_string, _split_psd_kwargs
+from ..utils.spectrum import (
+    _get_instance_type_string,
+    _read_hdf5_lazy,
+    _split_psd_kwargs,
+)
 from ..viz.topo import _plot_timeseries, _plot_timeseries_unified, _plot_topo
 from ..viz.topomap import _make_head_outlines, _prepare_topomap_plot, plot_psds_topomap
 from ..viz.utils import (
@@ -58,7 +62,7 @@ from ..viz.utils import (
     plt_show,
 )
 from .multitaper import _psd_from_mt, psd_array_multitaper
-from .psd import _check_nfft, psd_array_welch
+from .psd import _check_nfft, _psd_welch_raw, psd_array_welch
 
 
 class SpectrumMixin:
@@ -1160,11 +1164,24 @@ class Spectrum(BaseSpectrum):
         # get just the data we want
         if isinstance(self.inst, BaseRaw):
             start, stop = np.where(self._time_mask)[0][[0, -1]]
-            rba = "NaN" if reject_by_annotation else None
-            data = self.inst.get_data(
-                self._picks, start, stop + 1, reject_by_annotation=rba
-            )
-            if np.any(np.isnan(data)) and method == "multitaper":
+            if _use_streaming_welch(self.inst, method, method_kw):
+                # aggregate Welch segments while reading instead of loading all data
+                self._psd_func = partial(
+                    _psd_welch_raw,
+                    remove_dc=remove_dc,
+                    picks=self._picks,
+                    start=start,
+                    stop=stop + 1,
+                    reject_by_annotation=reject_by_annotation,
+                    **method_kw,
+                )
+                data = self.inst
+            else:
+                rba = "NaN" if reject_by_annotation else None
+                data = self.inst.get_data(
+                    self._picks, start, stop + 1, reject_by_annotation=rba
+                )
+            if method == "multitaper" and np.any(np.isnan(data)):
                 raise NotImplementedError(
                     'Cannot use method="multitaper" when reject_by_annotation=True. '
                     'Please use method="welch" instead.'
@@ -1711,7 +1728,7 @@ def combine_spectrum(all_spectrum, weights="nave"):
     return spectrum
 
 
-def read_spectrum(fname):
+def read_spectrum(fname, *, preload=True):
     """Load a :class:`mne.time_frequency.Spectrum` object from disk.
 
     Parameters
@@ -1719,6 +1736,7 @@ def read_spectrum(fname):
     fname : path-like
         Path to a spectrum file in HDF5 format, which should end with ``.h5`` or
         ``.hdf5``.
+    %(preload_spectrum_tfr)s
 
     Returns
     -------
@@ -1731,9 +1749,13 @@ def read_spectrum(fname):
     """
     read_hdf5, _ = _import_h5io_funcs()
     _validate_type(fname, "path-like", "fname")
+    _validate_type(preload, bool, "preload")
     fname = _check_fname(fname=fname, overwrite="read", must_exist=False)
     # read it in
-    hdf5_dict = read_hdf5(fname, title="mnepython", slash="replace")
+    if preload:
+        hdf5_dict = read_hdf5(fname, title="mnepython", slash="replace")
+    else:
+        hdf5_dict = _read_hdf5_lazy(fname)
     defaults = dict(
         method=None,
         fmin=None,
@@ -1778,6 +1800,17 @@ def _compute_n_welch_segments(n_times, method_kw):
     return (n_times - n_overlap) // step
 
 
+def _use_streaming_welch(raw, method, method_kw):
+    """Check whether Welch segments can be aggregated while reading from disk."""
+    return (
+        method == "welch"
+        and not raw.preload
+        # a (bias-corrected) median needs all segment spectra at once
+        and method_kw.get("average", "mean") == "mean"
+        and method_kw.get("output", "power") == "power"
+    )
+
+
 def _validate_method(method, instance_type):
     """Convert 'auto' to a real method name, and validate."""
     if method == "auto":
@@ -27,7 +27,14 @@ from mne.time_frequency import (
     read_csd,
     tfr_morlet,
 )
-from mne.time_frequency.csd import _sym_mat_to_vector, _vector_to_sym_mat
+from mne.time_frequency.csd import (
+    _csd_fourier,
+    _csd_morlet,
+    _csd_multitaper,
+    _sum_cross_spectra,
+    _sym_mat_to_vector,
+    _vector_to_sym_mat,
+)
 from mne.utils import sum_squared
 
 base_dir = op.join(op.dirname(__file__), "..", "..", "io", "tests", "data")
@@ -500,6 +507,51 @@ def test_csd_fourier():
             assert abs(signal_power_per_sample - fourier_power_per_sample) < 0.001
 
 
+def test_sum_cross_spectra():
+    """Test the batched cross-spectrum accumulation."""
+    rng = np.random.RandomState(0)
+    x = rng.randn(3, 4, 5, 6) + 1j * rng.randn(3, 4, 5, 6)
+    want = np.sum(x[:, :, np.newaxis] * x[:, np.newaxis].conj(), axis=(0, 3))
+    want = np.array([_sym_mat_to_vector(want[..., ii]) for ii in range(6)]).T
+    assert_allclose(_sum_cross_spectra(x), want)
+
+
+@pytest.mark.parametrize("n_jobs", (1, 2))
+@pytest.mark.parametrize(
+    "func, kernel, n_spect",
+    [
+        (csd_array_fourier, _csd_fourier, 3 * 1 * 101),
+        (csd_array_multitaper, _csd_multitaper, 3 * 7 * 101),
+        (csd_array_morlet, _csd_morlet, 3 * 2 * 100),
+    ],
+)
+def test_csd_epoch_blocks(func, kernel, n_spect, n_jobs, monkeypatch):
+    """Test that the CSD does not depend on how epochs are blocked."""
+    X = np.random.RandomState(0).randn(7, 3, 200)
+    if func is csd_array_morlet:
+        kwargs = dict(sfreq=100.0, frequencies=[10.0, 20.0], decim=2)
+    else:
+        kwargs = dict(sfreq=100.0, fmin=5, fmax=30)
+    want = np.mean([func(x[np.newaxis], **kwargs)._data for x in X], axis=0)
+    got = func(X, n_jobs=n_jobs, **kwargs)._data
+    assert_allclose(got, want, rtol=1e-12)
+    # blocks of two epochs, bounded by the size of their spectra (n_spect
+    # elements per epoch, including tapers or time points)
+    block_sizes = list()
+
+    def _record_block(X, *args):
+        block_sizes.append(len(X))
+        return kernel(X, *args)
+
+    monkeypatch.setattr(f"mne.time_frequency.csd.{kernel.__name__}", _record_block)
+    monkeypatch.setattr(
+        "mne.time_frequency.csd._CSD_BLOCK_BYTES", 2 * (2 * 16 * n_spect)
+    )
+    got = func(X, **kwargs)._data
+    assert block_sizes == [2, 2, 2, 1]
+    assert_allclose(got, want, rtol=1e-12)
+
+
 def test_csd_multitaper():
     """Test computing cross-spectral density using multitapers."""
     epochs = _generate_coherence_data()
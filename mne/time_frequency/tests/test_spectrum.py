@@ -10,8 +10,14 @@ import pytest
 from matplotlib.colors import same_color
 from numpy.testing import assert_allclose, assert_array_equal
 
-from mne import Annotations, BaseEpochs, create_info, make_fixed_length_epochs
-from mne.io import RawArray
+from mne import (
+    Annotations,
+    BaseEpochs,
+    EpochsArray,
+    create_info,
+    make_fixed_length_epochs,
+)
+from mne.io import RawArray, read_raw_fif
 from mne.time_frequency import read_spectrum
 from mne.time_frequency.multitaper import _psd_from_mt
 from mne.time_frequency.spectrum import (
@@ -19,7 +25,7 @@ from mne.time_frequency.spectrum import (
     SpectrumArray,
     combine_spectrum,
 )
-from mne.utils import _record_warnings
+from mne.utils import _record_warnings, catch_logging
 
 
 def test_compute_psd_errors(raw):
@@ -185,6 +191,22 @@ def test_spectrum_io(inst, tmp_path, request, evoked):
     assert orig == loaded
 
 
+def test_spectrum_io_lazy(tmp_path):
+    """Test reading a spectrum without preloading."""
+    pytest.importorskip("h5io")
+    rng = np.random.default_rng(0)
+    epochs = EpochsArray(rng.random((6, 3, 200)), create_info(3, 100.0, "eeg"))
+    spectrum = epochs.compute_psd(method="welch", n_fft=64)
+    data = spectrum.get_data()
+    fname = tmp_path / "temp-spectrum.h5"
+    spectrum.save(fname)
+    lazy = read_spectrum(fname, preload=False)
+    assert isinstance(lazy.data, np.memmap)
+    assert_array_equal(lazy.get_data(picks=[1], fmax=10), data[:, [1], :7])
+    assert_allclose(lazy.average().get_data(), data.mean(axis=0))
+    assert_array_equal(lazy[2:4].get_data(), data[2:4])
+
+
 def test_spectrum_copy(raw_spectrum):
     """Test copying Spectrum objects."""
     spect_copy = raw_spectrum.copy()
@@ -262,6 +284,41 @@ def test_spectrum_reject_by_annot(raw):
     assert spect_no_annot != spect_reject_annot
 
 
+@pytest.mark.parametrize("average", ("mean", "median"))
+@pytest.mark.parametrize("reject_by_annotation", (True, False))
+def test_spectrum_streaming_welch(average, reject_by_annotation, tmp_path):
+    """Test Welch PSD streamed from a non-preloaded Raw."""
+    rng = np.random.default_rng(0)
+    info = create_info(4, 500.0, "eeg")
+    raw = RawArray(rng.standard_normal((4, 30000)) * 1e-6, info)
+    raw.set_annotations(Annotations([10, 21, 35], [5, 1.4, 0.1], ["bad"] * 3))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw = read_raw_fif(fname, preload=True)
+    raw_stream = read_raw_fif(fname, preload=False)
+    kw = dict(
+        average=average,
+        reject_by_annotation=reject_by_annotation,
+        n_fft=512,
+        n_overlap=128,
+        tmin=1,
+        fmax=100,
+    )
+    want = raw.compute_psd(**kw)
+    with catch_logging(verbose=True) as log:
+        got = raw_stream.compute_psd(**kw)
+        log = log.getvalue()
+    # the median needs all segment spectra, so only the mean is streamed
+    assert ("Streaming" in log) == (average == "mean")
+    assert not raw_stream.preload
+    assert_array_equal(got.freqs, want.freqs)
+    assert_allclose(got.get_data(), want.get_data(), rtol=1e-6)
+    # unaggregated output still goes through psd_array_welch
+    if not reject_by_annotation:
+        kw["average"] = None
+        assert raw_stream.compute_psd(**kw).get_data().ndim == 3
+
+
 def test_spectrum_bads_exclude(raw):
     """Test bads are not removed unless exclude="bads"."""
     raw.pick("mag")  # get rid of IAS channel
@@ -16,7 +16,7 @@ from scipy import fftpack
 
 from mne import Epochs, make_fixed_length_events, read_events
 from mne.io import read_raw_fif
-from mne.time_frequency import AverageTFR, tfr_array_stockwell
+from mne.time_frequency import AverageTFR, _stockwell, tfr_array_stockwell
 from mne.time_frequency._stockwell import (
     _check_input_st,
     _precompute_st_windows,
@@ -67,6 +67,40 @@ def test_stockwell_st_no_zero_pad():
     _st_power_itc(data, 10, True, 0, 1, W)
 
 
+@pytest.mark.parametrize("return_itc", (False, True))
+def test_stockwell_chunked(return_itc, monkeypatch):
+    """Test that chunking frequencies and epochs does not change the result."""
+    data = np.random.RandomState(0).randn(7, 2, 200)
+    kwargs = dict(sfreq=200.0, fmin=5, fmax=60, decim=2, return_itc=return_itc)
+    want = tfr_array_stockwell(data, **kwargs)
+    # 3 epochs and 5 frequencies per chunk
+    monkeypatch.setattr(_stockwell, "_ST_BLOCK_BYTES", 32 * 256 * 3)
+    # the windows of each chunk are computed once for all channels
+    n_calls = list()
+
+    def _count_windows(*args):
+        n_calls.append(args[1:3])
+        return _precompute_st_windows(*args)
+
+    monkeypatch.setattr(_stockwell, "_precompute_st_windows", _count_windows)
+    got = tfr_array_stockwell(data, **kwargs)
+    assert len(n_calls) == len(set(n_calls)) == 12
+    for w, g in zip(want, got):
+        if w is None:
+            assert g is None
+        else:
+            assert_allclose(g, w, rtol=1e-12)
+    # with few enough chunks, the windows are reused by later calls
+    monkeypatch.setattr(_stockwell, "_ST_BLOCK_BYTES", 32 * 256 * 15)
+    _stockwell._precompute_st_windows_cached.cache_clear()
+    n_calls.clear()
+    got = tfr_array_stockwell(data, **kwargs)
+    assert len(n_calls) == 3
+    assert_allclose(tfr_array_stockwell(data, **kwargs)[0], got[0])
+    assert len(n_calls) == 3
+    assert_allclose(got[0], want[0], rtol=1e-12)
+
+
 def test_stockwell_core():
     """Test stockwell transform."""
     # adapted from
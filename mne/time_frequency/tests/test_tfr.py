@@ -793,6 +793,73 @@ def test_equalize_epochs_tfr_counts(epochs_tfr):
     assert epochs_tfr.shape == tfr2.shape
 
 
+def test_tfr_io_lazy(tmp_path):
+    """Test reading TFRs without preloading."""
+    pytest.importorskip("h5io")
+    rng = np.random.default_rng(0)
+    info = create_info(4, 100.0, "eeg")
+    data = rng.standard_normal((5, 4, 3, 50)) + 1j * rng.standard_normal((5, 4, 3, 50))
+    tfr = EpochsTFRArray(info, data, np.arange(50) / 100.0, np.array([5, 10, 20.0]))
+    fname = tmp_path / "temp_tfr.hdf5"
+    tfr.save(fname)
+    lazy = read_tfrs(fname, preload=False)
+    assert isinstance(lazy.data, np.memmap)
+    assert_array_equal(
+        lazy.get_data(picks=[1, 3], fmin=8, tmax=0.2),
+        tfr.get_data(picks=[1, 3], fmin=8, tmax=0.2),
+    )
+    lazy.pick([0, 2]).crop(tmin=0.1, fmax=12)
+    assert_array_equal(lazy.data, tfr.copy().pick([0, 2]).crop(tmin=0.1, fmax=12).data)
+    # in-place operations are copy-on-write
+    lazy = read_tfrs(fname, preload=False)
+    lazy.apply_baseline((None, 0.1), mode="zscore", verbose=False)
+    assert_array_equal(read_tfrs(fname).data, data)
+    # multiple TFRs
+    avg = tfr.average()
+    write_tfrs(fname, [avg, avg.copy()], overwrite=True)
+    avgs = read_tfrs(fname, preload=False)
+    assert len(avgs) == 2
+    assert isinstance(avgs[1].data, np.memmap)
+    assert_array_equal(avgs[1].data, avg.data)
+    with pytest.raises(TypeError, match="preload must be"):
+        read_tfrs(fname, preload="yes")
+
+
+@pytest.mark.parametrize("method", ("morlet", "multitaper"))
+def test_raw_compute_tfr_out_fname(method, tmp_path, monkeypatch):
+    """Test streaming a RawTFR to disk."""
+    pytest.importorskip("h5io")
+    rng = np.random.default_rng(0)
+    info = create_info(3, 100.0, "eeg")
+    raw = mne.io.RawArray(rng.standard_normal((3, 2000)), info, verbose=False)
+    raw.save(tmp_path / "test_raw.fif")
+    raw = read_raw_fif(tmp_path / "test_raw.fif", verbose=False)
+    monkeypatch.setattr(mne.time_frequency.tfr, "_TFR_BLOCK_BYTES", 20e3)
+    kw = dict(method=method, freqs=[5.0, 10.0, 20.0], n_cycles=3, decim=3)
+    fname = tmp_path / "test-tfr.h5"
+    with catch_logging() as log:
+        tfr = raw.compute_tfr(out_fname=fname, verbose=True, **kw)
+    assert "chunks of up to 138 samples" in log.getvalue()
+    assert isinstance(tfr, RawTFR)
+    assert isinstance(tfr.data, np.memmap)
+    want = raw.compute_tfr(**kw)
+    assert_allclose(tfr.times, want.times)
+    assert tfr.sfreq == want.sfreq
+    assert_allclose(tfr.data, want.data, rtol=1e-7)
+    with pytest.raises(FileExistsError, match="Destination file exists"):
+        raw.compute_tfr(out_fname=fname, **kw)
+    # bad segments are NaN, good spans are transformed separately
+    raw.set_annotations(mne.Annotations([10.0], [2.0], "bad"))
+    tfr = raw.compute_tfr(out_fname=fname, overwrite=True, **kw)
+    bad = (tfr.times >= 10.0) & (tfr.times < 12.0)
+    assert np.isnan(tfr.data[..., bad]).all()
+    assert not np.isnan(tfr.data[..., ~bad]).any()
+    want = raw.copy().crop(12.0).compute_tfr(**kw)
+    assert_allclose(tfr.data[..., tfr.times >= 12.0], want.data, rtol=1e-7)
+    with pytest.raises(ValueError, match='requires output="power"'):
+        raw.compute_tfr(out_fname=fname, output="complex", overwrite=True, **kw)
+
+
 def test_dB_computation():
     """Test dB computation in plot methods (gh 11091)."""
     ampl = 2.0
@@ -59,7 +59,7 @@ from ..utils import (
     verbose,
     warn,
 )
-from ..utils.spectrum import _get_instance_type_string
+from ..utils.spectrum import _get_instance_type_string, _read_hdf5_lazy
 from ..viz.topo import _imshow_tfr, _imshow_tfr_unified, _plot_topo
 from ..viz.topomap import (
     _add_colorbar,
@@ -3912,6 +3912,158 @@ class RawTFRArray(RawTFR):
         self.__setstate__(state)
 
 
+# approximate size (in bytes) of the TFR computed at once when streaming to disk
+_TFR_BLOCK_BYTES = 100e6
+
+
+@verbose
+def _stream_raw_tfr(
+    raw,
+    method,
+    freqs,
+    out_fname,
+    *,
+    tmin,
+    tmax,
+    picks,
+    proj,
+    reject_by_annotation,
+    decim,
+    overwrite,
+    n_jobs,
+    verbose=None,
+    **method_kw,
+):
+    """Compute a RawTFR chunk by chunk, writing the power directly to disk.
+
+    Each good data span is processed in chunks that are padded on both sides by the
+    length of the longest wavelet (so that the result matches a transform of the
+    whole span), and the decimated power of each chunk is written into the HDF5
+    container at ``out_fname``, which is returned memory-mapped.
+    """
+    from ..annotations import _annotations_starts_stops
+    from ..utils import _soft_import
+    from ..utils.numerics import _mask_to_onsets_offsets
+
+    _, write_hdf5 = _import_h5io_funcs()
+    h5py = _soft_import("h5py", "HDF5-based I/O")
+    method = _check_option("method", method, ("morlet", "multitaper"))
+    output = method_kw.pop("output", "power")
+    if output != "power":
+        raise ValueError(
+            f'Computing a TFR with out_fname requires output="power", got {output!r}.'
+        )
+    tfr_funcs = dict(morlet=tfr_array_morlet, multitaper=tfr_array_multitaper)
+    _check_method_kwargs(tfr_funcs[method], method_kw, msg=f'TFR method "{method}"')
+    check_fname(out_fname, "time-frequency object", (".h5", ".hdf5"))
+    out_fname = _check_fname(out_fname, overwrite=overwrite)
+    if proj:
+        raw = raw.copy().apply_proj()
+    freqs = np.asarray(freqs, dtype=np.float64)
+    tfr_func = partial(tfr_funcs[method], freqs=freqs, output="power", **method_kw)
+    sfreq = raw.info["sfreq"]
+    picks = _picks_to_idx(raw.info, picks, "data", with_ref_meg=False)
+    time_mask = _time_mask(raw.times, tmin, tmax, sfreq=sfreq)
+    start, stop = np.where(time_mask)[0][[0, -1]]
+    stop += 1
+    # output samples, as for tfr[..., decim] of the transform of raw[:, start:stop]
+    keep = range(start, stop)[_ensure_slice(decim)]
+    if keep.step < 0 or len(keep) == 0:
+        raise ValueError(f"decim={decim} does not select any (increasing) samples.")
+    # edge padding needed for the chunks to be independent of each other
+    n_cycles = method_kw.get("n_cycles", 7.0)
+    if method == "morlet":
+        Ws = [morlet(sfreq, freqs, n_cycles=n_cycles)]
+    else:
+        Ws = _make_dpss(
+            sfreq,
+            freqs,
+            n_cycles=n_cycles,
+            time_bandwidth=method_kw.get("time_bandwidth", 4.0),
+        )
+    n_pad = max(len(W) for Ws_ in Ws for W in Ws_)
+    n_chunk = max(int(_TFR_BLOCK_BYTES // (16 * len(picks) * len(freqs))), n_pad)
+
+    # good spans (same logic as BaseRaw.get_data(..., reject_by_annotation="NaN"))
+    used = np.ones(stop - start, bool)
+    if reject_by_annotation:
+        onsets, ends = _annotations_starts_stops(raw, ["BAD"])
+        overlap = (onsets < stop) & (ends > start)
+        for onset, end in zip(
+            np.maximum(onsets[overlap], start), np.minimum(ends[overlap], stop)
+        ):
+            used[onset - start : end - start] = False
+    span_starts, span_stops = _mask_to_onsets_offsets(used)
+    del used
+    span_starts, span_stops = span_starts + start, span_stops + start
+    too_short = span_stops - span_starts < n_pad
+    if too_short.all():
+        raise ValueError(
+            "No good data span is at least as long as the longest wavelet "
+            f"({n_pad} samples), cannot compute TFR."
+        )
+    if too_short.any():
+        warn(
+            f"{too_short.sum()} good data span{_pl(too_short.sum())} shorter than "
+            f"the longest wavelet ({n_pad} samples) will be represented with NaN."
+        )
+    span_starts, span_stops = span_starts[~too_short], span_stops[~too_short]
+
+    # write everything but the data, then add the (NaN-filled) data array
+    info = pick_info(raw.info, picks, copy=True)
+    with info._unlock():
+        info["sfreq"] = sfreq / keep.step
+    state = dict(
+        method=method,
+        sfreq=info["sfreq"],
+        dims=("channel", "freq", "time"),
+        freqs=freqs,
+        times=raw.times[keep.start : keep.stop : keep.step],
+        inst_type_str="Raw",
+        data_type="Power Estimates",
+        info=info,
+        baseline=None,
+        decim=1,
+        weights=None,
+    )
+    write_hdf5(
+        out_fname, state, overwrite=overwrite, title="mnepython", slash="replace"
+    )
+    logger.info(
+        f"Streaming TFR of {len(span_starts)} good data span{_pl(len(span_starts))} "
+        f"in chunks of up to {n_chunk} samples to {out_fname}"
+    )
+    with h5py.File(out_fname, mode="a") as fid:
+        dset = fid["mnepython"].create_dataset(
+            "key_data",
+            shape=(len(picks), len(freqs), len(keep)),
+            dtype=np.float64,
+            fillvalue=np.nan,
+        )
+        dset.attrs["TITLE"] = "ndarray"
+        for span_start, span_stop in zip(span_starts, span_stops):
+            for chunk_start in range(span_start, span_stop, n_chunk):
+                chunk_stop = min(chunk_start + n_chunk, span_stop, keep.stop)
+                # first output sample at or after chunk_start
+                first = keep.start + max(
+                    -(-(chunk_start - keep.start) // keep.step) * keep.step, 0
+                )
+                if first >= chunk_stop:
+                    continue
+                read_start = max(chunk_start - n_pad, span_start)
+                read_stop = min(chunk_stop + n_pad, span_stop)
+                data = raw.get_data(picks, read_start, read_stop)
+                power = tfr_func(
+                    data[np.newaxis],
+                    sfreq,
+                    decim=slice(first - read_start, chunk_stop - read_start, keep.step),
+                    n_jobs=n_jobs,
+                )[0]
+                out_start = (first - keep.start) // keep.step
+                dset[..., out_start : out_start + power.shape[-1]] = power
+    return read_tfrs(out_fname, preload=False)
+
+
 def combine_tfr(all_tfr, weights="nave"):
     """Merge AverageTFR data by weighted addition.
 
@@ -4071,7 +4223,7 @@ def write_tfrs(fname, tfr, overwrite=False, *, verbose=None):
 
 
 @verbose
-def read_tfrs(fname, condition=None, *, verbose=None):
+def read_tfrs(fname, condition=None, *, preload=True, verbose=None):
     """Load a TFR object from disk.
 
     Parameters
@@ -4082,6 +4234,7 @@ def read_tfrs(fname, condition=None, *, verbose=None):
     condition : int or str | list of int or str | None
         The condition to load. If ``None``, all conditions will be returned.
         Defaults to ``None``.
+    %(preload_spectrum_tfr)s
     %(verbose)s
 
     Returns
@@ -4106,8 +4259,12 @@ def read_tfrs(fname, condition=None, *, verbose=None):
         f"{sep}tfr.{ext}" for sep in ("-", "_") for ext in ("h5", "hdf5")
     )
     check_fname(fname, "tfr", valid_fnames)
+    _validate_type(preload, bool, "preload")
     logger.info(f"Reading {fname} ...")
-    hdf5_dict = read_hdf5(fname, title="mnepython", slash="replace")
+    if preload:
+        hdf5_dict = read_hdf5(fname, title="mnepython", slash="replace")
+    else:
+        hdf5_dict = _read_hdf5_lazy(fname)
     # single TFR from TFR.save()
     if "inst_type_str" in hdf5_dict:
         if "epoch" in hdf5_dict["dims"]:
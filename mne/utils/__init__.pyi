@@ -24,6 +24,7 @@ __all__ = [
     "_check_all_same_channel_names",
     "_check_ch_locs",
     "_check_channels_spatial_filter",
+    "_check_chunk_duration",
     "_check_combine",
     "_check_compensation_grade",
     "_check_decim",
@@ -225,6 +226,7 @@ from .check import (
     _check_all_same_channel_names,
     _check_ch_locs,
     _check_channels_spatial_filter,
+    _check_chunk_duration,
     _check_combine,
     _check_compensation_grade,
     _check_depth,
@@ -37,6 +37,21 @@ def _ensure_int(x, name="unknown", must_be="an int", *, extra=""):
     return x
 
 
+def _check_chunk_duration(chunk_duration, sfreq):
+    """Validate a chunk_duration and convert it to a number of samples.
+
+    Returns None if ``chunk_duration`` is None.
+    """
+    _validate_type(chunk_duration, ("numeric", None), "chunk_duration")
+    if chunk_duration is None:
+        return None
+    if chunk_duration <= 0:
+        raise ValueError(
+            f"Argument 'chunk_duration' should be positive, got {chunk_duration}."
+        )
+    return max(int(np.round(chunk_duration * sfreq)), 1)
+
+
 def _check_integer_or_list(arg, name):
     """Validate arguments that should be an integer or a list.
 
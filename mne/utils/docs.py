@@ -3572,6 +3572,16 @@ preload : bool or str (default False)
     file name of a memory-mapped file which is used to store the data
     on the hard drive (slower, requires less memory)."""
 
+docdict["preload_spectrum_tfr"] = """
+preload : bool
+    If ``True`` (default), the data are loaded into memory. If ``False``, the
+    data are memory-mapped (copy-on-write) from the file, so that only the parts
+    that are accessed, e.g. by ``crop()``, ``pick()`` or ``get_data()``, are
+    read from disk. In-place modifications never change the file on disk.
+
+    .. versionadded:: 1.11
+"""
+
 docdict["preload_concatenate"] = """
 preload : bool, str, or None (default None)
     Preload data into memory for data manipulation and faster indexing.
@@ -10,6 +10,7 @@ import operator
 import os
 import shutil
 import sys
+import threading
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
 from io import BytesIO, StringIO
@@ -875,12 +876,73 @@ class _PCA:
     def fit(self, X):
         self._fit(X)
 
-    def _fit(self, X):
+    def partial_fit(self, X):
+        """Update the fit with a chunk of samples without keeping them.
+
+        Only the moments are accumulated here, the decomposition is computed
+        once when a fitted attribute is first accessed.
+        """
+        n_samples, n_features = X.shape
+        if not hasattr(self, "_sum"):
+            self._n_seen = 0
+            self._sum = np.zeros(n_features)
+            self._sum_sq = np.zeros((n_features, n_features))
+        self._n_seen += n_samples
+        self._sum += X.sum(axis=0)
+        self._sum_sq += X.T @ X
+        for key in self._fitted_attrs:  # invalidate a previous decomposition
+            self.__dict__.pop(key, None)
+        return self
+
+    _fitted_attrs = (
+        "mean_",
+        "noise_variance_",
+        "n_samples_",
+        "n_features_",
+        "components_",
+        "n_components_",
+        "explained_variance_",
+        "explained_variance_ratio_",
+        "singular_values_",
+    )
+
+    def __getattr__(self, name):
+        # only called for missing attributes
+        if name in self._fitted_attrs and "_sum" in self.__dict__:
+            self._fit_moments()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def _fit_moments(self):
+        """Decompose the covariance accumulated by partial_fit."""
+        n_samples, n_features = self._n_seen, len(self._sum)
+        n_components = self._check_n_components(n_samples, n_features)
+        self.mean_ = self._sum / n_samples
+        cov = self._sum_sq - n_samples * np.outer(self.mean_, self.mean_)
+        cov /= n_samples - 1
+        explained_variance_, V = np.linalg.eigh(cov)
+        # rank-deficient directions can come out slightly negative
+        explained_variance_ = np.abs(explained_variance_[::-1])
+        V = V[:, ::-1].T
+        # flip eigenvectors' sign to enforce deterministic output (U is unknown)
+        V *= np.sign(V[np.arange(len(V)), np.argmax(np.abs(V), axis=1)])[:, None]
+        singular_values_ = np.sqrt(explained_variance_ * (n_samples - 1))
+        self._set_components(
+            explained_variance_,
+            singular_values_,
+            V,
+            n_samples,
+            n_features,
+            n_components,
+        )
+
+    def _check_n_components(self, n_samples, n_features):
         if self.n_components is None:
-            n_components = min(X.shape)
+            n_components = min(n_samples, n_features)
         else:
             n_components = self.n_components
-        n_samples, n_features = X.shape
 
         if n_components == "mle":
             if n_samples < n_features:
@@ -900,6 +962,11 @@ class _PCA:
                     f"when greater than or equal to 1, "
                     f"was of type={repr(type(n_components))}"
                 )
+        return n_components
+
+    def _fit(self, X):
+        n_samples, n_features = X.shape
+        n_components = self._check_n_components(n_samples, n_features)
 
         self.mean_ = np.mean(X, axis=0)
         X -= self.mean_
@@ -908,13 +975,30 @@ class _PCA:
         # flip eigenvectors' sign to enforce deterministic output
         U, V = svd_flip(U, V)
 
-        components_ = V
-
         # Get variance explained by singular values
         explained_variance_ = (S**2) / (n_samples - 1)
+        singular_values_ = S.copy()  # Store the singular values.
+        self._set_components(
+            explained_variance_,
+            singular_values_,
+            V,
+            n_samples,
+            n_features,
+            n_components,
+        )
+        return U, S, V
+
+    def _set_components(
+        self,
+        explained_variance_,
+        singular_values_,
+        components_,
+        n_samples,
+        n_features,
+        n_components,
+    ):
         total_var = explained_variance_.sum()
         explained_variance_ratio_ = explained_variance_ / total_var
-        singular_values_ = S.copy()  # Store the singular values.
 
         # Postprocess the number of components required
         if n_components == "mle":
@@ -939,8 +1023,6 @@ class _PCA:
         self.explained_variance_ratio_ = explained_variance_ratio_[:n_components]
         self.singular_values_ = singular_values_[:n_components]
 
-        return U, S, V
-
 
 def _mask_to_onsets_offsets(mask):
     """Group boolean mask into contiguous onset:offset pairs."""
@@ -1092,6 +1174,8 @@ else:  # pragma: no cover
 
 _LRU_CACHES = dict()
 _LRU_CACHE_MAXSIZES = dict()
+_LRU_CACHE_LOCK = threading.Lock()
+_LRU_CACHE_MISS = object()
 
 
 def _custom_lru_cache(maxsize):
@@ -1102,15 +1186,17 @@ def _custom_lru_cache(maxsize):
 
         def cache_fun(*args):
             hash_ = object_hash(args)
-            if hash_ in this_cache:
-                this_val = this_cache.pop(hash_)
-            else:
+            # the bookkeeping must be thread-safe, but not the (slow) function
+            with _LRU_CACHE_LOCK:
+                this_val = this_cache.pop(hash_, _LRU_CACHE_MISS)
+            if this_val is _LRU_CACHE_MISS:
                 this_val = fun(*args)
-            this_cache[hash_] = this_val  # (re)insert in last pos
-            while len(this_cache) > _LRU_CACHE_MAXSIZES[fun_hash]:
-                for key in this_cache:  # just an easy way to get first element
-                    this_cache.pop(key)
-                    break  # first in, first out
+            with _LRU_CACHE_LOCK:
+                this_cache[hash_] = this_val  # (re)insert in last pos
+                while len(this_cache) > _LRU_CACHE_MAXSIZES[fun_hash]:
+                    for key in this_cache:  # just an easy way to get first element
+                        this_cache.pop(key)
+                        break  # first in, first out
             return this_val
 
         return cache_fun
@@ -6,7 +6,7 @@
 
 from inspect import currentframe, getargvalues, signature
 
-from ..utils import warn
+from ..utils import _import_h5io_funcs, _soft_import, warn
 
 
 def _get_instance_type_string(inst):
@@ -102,3 +102,49 @@ def _split_psd_kwargs(*, plot_fun=None, kwargs=None):
     for k in plot_kwargs:
         del kwargs[k]
     return kwargs, plot_kwargs
+
+
+def _read_hdf5_lazy(fname, *, title="mnepython", slash="replace"):
+    """Read an HDF5 file like ``read_hdf5``, but memory-map the ``data`` arrays.
+
+    Dicts containing a ``"data"`` entry (as written by ``Spectrum.save``,
+    ``BaseTFR.save`` and ``write_tfrs``) get a copy-on-write :class:`numpy.memmap`
+    instead of an in-memory array, so that only the parts that are accessed are
+    read from disk. Datasets that cannot be memory-mapped (e.g., compressed or
+    chunked ones) are read into memory.
+    """
+    from numpy import memmap
+
+    read_hdf5, _ = _import_h5io_funcs()
+    h5py = _soft_import("h5py", "HDF5-based I/O")
+
+    def _memmap(node, path):
+        offset = node.id.get_offset()
+        if node.chunks is not None or offset is None or node.size == 0:
+            return read_hdf5(fid, title=path, slash=slash)
+        return memmap(
+            fname, dtype=node.dtype, mode="c", offset=offset, shape=node.shape
+        )
+
+    def _read(path):
+        node = fid[path]
+        kind = node.attrs["TITLE"]
+        kind = kind.decode() if isinstance(kind, bytes) else kind
+        if kind in ("list", "tuple"):
+            out = [_read(f"{path}/idx_{ii}") for ii in range(len(node))]
+            return tuple(out) if kind == "tuple" else out
+        if kind == "dict" and isinstance(node.get("key_data"), h5py.Dataset):
+            out = dict()
+            for name in node:
+                key = name[len("key_") :]
+                if key == "data":
+                    out[key] = _memmap(node[name], f"{path}/{name}")
+                else:
+                    out[key] = read_hdf5(fid, title=f"{path}/{name}", slash=slash)
+            return out
+        return read_hdf5(fid, title=path, slash=slash)
+
+    with h5py.File(fname, mode="r") as fid:
+        if title not in fid:
+            raise ValueError(f'no "{title}" data found')
+        return _read(title)
@@ -475,6 +475,21 @@ def test_pca(n_components, whiten):
         assert n_components is None
         assert pca_mne.n_components_ == n_dim
 
+    # accumulating chunks gives the same decomposition
+    pca_part = _PCA(n_components, whiten=whiten)
+    for X_chunk in np.array_split(X, 7):
+        pca_part.partial_fit(X_chunk)
+        assert "components_" not in vars(pca_part)  # decomposed only when needed
+    assert_array_equal(X, X_orig)
+    assert pca_part.n_components_ == pca_mne.n_components_
+    assert pca_part.n_samples_ == n_samples
+    for key in ("mean_", "explained_variance_", "explained_variance_ratio_"):
+        val_part, val_mne = getattr(pca_part, key), getattr(pca_mne, key)
+        assert_allclose(val_part, val_mne, atol=1e-12, err_msg=key)
+    assert_allclose(
+        np.abs(np.sum(pca_part.components_ * pca_mne.components_, axis=1))[:-1], 1.0
+    )
+
 
 def test_array_equal_nan():
     """Test comparing arrays with NaNs."""